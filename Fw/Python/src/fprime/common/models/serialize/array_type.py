@@ -4,10 +4,12 @@ Created on May 29, 2020
 @author: jishii
 """
 import copy
+import struct
 
 from .type_base import ValueType
 from .type_exceptions import (
     ArrayLengthException,
+    DeserializeException,
     NotInitializedException,
     TypeMismatchException,
 )
@@ -94,8 +96,33 @@ class ArrayType(ValueType):
             raise NotInitializedException(type(self))
         return b"".join([item.serialize() for item in self.val])
 
+    def get_fixed_format(self):
+        """ Arrays have a fixed layout when their member type does, repeated once per element """
+        member_format = self.arr_type.get_fixed_format()
+        if member_format is None:
+            return None
+        return member_format * self.arr_size
+
+    def load_unpacked(self, values):
+        """ Sets the members of the array from the unpacked values, member by member """
+        items = []
+        for _ in range(self.arr_size):
+            item = copy.copy(self.arr_type)
+            item.load_unpacked(values)
+            items.append(item)
+        self.__val = items
+
     def deserialize(self, data, offset):
         """ Deserialize the members of the array """
+        codec = self.get_codec()
+        # Fixed layouts are decoded by a single unpack of the compiled codec
+        if codec is not None:
+            try:
+                unpacked = codec.unpack_from(data, offset)
+            except struct.error as err:
+                raise DeserializeException(str(err))
+            self.load_unpacked(iter(unpacked))
+            return
         values = []
         for i in range(self.__arr_size):
             item = copy.deepcopy(self.arr_type)
@@ -4,7 +4,7 @@ Created on Dec 18, 2014
 """
 import struct
 
-from .type_base import ValueType
+from .type_base import ValueType, get_struct
 from .type_exceptions import (
     DeserializeException,
     NotInitializedException,
@@ -27,21 +27,29 @@ class BoolType(ValueType):
         if not isinstance(val, bool):
             raise TypeMismatchException(bool, type(val))
 
+    def get_fixed_format(self):
+        """ Booleans are stored as a single U8 """
+        return "B"
+
+    def load_unpacked(self, values):
+        """ Sets the boolean from the next unpacked U8 value """
+        int_val = next(values)
+        if int_val not in [self.TRUE, self.FALSE]:
+            raise TypeRangeException(int_val)
+        self.val = int_val == self.TRUE
+
     def serialize(self):
         """ Serialize a boolean value """
         if self.val is None:
             raise NotInitializedException(type(self))
-        return struct.pack("B", 0xFF if self.val else 0x00)
+        return self.get_codec().pack(self.TRUE if self.val else self.FALSE)
 
     def deserialize(self, data, offset):
         """ Deserialize boolean value """
         try:
-            int_val = struct.unpack_from("B", data, offset)[0]
-            if int_val not in [self.TRUE, self.FALSE]:
-                raise TypeRangeException(int_val)
-            self.val = int_val == self.TRUE
+            self.load_unpacked(iter(self.get_codec().unpack_from(data, offset)))
         except struct.error:
             raise DeserializeException("Not enough bytes to deserialize bool.")
 
     def getSize(self):
-        return struct.calcsize("B")
+        return get_struct(self.get_fixed_format()).size
@@ -4,7 +4,7 @@ Created on Dec 18, 2014
 """
 import struct
 
-from .type_base import ValueType
+from .type_base import ValueType, get_struct
 from .type_exceptions import (
     DeserializeException,
     EnumMismatchException,
@@ -40,6 +40,11 @@ class EnumType(ValueType):
             enum_dict = {"UNDEFINED": 0}
         # Check if the enum dict is an instance of dictionary
         self.__enum_dict = enum_dict
+        # Reverse lookup of integer representation to value, first declared member wins on duplicates
+        self.__reverse_dict = {}
+        if isinstance(enum_dict, dict):
+            for key, int_val in enum_dict.items():
+                self.__reverse_dict.setdefault(int_val, key)
         # Set val to undefined if not set
         if val is None:
             val = "UNDEFINED"
@@ -69,6 +74,19 @@ class EnumType(ValueType):
     def enum_dict(self):
         return self.__enum_dict
 
+    def get_fixed_format(self):
+        """ Enumerations are stored as a signed 32-bit integer """
+        return "i"
+
+    def load_unpacked(self, values):
+        """ Sets the enumeration value from the next unpacked integer """
+        int_val = next(values)
+        try:
+            self.val = self.__reverse_dict[int_val]
+        # Value not found, invalid enumeration value
+        except KeyError:
+            raise TypeRangeException(int_val)
+
     def serialize(self):
         """
         Serialize the enumeration type using an int type
@@ -77,28 +95,22 @@ class EnumType(ValueType):
         # the numeric equivalent
         if self.val is None:
             raise NotInitializedException(type(self))
-        return struct.pack(">i", self.enum_dict()[self.val])
+        return self.get_codec().pack(self.enum_dict()[self.val])
 
     def deserialize(self, data, offset):
         """
         Deserialize the enumeration using an int type
         """
         try:
-            int_val = struct.unpack_from(">i", data, offset)[0]
-        except:
+            unpacked = self.get_codec().unpack_from(data, offset)
+        except struct.error:
             raise DeserializeException(
                 "Could not deserialize enum value. Needed: {} bytes Found: {}".format(
                     self.getSize(), len(data[offset:])
                 )
             )
-        for key, val in self.enum_dict().items():
-            if int_val == val:
-                self.val = key
-                break
-        # Value not found, invalid enumeration value
-        else:
-            raise TypeRangeException(int_val)
+        self.load_unpacked(iter(unpacked))
 
     def getSize(self):
         """ Calculates the size based on the size of an integer used to store it """
-        return struct.calcsize(">i")
+        return get_struct(self.get_fixed_format()).size
@@ -7,10 +7,11 @@ that map to stdint.h integer sizes, that is, 8-bit, 16-bit, 32-bit, and 64-bit s
 @author mstarch
 """
 import abc
+import functools
 import re
 import struct
 
-from .type_base import ValueType
+from .type_base import ValueType, get_struct
 from .type_exceptions import (
     DeserializeException,
     NotInitializedException,
@@ -25,6 +26,7 @@ class NumericalType(ValueType, abc.ABC):
     """ Numerical types that can be serialized using struct and are of some power of 2 byte width """
 
     @classmethod
+    @functools.lru_cache(maxsize=None)
     def get_bits(cls):
         """ Gets the integer bits of a given type """
         match = BITS_RE.match(cls.__name__)
@@ -37,24 +39,39 @@ class NumericalType(ValueType, abc.ABC):
 
     @classmethod
     def getSize(cls):
-        """ Gets the size of the integer based on the size specified in the class name """
-        return int(cls.get_bits() / 8)
+        """ Gets the size of the integer based on the size of its compiled codec """
+        return cls.get_codec().size
 
     @staticmethod
     @abc.abstractmethod
     def get_serialize_format():
         """ Gets the format serialization string such that the class can be serialized via struct """
 
+    @classmethod
+    def get_fixed_format(cls):
+        """ Gets the struct format character of this type without the byte order prefix """
+        return cls.get_serialize_format().lstrip(">")
+
+    @classmethod
+    @functools.lru_cache(maxsize=None)
+    def get_codec(cls):
+        """ Gets the compiled struct codec of this type, compiled once per class """
+        return get_struct(cls.get_fixed_format())
+
+    def load_unpacked(self, values):
+        """ Sets the val property from the next unpacked value """
+        self.val = next(values)
+
     def serialize(self):
         """ Serializes this type using struct and the val property """
         if self.val is None:
             raise NotInitializedException(type(self))
-        return struct.pack(self.get_serialize_format(), self.val)
+        return self.get_codec().pack(self.val)
 
     def deserialize(self, data, offset):
         """ Serializes this type using struct and the val property """
         try:
-            self.val = struct.unpack_from(self.get_serialize_format(), data, offset)[0]
+            self.val = self.get_codec().unpack_from(data, offset)[0]
         except struct.error as err:
             raise DeserializeException(str(err))
 
@@ -62,14 +79,19 @@ class NumericalType(ValueType, abc.ABC):
 class IntegerType(NumericalType, abc.ABC):
     """ Base class thar represents all integer common functions """
 
+    @classmethod
+    @functools.lru_cache(maxsize=None)
+    def get_range(cls):
+        """ Gets the (inclusive minimum, exclusive maximum) range of the given integer type """
+        max_val = 1 << (cls.get_bits() - (1 if cls.__name__.startswith("I") else 0))
+        min_val = -max_val if cls.__name__.startswith("I") else 0
+        return min_val, max_val
+
     def validate(self, val):
         """ Validates the given integer. """
         if not isinstance(val, int):
             raise TypeMismatchException(int, type(val))
-        max_val = 1 << (
-            self.get_bits() - (1 if self.__class__.__name__.startswith("I") else 0)
-        )
-        min_val = -max_val if self.__class__.__name__.startswith("I") else 0
+        min_val, max_val = self.get_range()
         # Compare to min and max
         if val < min_val or val >= max_val:
             raise TypeRangeException(val)
@@ -5,9 +5,14 @@ Created on Dec 18, 2014
 
 """
 import copy
+import struct
 
 from .type_base import BaseType, ValueType
-from .type_exceptions import NotInitializedException, TypeMismatchException
+from .type_exceptions import (
+    DeserializeException,
+    NotInitializedException,
+    TypeMismatchException,
+)
 
 
 class SerializableType(ValueType):
@@ -90,8 +95,35 @@ class SerializableType(ValueType):
             [member_val.serialize() for _, member_val, _, _ in self.mem_list]
         )
 
+    def get_fixed_format(self):
+        """ Serializables have a fixed layout when all of their members do, concatenated in member order """
+        member_formats = [
+            member_val.get_fixed_format() for _, member_val, _, _ in self.mem_list
+        ]
+        if None in member_formats:
+            return None
+        return "".join(member_formats)
+
+    def load_unpacked(self, values):
+        """ Sets the values of each of the members from the unpacked values """
+        new_member_list = []
+        for entry1, member_val, entry3, entry4 in self.mem_list:
+            cloned = copy.copy(member_val)
+            cloned.load_unpacked(values)
+            new_member_list.append((entry1, cloned, entry3, entry4))
+        self.mem_list = new_member_list
+
     def deserialize(self, data, offset):
         """ Deserialize the values of each of the members """
+        codec = self.get_codec()
+        # Fixed layouts are decoded by a single unpack of the compiled codec
+        if codec is not None:
+            try:
+                unpacked = codec.unpack_from(data, offset)
+            except struct.error as err:
+                raise DeserializeException(str(err))
+            self.load_unpacked(iter(unpacked))
+            return
         new_member_list = []
         for entry1, member_val, entry3, entry4 in self.mem_list:
             cloned = copy.copy(member_val)
@@ -130,6 +162,9 @@ class SerializableType(ValueType):
 
     def getSize(self):
         """ The size of a struct is the size of all the members """
+        codec = self.get_codec()
+        if codec is not None:
+            return codec.size
         return sum([mem_type.getSize() for _, mem_type, _, _ in self.mem_list])
 
     def to_jsonable(self):
@@ -19,12 +19,16 @@ time tags sent with serialized data in the fprime architecture.
 
 import datetime
 import math
+import struct
 from enum import Enum
 
 # Custom Python Modules
 import fprime.common.models.serialize.numerical_types
 from fprime.common.models.serialize import type_base
-from fprime.common.models.serialize.type_exceptions import TypeRangeException
+from fprime.common.models.serialize.type_exceptions import (
+    DeserializeException,
+    TypeRangeException,
+)
 
 TimeBase = Enum(
     "TimeBase",
@@ -57,6 +61,9 @@ class TimeType(type_base.BaseType):
     a description of this behavior.  See comparison functions at the end.
     """
 
+    # Time base (U16), time context (U8), seconds (U32) and microseconds (U32)
+    FIXED_FORMAT = "HBII"
+
     def __init__(self, time_base=0, time_context=0, seconds=0, useconds=0):
         """
         Constructor
@@ -166,6 +173,35 @@ class TimeType(type_base.BaseType):
         self._check_useconds(val)
         self.__usecs = fprime.common.models.serialize.numerical_types.U32Type(val)
 
+    def get_fixed_format(self):
+        """
+        Gets the struct format characters of the time tag layout
+
+        Returns:
+            The format characters of time base, time context, seconds and microseconds
+        """
+        return self.FIXED_FORMAT
+
+    def load_unpacked(self, values):
+        """
+        Sets the time tag fields from unpacked values
+
+        Args:
+            values: iterator yielding time base, time context, seconds and microseconds
+        """
+        self.__timeBase = fprime.common.models.serialize.numerical_types.U16Type(
+            next(values)
+        )
+        self.__timeContext = fprime.common.models.serialize.numerical_types.U8Type(
+            next(values)
+        )
+        self.__secs = fprime.common.models.serialize.numerical_types.U32Type(
+            next(values)
+        )
+        self.__usecs = fprime.common.models.serialize.numerical_types.U32Type(
+            next(values)
+        )
+
     def serialize(self):
         """
         Serializes the time type
@@ -173,12 +209,12 @@ class TimeType(type_base.BaseType):
         Returns:
             Byte array containing serialized time type
         """
-        buf = b""
-        buf += self.__timeBase.serialize()
-        buf += self.__timeContext.serialize()
-        buf += self.__secs.serialize()
-        buf += self.__usecs.serialize()
-        return buf
+        return self.get_codec().pack(
+            self.__timeBase.val,
+            self.__timeContext.val,
+            self.__secs.val,
+            self.__usecs.val,
+        )
 
     def deserialize(self, data, offset):
         """
@@ -190,22 +226,11 @@ class TimeType(type_base.BaseType):
             data: binary data containing the time tag (type = bytearray)
             offset: Index in data where time tag starts
         """
-
-        # Decode Time Base
-        self.__timeBase.deserialize(data, offset)
-        offset += self.__timeBase.getSize()
-
-        # Decode Time Context
-        self.__timeContext.deserialize(data, offset)
-        offset += self.__timeContext.getSize()
-
-        # Decode Seconds
-        self.__secs.deserialize(data, offset)
-        offset += self.__secs.getSize()
-
-        # Decode Microseconds
-        self.__usecs.deserialize(data, offset)
-        offset += self.__usecs.getSize()
+        try:
+            unpacked = self.get_codec().unpack_from(data, offset)
+        except struct.error as err:
+            raise DeserializeException(str(err))
+        self.load_unpacked(iter(unpacked))
 
     def getSize(self):
         """
@@ -214,12 +239,7 @@ class TimeType(type_base.BaseType):
         Returns:
             The size of the time type object when serialized
         """
-        return (
-            self.__timeBase.getSize()
-            + self.__timeContext.getSize()
-            + self.__secs.getSize()
-            + self.__usecs.getSize()
-        )
+        return self.get_codec().size
 
     @staticmethod
     def compare(t1, t2):
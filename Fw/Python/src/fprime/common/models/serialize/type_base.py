@@ -5,6 +5,7 @@ Created on Dec 18, 2014
 Replaced type base class with decorators
 """
 import abc
+import functools
 import struct
 
 from .type_exceptions import AbstractMethodException
@@ -35,6 +36,38 @@ class BaseType(abc.ABC):
         """
         raise AbstractMethodException("getSize")
 
+    def get_fixed_format(self):
+        """
+        Gets the struct format characters (without a byte order prefix) describing the serialized layout of this type.
+        Types whose serialized size depends on their value (e.g. strings) return None and must be deserialized through
+        the regular deserialize call.
+
+        :return: struct format characters or None when the layout is not fixed
+        """
+        return None
+
+    def load_unpacked(self, values):
+        """
+        Sets this type from an iterator of values unpacked using the format returned by get_fixed_format. This consumes
+        exactly as many values from the iterator as the format yields. Implementations must not mutate objects shared
+        with a shallow copy of this type such that values may be loaded into copy.copy clones of a template type.
+
+        :param values: iterator of unpacked values
+        """
+        raise AbstractMethodException("load_unpacked")
+
+    def get_codec(self):
+        """
+        Gets the compiled struct codec for the fixed layout of this type. A whole fixed-layout record (including nested
+        members) is decoded by a single unpack_from call on this codec.
+
+        :return: cached struct.Struct or None when the layout is not fixed
+        """
+        fixed_format = self.get_fixed_format()
+        if fixed_format is None:
+            return None
+        return get_struct(fixed_format)
+
     def __repr__(self):
         """ Produces a string representation of a given type """
         return self.__class__.__name__.replace("Type", "")
@@ -88,6 +121,18 @@ class ValueType(BaseType, abc.ABC):
         return {"value": self.val, "type": str(self)}
 
 
+@functools.lru_cache(maxsize=None)
+def get_struct(fixed_format):
+    """
+    Compiles the given format characters into a big-endian struct.Struct. Compiled structs are cached such that each
+    layout is compiled once and shared by all types using it.
+
+    :param fixed_format: struct format characters without a byte order prefix
+    :return: compiled struct.Struct
+    """
+    return struct.Struct(">" + fixed_format)
+
+
 #
 #
 def showBytes(byteBuffer):
@@ -318,3 +318,59 @@ def test_time_type():
     for (t_base, t_context, secs, usecs) in in_err_list:
         with pytest.raises(TypeRangeException):
             ser_deser_time_test(t_base, t_context, secs, usecs)
+
+
+def test_fixed_codecs():
+    """
+    Tests that fixed-layout types compile to a single cached codec and decode through it
+    """
+    for type_input, fmt in [
+        (U8Type, "B"),
+        (I16Type, "h"),
+        (U32Type, "I"),
+        (F64Type, "d"),
+    ]:
+        assert type_input.get_fixed_format() == fmt
+        assert type_input.get_codec() is type_input.get_codec()
+        assert type_input.get_codec().size == type_input.getSize()
+    assert BoolType().get_fixed_format() == "B"
+    assert EnumType("SomeEnum", {"MEMB1": 0}).get_fixed_format() == "i"
+    assert TimeType().get_codec().size == TimeType().getSize() == 11
+
+    members = {"MEMB1": 0, "MEMB2": 6, "MEMB3": 9}
+    memList = [
+        ("mem1", U32Type(1000000), ">I"),
+        ("mem2", BoolType(True), "B"),
+        ("mem3", EnumType("SomeEnum", members, "MEMB2"), ">i"),
+        ("mem4", I64Type(-5), ">q"),
+    ]
+    serType1 = SerializableType("ASerType", memList)
+    assert serType1.get_fixed_format() == "IBiq"
+    assert serType1.getSize() == 4 + 1 + 4 + 8
+    buff = serType1.serialize()
+    serType2 = SerializableType(
+        "ASerType",
+        [
+            ("mem1", U32Type(), ">I"),
+            ("mem2", BoolType(), "B"),
+            ("mem3", EnumType("SomeEnum", members), ">i"),
+            ("mem4", I64Type(), ">q"),
+        ],
+    )
+    serType2.deserialize(b" " * 3 + buff, 3)
+    assert serType2.val["mem1"] == 1000000
+    assert serType2.val["mem2"] is True
+    assert serType2.val["mem3"] == "MEMB2"
+    assert serType2.val["mem4"] == -5
+    with pytest.raises(DeserializeException):
+        serType2.deserialize(buff[:-1], 0)
+
+    # Strings make a layout variable and fall back to member by member deserialization
+    stringList = memList + [("mem5", StringType("abc"), ">H")]
+    assert SerializableType("ASerType", stringList).get_codec() is None
+
+    arrType = ArrayType("TestArray", (U16Type(), 3, "%d"))
+    assert arrType.get_fixed_format() == "HHH"
+    arrType.deserialize(b"\x00\x01\x00\x02\xff\xff", 0)
+    assert arrType.val == [1, 2, 0xFFFF]
+    assert arrType.getSize() == 6
@@ -7,13 +7,19 @@ Socket used to attach to the TCP server as a client and read/write data.
 import select
 import socket
 import threading
+import time
 
 from fprime.constants import DATA_ENCODING
+from fprime_gds.common.communication.shared_ring import SharedRingReader
 from fprime_gds.common.handlers import DataHandler
 
 # Constants for public use
 GUI_TAG = "GUI"
 FSW_TAG = "FSW"
+# Registration of clients only sending through the server, it routes no data to this name
+SEND_ONLY_TAG = "SHM"
+# Default size of the preallocated receive buffer
+RECV_BUFFER_SIZE = 256 * 1024
 
 
 class ThreadedTCPSocketClient(DataHandler):
@@ -22,13 +28,16 @@ class ThreadedTCPSocketClient(DataHandler):
     software
     """
 
-    def __init__(self, sock=None, dest=FSW_TAG):
+    def __init__(self, sock=None, dest=FSW_TAG, buffer_size=RECV_BUFFER_SIZE):
         """
         Threaded client socket constructor
 
         Keyword Arguments:
                 sock {Socket} -- A socket for the client to use. Created own if
                                  None (default: {None})
+                buffer_size {int} -- Size of the receive buffer. Data available on
+                                     the socket is coalesced up to this size
+                                     before being passed to the distributors.
         """
 
         if sock is None:
@@ -40,6 +49,12 @@ class ThreadedTCPSocketClient(DataHandler):
         self.dest = dest
         self.__distributors = []
         self.__select_timeout = 1
+        self.__buffer = bytearray(buffer_size)
+        # Receive counters, and the counter values at the last call to get_rates
+        self.bytes_received = 0
+        self.reads = 0
+        self.dispatches = 0
+        self.__last_counts = (time.monotonic(), 0, 0)
         self.__data_recv_thread = threading.Thread(target=self.recv)
         self.stop_event = threading.Event()
 
@@ -126,13 +141,113 @@ class ThreadedTCPSocketClient(DataHandler):
         """
         self.sock.send(b"A5A5 %s %s" % (self.get_data_bytes(dest), data))
 
+    def get_rates(self):
+        """
+        Gets the receive rates since the previous call to this method (or construction)
+
+        :return: tuple of (bytes per second, reads per second)
+        """
+        now = time.monotonic()
+        last_time, last_bytes, last_reads = self.__last_counts
+        self.__last_counts = (now, self.bytes_received, self.reads)
+        elapsed = max(now - last_time, 1e-9)
+        return (
+            (self.bytes_received - last_bytes) / elapsed,
+            (self.reads - last_reads) / elapsed,
+        )
+
     def recv(self):
         """
-        Method run constantly by the enclosing thread. Looks for data from the server.
+        Method run constantly by the enclosing thread. Looks for data from the server. Reads go directly into the
+        preallocated buffer and continue while more data is immediately available, such that distributors are called
+        once per filled buffer rather than once per read.
         """
+        view = memoryview(self.__buffer)
         while not self.stop_event.is_set():
             ready = select.select([self.sock], [], [], self.__select_timeout)
-            if ready[0]:
-                chunk = self.sock.recv(1024)
-                for d in self.__distributors:
-                    d.on_recv(chunk)
+            filled = 0
+            while ready[0] and filled < len(view):
+                count = self.sock.recv_into(view[filled:])
+                # Server closed the connection
+                if count == 0:
+                    self.stop_event.set()
+                    break
+                filled += count
+                self.reads += 1
+                ready = select.select([self.sock], [], [], 0)
+            if filled == 0:
+                continue
+            self.distribute(bytes(view[:filled]))
+
+    def distribute(self, chunk):
+        """
+        Passes received data to all registered distributors
+
+        :param chunk: data received
+        """
+        self.bytes_received += len(chunk)
+        self.dispatches += 1
+        for d in self.__distributors:
+            d.on_recv(chunk)
+
+
+class SharedMemorySocketClient(ThreadedTCPSocketClient):
+    """
+    Client receiving data from the shared-memory ring written by the TCP server instead of its own copy over the socket.
+    The socket is still used to send data, and is registered such that the server routes nothing to it.
+    """
+
+    def __init__(self, ring_name, sock=None, dest=FSW_TAG, poll_interval=0.01):
+        """
+        Shared memory client constructor
+
+        :param ring_name: name of the shared-memory ring written by the TCP server
+        :param sock: socket for the client to use. Created own if None
+        :param dest: destination of data sent by this client
+        :param poll_interval: seconds between checks of the ring when it holds no new data
+        """
+        super().__init__(sock, dest)
+        self.ring_name = ring_name
+        self.poll_interval = poll_interval
+        self.ring = None
+
+    def connect(self, host, port):
+        """
+        Opens the shared-memory ring, then connects to the server and starts the receive thread. The ring is opened here
+        such that a missing ring is reported to the caller instead of ending the receive thread.
+
+        :param host: IP of the host server
+        :param port: port of the host server
+        :raises FileNotFoundError: when the ring does not exist
+        :raises ValueError: when the shared memory is not a ring
+        """
+        self.ring = SharedRingReader(self.ring_name)
+        super().connect(host, port)
+
+    def register_to_server(self, register_as):
+        """
+        Registers to the server as a send-only client, data for register_as is read from the ring
+
+        :param register_as: ignored, kept for compatibility with ThreadedTCPSocketClient
+        """
+        super().register_to_server(SEND_ONLY_TAG)
+
+    def recv(self):
+        """
+        Method run constantly by the enclosing thread. Reads all new data from the ring, waiting poll_interval when
+        there is none.
+        """
+        if self.ring is None:
+            self.ring = SharedRingReader(self.ring_name)
+        ring = self.ring
+        try:
+            while not self.stop_event.is_set():
+                msgs = ring.read()
+                if not msgs:
+                    self.stop_event.wait(self.poll_interval)
+                    continue
+                self.reads += 1
+                self.distribute(b"".join(msgs))
+        finally:
+            ring.close()
+            self.ring = None
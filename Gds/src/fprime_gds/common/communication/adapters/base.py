@@ -20,6 +20,9 @@ class BaseAdapter(abc.ABC):
     defaulted not overridden.
     """
 
+    # Statistics of get_stats that are monotonic counters
+    COUNTERS = []
+
     def open(self):
         """Null default implementation """
 
@@ -37,6 +40,25 @@ class BaseAdapter(abc.ABC):
         :return: byte array of data, or b'' if no data was read
         """
 
+    def read_chunks(self, timeout=0.500):
+        """
+        Read from the interface as a list of chunks, allowing adapters collecting data in chunks to skip concatenating
+        them. Defaults to returning the result of read as a single chunk.
+
+        :param timeout: timeout for the block, default: 0.500 (500ms) as blocking w/o timeout may be uninterruptable
+        :return: list of chunks of data, empty if no data was read
+        """
+        data = self.read(timeout)
+        return [data] if data else []
+
+    def get_stats(self):
+        """
+        Gets the statistics of this adapter, names listed in COUNTERS are monotonic counters. Defaults to none.
+
+        :return: dictionary of statistic name to number
+        """
+        return {}
+
     @abc.abstractmethod
     def write(self, frame):
         """
@@ -9,16 +9,23 @@ across a Tcp and/or UDP network interface.
 """
 import abc
 import logging
-import queue
+import os
 import socket
 import threading
 import time
 
 import fprime_gds.common.communication.adapters.base
 import fprime_gds.common.logger
+from fprime_gds.common.communication.framing import Datagram
 
 LOGGER = logging.getLogger("ip_adapter")
 
+# Maximum number of buffers passed to a single sendmsg call
+try:
+    IOV_MAX = max(os.sysconf("SC_IOV_MAX"), 16)
+except (AttributeError, ValueError, OSError):
+    IOV_MAX = 1024
+
 
 def check_port(address, port):
     """
@@ -45,28 +52,40 @@ class IpAdapter(fprime_gds.common.communication.adapters.base.BaseAdapter):
     """
     Adapts IP traffic for use with the GDS ground system. This serves two different "servers" both on the same address
     and port, but one uses TCP and the other uses UDP. Writes go to the TCP connection, and reads request data from
-    both. This data is concatenated and returned up the stack for processing.
+    both. The chunks read are collected in a list and returned up the stack as a batch, either concatenated (read) or
+    as the list itself (read_chunks).
+
+    UDP data is treated according to the UDP mode. In "stream" mode datagrams are part of the same byte stream as TCP
+    data. In "datagram" mode each datagram holds whole frames, and is returned as a Datagram chunk deframed on its own.
     """
 
     # Interval to send a KEEPALIVE packet. None will turn off KEEPALIVE.
     KEEPALIVE_INTERVAL = 0.500
     # Data to send out as part of the KEEPALIVE packet. Should not be null nor empty.
     KEEPALIVE_DATA = b"sitting well"
-    MAXIMUM_DATA_SIZE = 4096
+    # Maximum size of each socket read, large enough for any UDP datagram
+    MAXIMUM_DATA_SIZE = 65536
+    UDP_MODES = ["stream", "datagram"]
 
-    def __init__(self, address, port):
+    def __init__(self, address, port, udp_mode="stream"):
         """
         Initialize this adapter by creating a handler for UDP and TCP. A thread for the KEEPALIVE application packets
         will be created, if the interval is not none.
+
+        :param address: address of the TCP and UDP servers
+        :param port: port of the TCP and UDP servers
+        :param udp_mode: one of UDP_MODES, whether UDP datagrams are part of the stream or hold whole frames
         """
+        if udp_mode not in IpAdapter.UDP_MODES:
+            raise ValueError("Invalid UDP mode of {}".format(udp_mode))
         self.stop = False
         self.keepalive = None
         self.tcp = TcpHandler(address, port)
-        self.udp = UdpHandler(address, port)
+        self.udp = UdpHandler(address, port, datagrams=udp_mode == "datagram")
         self.thtcp = None
         self.thudp = None
-        self.data_chunks = queue.Queue()
-        self.blob = b""
+        self.data_chunks = []
+        self.data_available = threading.Condition()
 
     def open(self):
         """
@@ -104,7 +123,13 @@ class IpAdapter(fprime_gds.common.communication.adapters.base.BaseAdapter):
         """Adapter thread function"""
         handler.open()
         while not self.stop:
-            self.data_chunks.put(handler.read())
+            chunk = handler.read()
+            if chunk:
+                chunks = handler.read_pending()
+                with self.data_available:
+                    self.data_chunks.append(chunk)
+                    self.data_chunks.extend(chunks)
+                    self.data_available.notify()
         handler.close()
 
     def write(self, frame):
@@ -123,19 +148,26 @@ class IpAdapter(fprime_gds.common.communication.adapters.base.BaseAdapter):
         Read up to a given count in bytes from the TCP adapter. This may return less than the full requested size but
         is expected to return some data.
 
-        :param timeout: timeout to wait for data. Needed as the get call below may not interrupt if it waits forever
+        :param timeout: timeout to wait for data. Needed as the wait call below may not interrupt if it waits forever
         :return: data successfully read or "" when no data available within timeout
         """
-        data = b""
+        return b"".join(Datagram.unwrap(chunk) for chunk in self.read_chunks(timeout))
+
+    def read_chunks(self, timeout=0.500):
+        """
+        Read all chunks of data received by the TCP and UDP handlers, without concatenating them.
+
+        :param timeout: timeout to wait for data
+        :return: list of chunks of data read, empty when no data available within timeout
+        """
         # The read function should block until data is available, but for efficiency, it should read all data available
-        # thus the data is read, blocking for 0.5 seconds, and then reads as long as it is not empty.
-        try:
-            data += self.data_chunks.get(timeout=timeout)
-            while not self.data_chunks.empty():
-                data += self.data_chunks.get_nowait()
-        except queue.Empty:
-            pass
-        return data
+        # thus waits up to timeout for a chunk, and then takes every chunk received at once.
+        with self.data_available:
+            if not self.data_chunks:
+                self.data_available.wait(timeout)
+            chunks = self.data_chunks
+            self.data_chunks = []
+        return chunks
 
     def th_alive(self, interval):
         """
@@ -166,6 +198,13 @@ class IpAdapter(fprime_gds.common.communication.adapters.base.BaseAdapter):
                 "default": 50000,
                 "help": "Port of the IP adapter server. Default: %(default)s",
             },
+            ("--ip-udp-mode",): {
+                "dest": "udp_mode",
+                "type": str,
+                "choices": cls.UDP_MODES,
+                "default": "stream",
+                "help": "UDP datagrams are part of the data stream, or each datagram holds whole frames. Default: %(default)s",
+            },
         }
 
     @classmethod
@@ -316,6 +355,15 @@ class IpHandler(abc.ABC):
     def read_impl(self):
         """ Implementation of the handler's read call"""
 
+    def read_pending(self):
+        """
+        Reads the messages already waiting on the socket without blocking, such that they are handed off in the same
+        batch as the message read before them. Handlers not supporting this return no messages.
+
+        :return: list of messages read
+        """
+        return []
+
     def write(self, message):
         """
         Writes a single message after ensuring that the socket is fully open. On any error, close the socket in
@@ -338,6 +386,53 @@ class IpHandler(abc.ABC):
     def write_impl(self, message):
         """ Implementation of the handler's write call"""
 
+    def write_all(self, buffers):
+        """
+        Writes a list of buffers as a single message, without joining them first. Errors are handled as in write.
+
+        :param buffers: list of bytes-like objects to send, in order
+        :return: True if all data was written, False otherwise
+        """
+        try:
+            self.write_all_impl(buffers)
+            return True
+        except OSError as exc:
+            if self.running:
+                self.logger.warning(
+                    "Write failure: %s: %s", type(exc).__name__, str(exc)
+                )
+        return False
+
+    def write_all_impl(self, buffers):
+        """
+        Implementation of the handler's write_all call. Defaults to joining the buffers and calling write_impl.
+
+        :param buffers: list of bytes-like objects to send
+        """
+        self.write_impl(b"".join(buffers))
+
+    @staticmethod
+    def sendmsg_all(sock, buffers):
+        """
+        Sends all buffers with scatter/gather sendmsg calls, continuing after partial sends. At most IOV_MAX buffers are
+        passed to each call.
+
+        :param sock: connected socket
+        :param buffers: list of bytes-like objects to send, in order
+        """
+        views = [memoryview(buffer) for buffer in buffers if len(buffer)]
+        index = 0
+        while index < len(views):
+            sent = sock.sendmsg(views[index : index + IOV_MAX])
+            # Skip the buffers sent in full and keep the unsent part of a partially sent buffer
+            while sent and index < len(views):
+                if sent >= len(views[index]):
+                    sent -= len(views[index])
+                    index += 1
+                else:
+                    views[index] = views[index][sent:]
+                    sent = 0
+
     @staticmethod
     def kill_socket(sock):
         """ Kills a socket connection, but shutting it down and then closing. """
@@ -403,8 +498,7 @@ class TcpHandler(IpHandler):
         Specific read implementation for the TCP handler. This involves reading from the spawned client socket, not the
         primary socket.
         """
-        data = self.client.recv(IpAdapter.MAXIMUM_DATA_SIZE)
-        return data
+        return self.client.recv(IpAdapter.MAXIMUM_DATA_SIZE)
 
     def write_impl(self, message):
         """
@@ -417,22 +511,46 @@ class TcpHandler(IpHandler):
             pass
         self.client.sendall(message)
 
+    def write_all_impl(self, buffers):
+        """
+        Sends the buffers to the connected client with scatter/gather writes, where supported by the platform.
+
+        :param buffers: list of bytes-like objects to send out
+        """
+        if not hasattr(socket.socket, "sendmsg"):
+            self.write_impl(b"".join(buffers))
+            return
+        # Block until the port is open
+        while self.connected != IpHandler.CONNECTED or self.client is None:
+            pass
+        IpHandler.sendmsg_all(self.client, buffers)
+
 
 class UdpHandler(IpHandler):
     """
     Handler for UDP traffic. This will work in unison with the TCP adapter.
     """
 
+    # Maximum number of waiting datagrams read at once by read_pending
+    MAXIMUM_BATCH = 256
+
     def __init__(
-        self, address, port, server=True, logger=logging.getLogger("udp_handler")
+        self,
+        address,
+        port,
+        server=True,
+        logger=logging.getLogger("udp_handler"),
+        datagrams=False,
     ):
         """
         Init UDP with address and port
 
         :param address: address of UDP
         :param port: port of UDP
+        :param datagrams: return each datagram as a Datagram holding whole frames, rather than as plain bytes
         """
         super().__init__(address, port, socket.SOCK_DGRAM, server, logger)
+        self.chunk_type = Datagram if datagrams else bytes
 
     def open_impl(self):
         """No extra steps required"""
@@ -445,7 +563,28 @@ class UdpHandler(IpHandler):
         Receive from the UDP handler. This involves receiving from an unconnected socket.
         """
         (data, address) = self.socket.recvfrom(IpAdapter.MAXIMUM_DATA_SIZE)
-        return data
+        return self.chunk_type(data)
+
+    def read_pending(self):
+        """
+        Reads up to MAXIMUM_BATCH datagrams already waiting on the socket, in place of a recvmmsg call. Errors end the
+        batch and are left to the next blocking read to handle.
+
+        :return: list of datagrams read
+        """
+        datagrams = []
+        flags = getattr(socket, "MSG_DONTWAIT", None)
+        if flags is None or self.socket is None:
+            return datagrams
+        try:
+            while len(datagrams) < UdpHandler.MAXIMUM_BATCH:
+                (data, address) = self.socket.recvfrom(
+                    IpAdapter.MAXIMUM_DATA_SIZE, flags
+                )
+                datagrams.append(self.chunk_type(data))
+        except OSError:
+            pass
+        return datagrams
 
     def write_impl(self, message):
         """
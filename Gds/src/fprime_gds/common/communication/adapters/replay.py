@@ -0,0 +1,267 @@
+"""
+replay.py:
+
+Adapter replaying a recorded downlink instead of talking to FSW, allowing deterministic load tests of the whole ground
+system without a spacecraft or simulator. Three recording formats are supported:
+
+1. timed: records of receive time, size and data written by LinkRecorder (see comm's --comm-record option). The
+   original chunk boundaries and inter-arrival times are kept, and replayed at real time, N times real time, or as fast
+   as possible.
+2. recv: a "recv.bin" file written by the GDS DataLogger. Each size-prefixed packet is framed and replayed as one chunk.
+   The comm layer gives the adapter its own checksum type (--comm-checksum-type) such that these frames deframe.
+3. raw: raw bytes of the link, replayed in chunks of RAW_CHUNK_SIZE.
+
+The recv and raw formats hold no timing and are always replayed as fast as possible. Uplinked data is discarded.
+
+@date Created October 16, 2026
+"""
+import logging
+import struct
+import time
+
+import fprime_gds.common.communication.adapters.base
+from fprime_gds.common.communication.framing import Datagram, FpFramerDeframer
+
+LOGGER = logging.getLogger("replay_adapter")
+
+# Header of a timed record: receive time in seconds since the epoch and size of the data
+RECORD_HEADER = struct.Struct(">dI")
+# Size prefix of a recv.bin packet
+RECV_HEADER = struct.Struct(">I")
+FORMATS = ["timed", "recv", "raw"]
+
+
+class LinkRecorder:
+    """ Records chunks of downlinked data in the timed format replayed by the ReplayAdapter """
+
+    def __init__(self, path):
+        """
+        Opens the recording file, replacing any existing file
+
+        :param path: path of the recording
+        """
+        self.file = open(path, "wb")
+
+    def record(self, chunks):
+        """
+        Records chunks read from an adapter. Timestamped chunks keep their receive time, others are stamped now.
+
+        :param chunks: list of chunks of data
+        """
+        now = time.time()
+        for chunk in chunks:
+            self.file.write(RECORD_HEADER.pack(getattr(chunk, "time", now), len(chunk)))
+            self.file.write(Datagram.unwrap(chunk))
+
+    def close(self):
+        """ Closes the recording file """
+        self.file.close()
+
+
+class ReplayAdapter(fprime_gds.common.communication.adapters.base.BaseAdapter):
+    """
+    Adapter reading its downlink from a recording. A speed of 1 replays timed recordings at real time, N replays them N
+    times faster and 0 replays as fast as possible. Each read returns all chunks due, at most MAXIMUM_BATCH.
+    """
+
+    RAW_CHUNK_SIZE = 4096
+    MAXIMUM_BATCH = 256
+    COUNTERS = ["chunks", "bytes", "uplink_discarded"]
+
+    def __init__(
+        self, replay_file, replay_format="recv", replay_speed=1.0, checksum_type="fixed"
+    ):
+        """
+        Sets up the adapter, the recording is opened on open
+
+        :param replay_file: path of the recording
+        :param replay_format: one of FORMATS
+        :param replay_speed: speed factor of timed recordings, 0 for as fast as possible
+        :param checksum_type: checksum used to frame packets of the recv format, the comm layer's checksum type
+        """
+        if replay_format not in FORMATS:
+            raise ValueError("Invalid replay format of {}".format(replay_format))
+        self.path = replay_file
+        self.format = replay_format
+        self.speed = float(replay_speed)
+        self.framer = FpFramerDeframer(checksum_type)
+        self.file = None
+        self.next_record = None
+        self.start = None
+        self.complete = False
+        self.chunks = 0
+        self.bytes = 0
+        self.lag = 0.0
+        self.uplink_discarded = 0
+
+    def open(self):
+        """ Opens the recording, the replay starts at the first read """
+        self.close()
+        self.file = open(self.path, "rb")
+        self.next_record = None
+        self.start = None
+        self.complete = False
+        return True
+
+    def close(self):
+        """ Closes the recording """
+        if self.file is not None:
+            self.file.close()
+            self.file = None
+
+    def read_record(self):
+        """
+        Reads the next record of the recording
+
+        :return: (receive time or None when the format holds no timing, chunk), or None at the end of the recording
+        """
+        if self.format == "raw":
+            chunk = self.file.read(ReplayAdapter.RAW_CHUNK_SIZE)
+            return (None, chunk) if chunk else None
+        header_struct = RECORD_HEADER if self.format == "timed" else RECV_HEADER
+        header = self.file.read(header_struct.size)
+        if len(header) < header_struct.size:
+            return None
+        if self.format == "timed":
+            receive_time, size = header_struct.unpack(header)
+            data = self.file.read(size)
+        else:
+            receive_time = None
+            data = self.framer.frame(self.file.read(header_struct.unpack(header)[0]))
+        return receive_time, data
+
+    def due(self, receive_time):
+        """
+        Gets the wall clock time a record is due to be replayed at
+
+        :param receive_time: receive time of the record, None when unknown
+        :return: time.monotonic() time the record is due
+        """
+        if receive_time is None or self.speed <= 0:
+            return 0
+        if self.start is None:
+            self.start = (time.monotonic(), receive_time)
+        return self.start[0] + (receive_time - self.start[1]) / self.speed
+
+    def read(self, timeout=0.500):
+        """
+        Read the data due in the recording
+
+        :param timeout: maximum time to wait for the next data to be due
+        :return: data read, b"" when none was due within timeout
+        """
+        return b"".join(self.read_chunks(timeout))
+
+    def read_chunks(self, timeout=0.500):
+        """
+        Reads the chunks due in the recording, waiting up to timeout for the next chunk to be due
+
+        :param timeout: maximum time to wait for the next chunk to be due
+        :return: list of chunks, empty when none was due within timeout or the recording is complete
+        """
+        if self.file is None or self.complete:
+            time.sleep(timeout)
+            return []
+        chunks = []
+        deadline = time.monotonic() + timeout
+        while len(chunks) < ReplayAdapter.MAXIMUM_BATCH:
+            if self.next_record is None:
+                self.next_record = self.read_record()
+                if self.next_record is None:
+                    self.complete = True
+                    LOGGER.info(
+                        "Replay of %s complete: %d chunks, %d bytes",
+                        self.path,
+                        self.chunks,
+                        self.bytes,
+                    )
+                    break
+            due = self.due(self.next_record[0])
+            now = time.monotonic()
+            if due > now:
+                # Return what is due now, otherwise wait for the next chunk as long as the timeout allows
+                if chunks or due > deadline:
+                    if not chunks:
+                        time.sleep(max(deadline - now, 0))
+                    break
+                time.sleep(due - now)
+                now = time.monotonic()
+            self.lag = max(now - due, 0.0) if due else 0.0
+            chunks.append(self.next_record[1])
+            self.chunks += 1
+            self.bytes += len(self.next_record[1])
+            self.next_record = None
+        return chunks
+
+    def write(self, frame):
+        """
+        Discards uplinked data, there is no FSW to send it to
+
+        :param frame: framed data to uplink
+        :return: True, the data is considered sent
+        """
+        self.uplink_discarded += 1
+        return True
+
+    def get_stats(self):
+        """
+        Gets the progress of the replay
+
+        :return: dictionary of chunks and bytes replayed, lag behind the recording's timing and completion
+        """
+        return {
+            "chunks": self.chunks,
+            "bytes": self.bytes,
+            "lag": self.lag,
+            "complete": int(self.complete),
+            "uplink_discarded": self.uplink_discarded,
+        }
+
+    @classmethod
+    def get_arguments(cls):
+        """
+        Returns a dictionary of flag to argparse-argument dictionaries for use with argparse to setup arguments.
+
+        :return: dictionary of flag to argparse arguments for use with argparse
+        """
+        return {
+            ("--replay-file",): {
+                "dest": "replay_file",
+                "type": str,
+                "default": "recv.bin",
+                "help": "Recording to replay. Default: %(default)s",
+            },
+            ("--replay-format",): {
+                "dest": "replay_format",
+                "type": str,
+                "choices": FORMATS,
+                "default": "recv",
+                "help": "Format of the recording: timed (--comm-record), recv (DataLogger recv.bin) or raw link bytes. Default: %(default)s",
+            },
+            ("--replay-speed",): {
+                "dest": "replay_speed",
+                "type": float,
+                "default": 1.0,
+                "help": "Speed factor of timed recordings, 1 is real time and 0 as fast as possible. Default: %(default)s",
+            },
+        }
+
+    @classmethod
+    def check_arguments(cls, args):
+        """
+        Code that should check arguments of this adapter. If there is a problem with this code, then a "ValueError"
+        should be raised describing the problem with these arguments.
+
+        :param args: arguments as dictionary
+        """
+        try:
+            with open(args["replay_file"], "rb"):
+                pass
+        except OSError as exc:
+            raise ValueError(
+                "Replay file '{}' not readable: {}".format(args["replay_file"], exc)
+            )
+        if float(args["replay_speed"]) < 0:
+            raise ValueError(
+                "Replay speed '{}' must not be negative".format(args["replay_speed"])
+            )
@@ -5,12 +5,19 @@ This is the adapter for projects that would choose to use a serial UART interfac
 deployment. This handles sending and receiving data from the things like 'LinuxSerialDriver' and other standard UART
 drivers.
 
+Data is read by a dedicated reader thread into a ring of chunks, bounded in bytes, that read and read_chunks take from.
+Each read is sized from the bytes waiting in the serial driver, such that fast links are drained in large reads.
+
 @author lestarch
 """
 
+import collections
 import logging
+import threading
+import time
 
 import fprime_gds.common.communication.adapters.base
+from fprime_gds.common.communication.framing import Timestamped
 
 import serial
 from serial.tools import list_ports
@@ -23,8 +30,20 @@ class SerialAdapter(fprime_gds.common.communication.adapters.base.BaseAdapter):
     """
     Supplies a data source adapter that is pulling data off from a UART wire using PySerial. This is setup using a
     device handle and a baudrate for the given serial device.
+
+    A reader thread reads the serial port into a ring of chunks holding at most buffer_size bytes. When the ground side
+    falls behind, the oldest chunks are dropped and counted in lost_bytes. Chunks may be timestamped with their receive
+    time, which is passed on to the frames deframed from them.
     """
 
+    # Timeout of a blocking read of the reader thread, bounding the time to notice the adapter closing
+    READ_TIMEOUT = 0.100
+    # Seconds between a serial error and an attempt to reopen the port
+    ERROR_RETRY_INTERVAL = 1
+    DEFAULT_READ_SIZE = 65536
+    DEFAULT_BUFFER_SIZE = 16 * 1024 * 1024
+    COUNTERS = ["lost_bytes"]
+
     BAUDS = [
         50,
         75,
@@ -58,33 +77,118 @@ class SerialAdapter(fprime_gds.common.communication.adapters.base.BaseAdapter):
         4000000,
     ]
 
-    def __init__(self, device, baud):
+    def __init__(
+        self,
+        device,
+        baud,
+        read_size=DEFAULT_READ_SIZE,
+        buffer_size=DEFAULT_BUFFER_SIZE,
+        timestamps="off",
+    ):
         """
         Initialize the serial adapter using the default settings. This does not open the serial port, but sets up all
         the internal variables used when opening the device.
+
+        :param device: serial device
+        :param baud: baud rate of the serial device
+        :param read_size: maximum number of bytes read from the serial port at once
+        :param buffer_size: maximum number of bytes read but not yet taken by read or read_chunks
+        :param timestamps: "on" to timestamp each chunk read with its receive time, "off" otherwise
         """
         self.device = device
         self.baud = baud
+        self.read_size = read_size
+        self.buffer_size = buffer_size
+        self.timestamps = timestamps == "on"
         self.serial = None
+        self.serial_lock = threading.Lock()
+        self.running = False
+        self.reader = None
+        self.chunks = collections.deque()
+        self.buffered = 0
+        self.lost_bytes = 0
+        self.data_available = threading.Condition()
+
+    def connect(self):
+        """
+        Opens the serial port when not open already. Safe to call from both the reader and writing threads.
+
+        :return: the open serial port
+        """
+        with self.serial_lock:
+            if self.serial is None:
+                self.serial = serial.Serial(
+                    self.device, self.baud, timeout=SerialAdapter.READ_TIMEOUT
+                )
+            return self.serial
+
+    def disconnect(self):
+        """
+        Close the serial device, and ignore any errors that might arrive when attempting that closure.
+        """
+        with self.serial_lock:
+            try:
+                if self.serial is not None:
+                    self.serial.close()
+            finally:
+                self.serial = None
 
     def open(self):
         """
-        Opens the serial port based on previously supplied settings. If the port is already open, then close it first.
-        Then open the port up again.
+        Opens the serial port based on previously supplied settings and starts the reader thread. If the port is already
+        open, then close it first. Then open the port up again.
         """
         self.close()
-        self.serial = serial.Serial(self.device, self.baud)
+        self.connect()
+        self.running = True
+        self.reader = threading.Thread(target=self.th_read)
+        self.reader.daemon = True
+        self.reader.start()
         return self.serial is not None
 
     def close(self):
         """
-        Close the serial device, and ignore any errors that might arrive when attempting that closure.
+        Stops the reader thread and closes the serial device.
         """
-        try:
-            if self.serial is not None:
-                self.serial.close()
-        finally:
-            self.serial = None
+        self.running = False
+        if self.reader is not None:
+            self.reader.join()
+            self.reader = None
+        self.disconnect()
+
+    def th_read(self):
+        """
+        Reader thread function. Reads all bytes waiting in the serial driver at once, up to read_size, or blocks for up
+        to READ_TIMEOUT for the next byte when none are waiting. Serial errors close the port, which is reopened after
+        ERROR_RETRY_INTERVAL.
+        """
+        while self.running:
+            try:
+                port = self.connect()
+                waiting = port.in_waiting
+                data = port.read(min(waiting, self.read_size) if waiting else 1)
+            except serial.serialutil.SerialException as exc:
+                LOGGER.warning("Serial exception caught: %s. Reconnecting.", (str(exc)))
+                self.disconnect()
+                time.sleep(SerialAdapter.ERROR_RETRY_INTERVAL)
+                continue
+            if data:
+                self.push(Timestamped(data, time.time()) if self.timestamps else data)
+
+    def push(self, chunk):
+        """
+        Adds a chunk to the ring, dropping the oldest chunks when more than buffer_size bytes are held
+
+        :param chunk: chunk of data read
+        """
+        with self.data_available:
+            self.chunks.append(chunk)
+            self.buffered += len(chunk)
+            while self.buffered > self.buffer_size and len(self.chunks) > 1:
+                dropped = self.chunks.popleft()
+                self.buffered -= len(dropped)
+                self.lost_bytes += len(dropped)
+            self.data_available.notify()
 
     def write(self, frame):
         """
@@ -95,15 +199,13 @@ class SerialAdapter(fprime_gds.common.communication.adapters.base.BaseAdapter):
         :return: True, when data was sent through the UART. False otherwise.
         """
         try:
-            if self.serial is None:
-                self.open()
-            written = self.serial.write(frame)
+            written = self.connect().write(frame)
             # Not believed to be possible to not send everything without getting a timeout exception
             assert written == len(frame)
             return True
         except serial.serialutil.SerialException as exc:
             LOGGER.warning("Serial exception caught: %s. Reconnecting.", (str(exc)))
-            self.close()
+            self.disconnect()
         return False
 
     def read(self, timeout=0.500):
@@ -114,23 +216,32 @@ class SerialAdapter(fprime_gds.common.communication.adapters.base.BaseAdapter):
         :param timeout: timeout for reading data from the serial.
         :return: data successfully read
         """
-        data = b""
-        try:
-            if self.serial is None:
-                self.open()
-            # Read as much data as possible, while ensuring to block if no data is available at this time. Note: as much
-            # data is read as possible to avoid a long-return time to this call. Minimum data to read is one byte in
-            # order to block this function while data is incoming.
-            self.serial.timeout = timeout
-            data = self.serial.read(1)  # Force a block for at least 1 character
-            while self.serial.in_waiting:
-                data += self.serial.read(
-                    self.serial.in_waiting
-                )  # Drain the incoming data queue
-        except serial.serialutil.SerialException as exc:
-            LOGGER.warning("Serial exception caught: %s. Reconnecting.", (str(exc)))
-            self.close()
-        return data
+        return b"".join(self.read_chunks(timeout))
+
+    def read_chunks(self, timeout=0.500):
+        """
+        Takes all chunks read by the reader thread, waiting up to timeout for the first one. Chunks are timestamped when
+        timestamps are on.
+
+        :param timeout: timeout to wait for data
+        :return: list of chunks read, empty when no data available within timeout
+        """
+        with self.data_available:
+            if not self.chunks:
+                self.data_available.wait(timeout)
+            chunks = list(self.chunks)
+            self.chunks.clear()
+            self.buffered = 0
+        return chunks
+
+    def get_stats(self):
+        """
+        Gets the statistics of the reader thread's ring
+
+        :return: dictionary of bytes dropped from the ring and bytes currently held
+        """
+        with self.data_available:
+            return {"lost_bytes": self.lost_bytes, "buffered": self.buffered}
 
     @classmethod
     def get_arguments(cls):
@@ -156,6 +267,25 @@ class SerialAdapter(fprime_gds.common.communication.adapters.base.BaseAdapter):
                 "default": 9600,
                 "help": "Baud rate of the serial device. Default: %(default)s",
             },
+            ("--uart-read-size",): {
+                "dest": "read_size",
+                "type": int,
+                "default": cls.DEFAULT_READ_SIZE,
+                "help": "Maximum bytes read from the serial device at once. Default: %(default)s",
+            },
+            ("--uart-buffer-size",): {
+                "dest": "buffer_size",
+                "type": int,
+                "default": cls.DEFAULT_BUFFER_SIZE,
+                "help": "Maximum bytes read but not yet deframed before the oldest are dropped. Default: %(default)s",
+            },
+            ("--uart-timestamps",): {
+                "dest": "timestamps",
+                "type": str,
+                "choices": ["off", "on"],
+                "default": "off",
+                "help": "Timestamp data with its receive time to measure downlink latency. Default: %(default)s",
+            },
         }
 
     @classmethod
@@ -189,3 +319,10 @@ class SerialAdapter(fprime_gds.common.communication.adapters.base.BaseAdapter):
                     baud, SerialAdapter.BAUDS
                 )
             )
+        for size in ["read_size", "buffer_size"]:
+            if int(args[size]) <= 0:
+                raise ValueError(
+                    "Serial {} '{}' must be positive".format(
+                        size.replace("_", " "), args[size]
+                    )
+                )
@@ -9,11 +9,17 @@ that implement this pattern. The current list of implementation classes are:
 1. FpFramerDeframer: a class used to write the now-standard F prime ground packet format
 2. TcpServerFramerDeframer: a non-symmetric framer/deframer for use interacting with the Tcp Server packet format
 
+Deframers work on an offset into the data such that no data is copied while searching for frames. StreamDeframer wraps
+any deframer with a buffer and read cursor to deframe a continuous stream of data, returning frames as memoryviews.
+Chunks marked as Datagram hold whole frames and are deframed in place, outside of the stream. Chunks marked as
+Timestamped carry their receive time to the frames they complete.
+
 @author lestarch
 """
 import abc
-import copy
+import binascii
 import struct
+import zlib
 
 
 def CHECKSUM_CALC(_):
@@ -21,12 +27,47 @@ def CHECKSUM_CALC(_):
     return 0xCAFECAFE
 
 
+def CHECKSUM_CRC32(data):
+    """ CRC32 (as computed by zlib) checksum implementation for FpFramerDeframer. """
+    return zlib.crc32(data) & 0xFFFFFFFF
+
+
+def CHECKSUM_CRC16_CCITT(data):
+    """ CRC-16-CCITT (polynomial 0x1021, initial value 0xFFFF) checksum implementation for FpFramerDeframer. """
+    return binascii.crc_hqx(data, 0xFFFF)
+
+
+# Checksum implementations known to FpFramerDeframer by name. "fixed" is the legacy constant used by current FSW.
+CHECKSUM_MAPPING = {
+    "fixed": CHECKSUM_CALC,
+    "crc32": CHECKSUM_CRC32,
+    "crc16-ccitt": CHECKSUM_CRC16_CCITT,
+}
+
+
+def register_checksum(name, checksum):
+    """
+    Registers a checksum implementation such that it can be selected by name. Checksums are functions taking the bytes
+    of the frame header and data, and returning an integer fitting in the 4 byte checksum token.
+
+    :param name: name used to select the checksum
+    :param checksum: checksum function
+    """
+    CHECKSUM_MAPPING[name] = checksum
+
+
 class FramerDeframer(abc.ABC):
     """
     Abstract base class of the Framer/Deframer variety. Framers and Deframers have to define two methods, one for
     framing a set of bytes and one for deframing a set of bytes into packets.
+
+    Deframers count the bytes discarded while searching for a valid frame, and the frames failing their checksum.
     """
 
+    # Counters updated by deframe_at implementations
+    resync_bytes = 0
+    checksum_failures = 0
+
     @abc.abstractmethod
     def frame(self, data):
         """
@@ -51,6 +92,18 @@ class FramerDeframer(abc.ABC):
         :return: (packet as array of bytes or None, leftover bytes)
         """
 
+    def deframe_at(self, data, offset):
+        """
+        Deframes exactly one packet from data starting at offset, without consuming (slicing) data. Implementations
+        should override this to search data in place. This default implementation slices data and calls "deframe".
+
+        :param data: framed data bytes (bytes or bytearray)
+        :param offset: offset into data where deframing starts
+        :return: (packet as bytes-like object or None, offset of the first unused byte)
+        """
+        packet, leftover = self.deframe(data[offset:], no_copy=True)
+        return packet, len(data) - len(leftover)
+
     def deframe_all(self, data, no_copy):
         """
         Deframes all available packets found in a single set of bytes by calling deframe until a None packet is
@@ -61,14 +114,13 @@ class FramerDeframer(abc.ABC):
         :return:
         """
         packets = []
-        if not no_copy:
-            data = copy.copy(data)
+        offset = 0
         while True:
-            # Deframe and return only on None
-            (packet, data) = self.deframe(data, no_copy=True)
+            # Deframe and return only on None, leftover data is sliced exactly once
+            (packet, offset) = self.deframe_at(data, offset)
             if packet is None:
-                return packets, data
-            packets.append(packet)
+                return packets, data[offset:]
+            packets.append(bytes(packet))
 
 
 class FpFramerDeframer(FramerDeframer):
@@ -88,7 +140,7 @@ class FpFramerDeframer(FramerDeframer):
     TOKEN_SIZE = 4
     # Total size of header data based on token size
     HEADER_SIZE = TOKEN_SIZE * 2
-    # Size of checksum value, and the hardcoded value before CRC32 is available
+    # Size of checksum value, see CHECKSUM_MAPPING for the available checksum calculations
     CHECKSUM_SIZE = 4
     MAXIMUM_DATA_SIZE = 4096
 
@@ -97,10 +149,17 @@ class FpFramerDeframer(FramerDeframer):
     HEADER_FORMAT = None
     START_TOKEN = None
 
-    def __init__(self):
-        """ Sets constants on construction. """
+    def __init__(self, checksum_type="fixed"):
+        """
+        Sets constants on construction.
+
+        :param checksum_type: name of the checksum calculation in CHECKSUM_MAPPING. Default: "fixed", the legacy value.
+        """
         # Setup the constants as soon as possible.
         FpFramerDeframer.set_constants()
+        if checksum_type not in CHECKSUM_MAPPING:
+            raise ValueError("Invalid checksum type of {}".format(checksum_type))
+        self.checksum = CHECKSUM_MAPPING[checksum_type]
 
     @classmethod
     def set_constants(clazz):
@@ -135,7 +194,7 @@ class FpFramerDeframer(FramerDeframer):
             FpFramerDeframer.HEADER_FORMAT, FpFramerDeframer.START_TOKEN, len(data)
         )
         framed += data
-        framed += struct.pack(">I", CHECKSUM_CALC(framed))
+        framed += struct.pack(">I", self.checksum(framed))
         return framed
 
     def deframe(self, data, no_copy=False):
@@ -150,41 +209,84 @@ class FpFramerDeframer(FramerDeframer):
         :param no_copy: (optional) will prevent extra copy if True, but "data" input will be destroyed.
         :return: (packet as array of bytes or None, leftover bytes)
         """
-        if not no_copy:
-            data = copy.copy(data)
+        packet, offset = self.deframe_at(data, 0)
+        return None if packet is None else bytes(packet), data[offset:]
+
+    def deframe_at(self, data, offset):
+        """
+        Deframes exactly one packet from data starting at offset. Searches for start tokens with bytes.find, and data is
+        never sliced. The returned packet is a memoryview into data.
+
+        :param data: framed data bytes (bytes or bytearray)
+        :param offset: offset into data where deframing starts
+        :return: (packet as memoryview or None, offset of the first unused byte)
+        """
+        view = memoryview(data)
         # Continue until there is not enough data for the header, or until a packet is found (return)
-        while len(data) >= FpFramerDeframer.HEADER_SIZE:
+        while len(data) - offset >= FpFramerDeframer.HEADER_SIZE:
             # Read header information including start token and size and check if we have enough for the total size
-            start, data_size = struct.unpack_from(FpFramerDeframer.HEADER_FORMAT, data)
+            start, data_size = struct.unpack_from(
+                FpFramerDeframer.HEADER_FORMAT, data, offset
+            )
             total_size = (
                 FpFramerDeframer.HEADER_SIZE
                 + data_size
                 + FpFramerDeframer.CHECKSUM_SIZE
             )
-            # Invalid frame, rotate away a Byte and keep processing
+            # Invalid frame, skip ahead to the next start token and keep processing
             if (
                 start != FpFramerDeframer.START_TOKEN
                 or data_size >= FpFramerDeframer.MAXIMUM_DATA_SIZE
             ):
-                data = data[1:]
+                offset = self.skip(data, offset)
                 continue
             # If the pool is large enough to read the whole frame, then read it
-            elif len(data) >= total_size:
-                deframed, check = struct.unpack_from(
-                    ">{}sI".format(data_size), data, FpFramerDeframer.HEADER_SIZE
-                )
-                # If the checksum is valid, return the packet. Otherwise continue to rotate
-                if check == CHECKSUM_CALC(
-                    data[: data_size + FpFramerDeframer.HEADER_SIZE]
-                ):
-                    data = data[total_size:]
-                    return deframed, data
-                # Bad checksum, rotate 1 and keep looking for non-garbage
-                data = data[1:]
+            elif len(data) - offset >= total_size:
+                data_end = offset + FpFramerDeframer.HEADER_SIZE + data_size
+                (check,) = struct.unpack_from(">I", data, data_end)
+                # If the checksum is valid, return the packet. Otherwise continue to search
+                if check == self.checksum(view[offset:data_end]):
+                    return (
+                        view[offset + FpFramerDeframer.HEADER_SIZE : data_end],
+                        offset + total_size,
+                    )
+                # Bad checksum, skip ahead and keep looking for non-garbage
+                self.checksum_failures += 1
+                offset = self.skip(data, offset)
                 continue
             # Case of not enough data for a full packet, return hoping for more later
-            return None, data
-        return None, data
+            return None, offset
+        return None, offset
+
+    def skip(self, data, offset):
+        """
+        Skips the invalid frame at offset, counting the bytes discarded
+
+        :param data: framed data bytes (bytes or bytearray)
+        :param offset: offset of the invalid frame
+        :return: offset of the next candidate frame
+        """
+        next_offset = self.resync(data, offset)
+        self.resync_bytes += next_offset - offset
+        return next_offset
+
+    @staticmethod
+    def resync(data, offset):
+        """
+        Finds the next candidate start token after the invalid frame at offset. When no start token is found, only the
+        trailing bytes that could hold the beginning of a start token are kept.
+
+        :param data: framed data bytes (bytes or bytearray)
+        :param offset: offset of the invalid frame
+        :return: offset of the next candidate frame
+        """
+        start_bytes = struct.pack(
+            ">" + FpFramerDeframer.TOKEN_TYPE, FpFramerDeframer.START_TOKEN
+        )
+        found = data.find(start_bytes, offset + 1)
+        if found == -1:
+            return max(offset + 1, len(data) - (FpFramerDeframer.TOKEN_SIZE - 1))
+        return found
 
 
 class TcpServerFramerDeframer(FramerDeframer):
@@ -206,6 +308,8 @@ class TcpServerFramerDeframer(FramerDeframer):
     """
 
     START_STRING = "ZZZZ"
+    # Header of outgoing data: 'A5A5 GUI ' and the length of the data
+    HEADER = struct.Struct(">9sI")
 
     def frame(self, data):
         """
@@ -215,7 +319,18 @@ class TcpServerFramerDeframer(FramerDeframer):
         :param data: bytes to frame
         :return: array of raw bytes representing a framed packet. Should be ready for uplink.
         """
-        return b"A5A5 GUI %s%s" % (struct.pack(">I", len(data)), data)
+        return TcpServerFramerDeframer.HEADER.pack(b"A5A5 GUI ", len(data)) + data
+
+    def frame_header_into(self, buffer, offset, size):
+        """
+        Packs the header framing data of the given size into buffer, such that the header and data can be written
+        without being joined.
+
+        :param buffer: writable buffer
+        :param offset: offset of the header in buffer
+        :param size: size of the framed data
+        """
+        TcpServerFramerDeframer.HEADER.pack_into(buffer, offset, b"A5A5 GUI ", size)
 
     def deframe(self, data, no_copy=False):
         """
@@ -229,18 +344,185 @@ class TcpServerFramerDeframer(FramerDeframer):
         :param no_copy: (optional) will prevent extra copy if True, but "data" input will be destroyed.
         :return: (packet as array of bytes or None, leftover bytes)
         """
-        if not no_copy:
-            data = copy.copy(data)
-        # Shift over to ZZZZ
-        while len(data) > 4 and data[0:4] != b"ZZZZ":
-            data = data[1:]
+        packet, offset = self.deframe_at(data, 0)
+        return None if packet is None else bytes(packet), data[offset:]
+
+    def deframe_at(self, data, offset):
+        """
+        Deframes exactly one packet from data starting at offset. Searches for the start string with bytes.find, and
+        data is never sliced. The returned packet is a memoryview into data.
+
+        :param data: framed data bytes (bytes or bytearray)
+        :param offset: offset into data where deframing starts
+        :return: (packet as memoryview or None, offset of the first unused byte)
+        """
+        # Shift over to ZZZZ, keeping any trailing bytes that could start it
+        found = data.find(b"ZZZZ", offset)
+        next_offset = max(offset, len(data) - 3) if found == -1 else found
+        self.resync_bytes += next_offset - offset
+        offset = next_offset
         # Break out of data when not enough
-        if len(data) < 8:
-            return None, data
+        if len(data) - offset < 8:
+            return None, offset
         # Read the length and break if not enough data
-        (data_len,) = struct.unpack_from(">I", data, 4)
-        if len(data) < data_len + 8:
-            return None, data
-        packet = data[8 : data_len + 8]
-        data = data[data_len + 8 :]
-        return packet, data
+        (data_len,) = struct.unpack_from(">I", data, offset + 4)
+        if len(data) - offset < data_len + 8:
+            return None, offset
+        packet = memoryview(data)[offset + 8 : offset + data_len + 8]
+        return packet, offset + data_len + 8
+
+
+class Datagram:
+    """
+    Chunk of data whose boundaries are frame boundaries, e.g. a UDP datagram carrying whole frames. Adapters return
+    these chunks to deframe them on their own rather than as part of the continuous stream. The received data is held
+    as is, rather than copied into a bytes subclass.
+    """
+
+    __slots__ = ["data"]
+
+    def __init__(self, data):
+        """
+        Wraps the data of a datagram
+
+        :param data: bytes-like data received
+        """
+        self.data = data
+
+    def __len__(self):
+        """ Size of the datagram """
+        return len(self.data)
+
+    @staticmethod
+    def unwrap(chunk):
+        """
+        Gets the data of a chunk, whether a Datagram or bytes-like data
+
+        :param chunk: chunk returned by an adapter
+        :return: bytes-like data of the chunk
+        """
+        return chunk.data if isinstance(chunk, Datagram) else chunk
+
+
+class Timestamped(bytes):
+    """
+    Bytes carrying the time they were received at, as seconds since the epoch. Adapters return timestamped chunks such
+    that the frames deframed from them carry the receive time of their last byte.
+    """
+
+    def __new__(cls, data, time):
+        """
+        Constructs the timestamped bytes
+
+        :param data: bytes-like data
+        :param time: receive time of the data
+        """
+        timestamped = super().__new__(cls, data)
+        timestamped.time = time
+        return timestamped
+
+
+class StreamDeframer:
+    """
+    Streaming deframer used to deframe a continuous stream of data. Incoming data is collected in a bytearray buffer
+    with a read cursor such that deframing a stream is linear in the amount of data. Frames are returned as memoryviews
+    into the buffer, avoiding a copy per frame.
+
+    The buffer is compacted (unused data before the cursor dropped) once the cursor passes COMPACT_SIZE. While frames
+    still reference the buffer it cannot be resized, so a new buffer holding only the leftover bytes is allocated
+    instead and the frames keep the old buffer alive.
+    """
+
+    COMPACT_SIZE = 65536
+
+    def __init__(self, deframer):
+        """
+        Constructs a streaming deframer around the given deframer
+
+        :param deframer: FramerDeframer used to find frames in the stream
+        """
+        self.deframer = deframer
+        self.buffer = bytearray()
+        self.cursor = 0
+
+    def deframe(self, data):
+        """
+        Adds data to the stream and deframes all packets now available. Leftover data is kept for the next call.
+
+        :param data: newly received framed data bytes
+        :return: list of packets as memoryviews
+        """
+        return self.deframe_chunks([data])
+
+    def deframe_chunks(self, chunks):
+        """
+        Adds a list of chunks of data to the stream and deframes all packets now available. Chunks are appended to the
+        buffer directly, without first being concatenated together. Datagram chunks are deframed in place instead, their
+        frames returned ahead of the stream's frames. Frames completed by a Timestamped chunk are returned as Timestamped
+        copies carrying that chunk's time.
+
+        :param chunks: list of newly received framed data bytes, in order
+        :return: list of packets as memoryviews
+        """
+        if self.cursor >= StreamDeframer.COMPACT_SIZE or self.cursor == len(
+            self.buffer
+        ):
+            self.buffer = self.buffer[self.cursor :]
+            self.cursor = 0
+        packets = []
+        for chunk in chunks:
+            if isinstance(chunk, Datagram):
+                packets.extend(self.deframe_datagram(chunk.data))
+                continue
+            try:
+                self.buffer += chunk
+            # Frames returned from previous calls still reference the buffer, start a new buffer from the leftover bytes
+            except BufferError:
+                self.buffer = self.buffer[self.cursor :] + chunk
+                self.cursor = 0
+            if isinstance(chunk, Timestamped):
+                packets.extend(
+                    Timestamped(packet, chunk.time)
+                    for packet in self.deframe_available()
+                )
+        packets.extend(self.deframe_available())
+        return packets
+
+    def deframe_available(self):
+        """
+        Deframes all packets available in the buffer
+
+        :return: list of packets as memoryviews
+        """
+        packets = []
+        while True:
+            packet, self.cursor = self.deframer.deframe_at(self.buffer, self.cursor)
+            if packet is None:
+                return packets
+            packets.append(packet)
+
+    def deframe_datagram(self, datagram):
+        """
+        Deframes the frames held in a datagram. Frames start at the beginning of the datagram, so no search for a start
+        token is needed unless the datagram is corrupted. Bytes left after the last whole frame are dropped as frames
+        never span datagrams.
+
+        :param datagram: datagram bytes
+        :return: list of packets as memoryviews into the datagram
+        """
+        packets = []
+        offset = 0
+        while offset < len(datagram):
+            packet, offset = self.deframer.deframe_at(datagram, offset)
+            if packet is None:
+                break
+            packets.append(packet)
+        return packets
+
+    def leftover(self):
+        """
+        Gets the data received but not yet deframed
+
+        :return: leftover bytes
+        """
+        return bytes(self.buffer[self.cursor :])
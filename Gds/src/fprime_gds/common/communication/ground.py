@@ -99,8 +99,17 @@ class TCPGround(GroundHandler):
         """
         Send all packets out to the tcp socket server. This adds the framing data for the TCP Server.
 
-        :param packet: bytes object of data to write out to the socket server
-        """
-        for packet in frames:
-            framed = self.deframer.frame(packet)
-            self.tcp.write(framed)
+        The headers of all frames are packed into one buffer, and the headers and packets are written together with a
+        scatter/gather write such that packets (e.g. memoryviews from the deframer) are never copied.
+
+        :param frames: list of bytes-like packets to write out to the socket server
+        """
+        header_size = TcpServerFramerDeframer.HEADER.size
+        headers = memoryview(bytearray(header_size * len(frames)))
+        buffers = []
+        for index, packet in enumerate(frames):
+            offset = index * header_size
+            self.deframer.frame_header_into(headers, offset, len(packet))
+            buffers.append(headers[offset : offset + header_size])
+            buffers.append(packet)
+        self.tcp.write_all(buffers)
@@ -0,0 +1,273 @@
+"""
+metrics.py:
+
+Link statistics of the comm layer. Components of the comm layer already report their counters through "get_stats"
+functions returning dictionaries of numbers. A MetricsRegistry collects these functions as named sources, declaring which
+of their values are monotonic counters (e.g. frames received) and treating all others as gauges (e.g. queue depths).
+Registered statistics are exposed as a periodic log line, Prometheus text and JSON by:
+
+1. MetricsReporter: a thread logging every statistic periodically, counters as per-second rates
+2. MetricsServer: a local HTTP server with the statistics as Prometheus text on /metrics and as JSON on /metrics.json
+
+@date Created October 16, 2026
+"""
+import collections
+import http.server
+import json
+import logging
+import re
+import socketserver
+import threading
+import time
+
+LOGGER = logging.getLogger("metrics")
+
+PROMETHEUS_PREFIX = "fprime_comm"
+
+
+class MetricsRegistry:
+    """
+    Registry of named statistics sources. Rates of counters are computed between the two latest calls to sample, which
+    the MetricsReporter makes periodically.
+    """
+
+    def __init__(self):
+        """ Constructs an empty registry """
+        self.__sources = collections.OrderedDict()
+        self.__lock = threading.Lock()
+        self.__sample = None
+        self.__rates = {}
+
+    def register(self, name, source, counters=()):
+        """
+        Registers a source of statistics, replacing any source of the same name
+
+        :param name: name of the source, prefixing its statistics
+        :param source: function taking no arguments and returning a dictionary of statistic name to number
+        :param counters: names of the statistics of this source that are monotonic counters
+        """
+        with self.__lock:
+            self.__sources[name] = (source, set(counters))
+
+    def unregister(self, name):
+        """
+        Removes a source of statistics
+
+        :param name: name of the source
+        """
+        with self.__lock:
+            self.__sources.pop(name, None)
+
+    def collect(self):
+        """
+        Collects the current value of every statistic
+
+        :return: ordered dictionary of source name to a dictionary with "counters" and "gauges" dictionaries
+        """
+        with self.__lock:
+            sources = list(self.__sources.items())
+        collected = collections.OrderedDict()
+        for name, (source, counters) in sources:
+            try:
+                stats = source()
+            except Exception as exc:
+                LOGGER.warning("Failed to collect %s statistics: %s", name, exc)
+                continue
+            collected[name] = {
+                "counters": {
+                    key: value for key, value in stats.items() if key in counters
+                },
+                "gauges": {
+                    key: value for key, value in stats.items() if key not in counters
+                },
+            }
+        return collected
+
+    def sample(self):
+        """
+        Collects the statistics and updates the rates of counters since the previous sample
+
+        :return: collected statistics, as returned by collect
+        """
+        now = time.monotonic()
+        collected = self.collect()
+        rates = {}
+        if self.__sample is not None:
+            then, previous = self.__sample
+            elapsed = max(now - then, 1e-9)
+            for name, stats in collected.items():
+                before = previous.get(name, {}).get("counters", {})
+                rates[name] = {
+                    key: (value - before.get(key, 0)) / elapsed
+                    for key, value in stats["counters"].items()
+                }
+        self.__sample = (now, collected)
+        self.__rates = rates
+        return collected
+
+    def get_rates(self):
+        """
+        Gets the per-second rates of the counters between the two latest samples
+
+        :return: dictionary of source name to dictionary of counter name to rate, empty before the second sample
+        """
+        return self.__rates
+
+    def to_json(self):
+        """
+        Dumps the current statistics and latest rates as JSON
+
+        :return: JSON string
+        """
+        collected = self.collect()
+        rates = self.get_rates()
+        for name, stats in collected.items():
+            stats["rates"] = rates.get(name, {})
+        return json.dumps(collected)
+
+    def to_prometheus(self):
+        """
+        Dumps the current statistics in the Prometheus text exposition format. Counters are suffixed with "_total", and
+        rates are left to Prometheus to compute.
+
+        :return: Prometheus text
+        """
+        lines = []
+        for name, stats in self.collect().items():
+            for kind, metric_type, suffix in [
+                ("counters", "counter", "_total"),
+                ("gauges", "gauge", ""),
+            ]:
+                for key, value in stats[kind].items():
+                    metric = re.sub(
+                        "[^a-zA-Z0-9_]",
+                        "_",
+                        "{}_{}_{}{}".format(PROMETHEUS_PREFIX, name, key, suffix),
+                    )
+                    lines.append("# TYPE {} {}".format(metric, metric_type))
+                    lines.append("{} {}".format(metric, float(value)))
+        return "\n".join(lines) + "\n"
+
+    def format_line(self):
+        """
+        Formats the latest sample as a single log line, counters as rates and gauges as values
+
+        :return: log line
+        """
+        if self.__sample is None:
+            return ""
+        rates = self.get_rates()
+        parts = []
+        for name, stats in self.__sample[1].items():
+            values = [
+                "{} {:.1f}/s".format(key, rate)
+                for key, rate in rates.get(name, {}).items()
+            ]
+            values.extend(
+                "{} {}".format(
+                    key, round(value, 6) if isinstance(value, float) else value
+                )
+                for key, value in stats["gauges"].items()
+            )
+            parts.append("{}: {}".format(name, ", ".join(values)))
+        return "; ".join(parts)
+
+
+class MetricsReporter:
+    """ Thread periodically sampling a registry and logging its statistics """
+
+    def __init__(self, registry, interval, logger=LOGGER):
+        """
+        Constructs the reporter, call start to run it
+
+        :param registry: MetricsRegistry to report
+        :param interval: seconds between two log lines
+        :param logger: logger the statistics are logged to
+        """
+        self.registry = registry
+        self.interval = interval
+        self.logger = logger
+        self.stopped = threading.Event()
+        self.thread = None
+
+    def start(self):
+        """ Starts the reporting thread """
+        self.registry.sample()
+        self.thread = threading.Thread(target=self.run)
+        self.thread.daemon = True
+        self.thread.start()
+
+    def run(self):
+        """ Reporting thread function """
+        while not self.stopped.wait(self.interval):
+            self.registry.sample()
+            self.logger.info("Link statistics: %s", self.registry.format_line())
+
+    def stop(self):
+        """ Stops the reporting thread """
+        self.stopped.set()
+        if self.thread is not None:
+            self.thread.join()
+            self.thread = None
+
+
+class ThreadingHTTPServer(socketserver.ThreadingMixIn, http.server.HTTPServer):
+    """ HTTP server handling each request in a daemon thread """
+
+    daemon_threads = True
+
+
+class MetricsServer:
+    """ Local HTTP server exposing a registry as Prometheus text on /metrics and as JSON on /metrics.json """
+
+    def __init__(self, registry, address="127.0.0.1", port=0):
+        """
+        Binds the server, call start to serve requests
+
+        :param registry: MetricsRegistry to expose
+        :param address: address to serve on, local by default
+        :param port: port to serve on, 0 picks a free port
+        """
+        self.registry = registry
+
+        class Handler(http.server.BaseHTTPRequestHandler):
+            """ Answers metrics requests """
+
+            def do_GET(self):
+                """ Answers a metrics request """
+                if self.path == "/metrics":
+                    body = registry.to_prometheus()
+                    content_type = "text/plain; version=0.0.4"
+                elif self.path == "/metrics.json":
+                    body = registry.to_json()
+                    content_type = "application/json"
+                else:
+                    self.send_error(404)
+                    return
+                body = body.encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *_):
+                """ Requests are not logged """
+
+        self.server = ThreadingHTTPServer((address, port), Handler)
+        self.port = self.server.server_address[1]
+        self.thread = None
+
+    def start(self):
+        """ Starts serving requests in a daemon thread """
+        self.thread = threading.Thread(target=self.server.serve_forever)
+        self.thread.daemon = True
+        self.thread.start()
+
+    def stop(self):
+        """ Stops serving requests and closes the server """
+        self.server.shutdown()
+        self.server.server_close()
+        if self.thread is not None:
+            self.thread.join()
+            self.thread = None
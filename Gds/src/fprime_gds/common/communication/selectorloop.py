@@ -0,0 +1,422 @@
+"""
+selectorloop.py:
+
+Single-threaded backend of the comm layer for the IP adapter. Rather than a thread per socket and per pipeline stage,
+handing data off through queues polled with timeouts, one selector loop multiplexes the sockets of the IP adapter (the
+TCP server, its connected FSW client and the UDP server), the socket connected to the ground TcpServer and the timers
+driving the keepalive and the ground reconnection.
+
+Data is handled as soon as its socket is readable. Downlink data is deframed and written straight to the ground socket,
+and uplink data is framed and written straight to the FSW socket. Writes never block the loop: bytes that cannot be
+sent right away are kept per connection and sent once the socket is writable again. When more than MAXIMUM_BACKLOG
+bytes are waiting on the ground connection, newly downlinked frames are dropped and counted. Likewise, when more than
+MAXIMUM_UPLINK_BACKLOG bytes are waiting on the FSW connection, newly uplinked packets fail and are counted. As with the
+threaded Uplinker, the handshake of an uplinked packet is only looped back to the ground once its frame was written.
+
+@date Created October 16, 2026
+"""
+import heapq
+import logging
+import os
+import selectors
+import socket
+import time
+
+from fprime_gds.common.communication.adapters.ip import IpAdapter, IpHandler, UdpHandler
+from fprime_gds.common.communication.framing import (
+    Datagram,
+    StreamDeframer,
+    TcpServerFramerDeframer,
+)
+from fprime_gds.common.communication.updown import Uplinker
+
+LOGGER = logging.getLogger("selector_loop")
+
+BACKENDS = ["threads", "selector"]
+
+
+class Connection:
+    """ Non-blocking socket with the bytes waiting to be written to it """
+
+    def __init__(self, loop, sock, on_read, on_lost, maximum_pending):
+        """
+        Registers the socket with the loop's selector
+
+        :param loop: SelectorLoop owning this connection
+        :param sock: connected non-blocking socket
+        :param on_read: function called when the socket is readable
+        :param on_lost: function called once the connection is lost
+        :param maximum_pending: bytes waiting to be written past which writes are refused
+        """
+        self.loop = loop
+        self.sock = sock
+        self.on_read = on_read
+        self.on_lost = on_lost
+        self.maximum_pending = maximum_pending
+        self.pending = bytearray()
+        self.loop.selector.register(sock, selectors.EVENT_READ, self.handle)
+
+    def handle(self, mask):
+        """ Handles the selector events of this connection """
+        # Events already selected for a connection closed by an earlier event of the same select call
+        if self.sock is None:
+            return
+        if mask & selectors.EVENT_WRITE:
+            self.flush()
+        if mask & selectors.EVENT_READ and self.sock is not None:
+            self.on_read()
+
+    def write(self, data):
+        """
+        Writes data to the socket, keeping what could not be sent for when the socket is writable
+
+        :param data: bytes to write
+        :return: True when the data was sent or kept for sending, False when the connection is closed, failed or has
+                 more than maximum_pending bytes waiting
+        """
+        if self.sock is None or len(self.pending) > self.maximum_pending:
+            return False
+        if not self.pending:
+            try:
+                sent = self.sock.send(data)
+            except BlockingIOError:
+                sent = 0
+            except OSError as exc:
+                self.lost(exc)
+                return False
+            if sent == len(data):
+                return True
+            data = memoryview(data)[sent:]
+            self.loop.selector.modify(
+                self.sock, selectors.EVENT_READ | selectors.EVENT_WRITE, self.handle
+            )
+        self.pending += data
+        return True
+
+    def flush(self):
+        """ Sends the bytes waiting to be written """
+        try:
+            sent = self.sock.send(self.pending)
+        except BlockingIOError:
+            return
+        except OSError as exc:
+            self.lost(exc)
+            return
+        del self.pending[:sent]
+        if not self.pending:
+            self.loop.selector.modify(self.sock, selectors.EVENT_READ, self.handle)
+
+    def read(self, buffer):
+        """
+        Receives into buffer, handling the loss of the connection
+
+        :param buffer: buffer to receive into
+        :return: number of bytes received, 0 when nothing was received
+        """
+        try:
+            count = self.sock.recv_into(buffer)
+        except BlockingIOError:
+            return 0
+        except OSError as exc:
+            self.lost(exc)
+            return 0
+        if count == 0:
+            self.lost(None)
+        return count
+
+    def lost(self, exc):
+        """
+        Closes the connection after it was lost, and lets the loop know
+
+        :param exc: error that caused the loss, None when the peer closed the connection
+        """
+        if exc is not None:
+            LOGGER.warning("Connection failure: %s: %s", type(exc).__name__, str(exc))
+        self.close()
+        self.on_lost()
+
+    def close(self):
+        """ Unregisters and closes the socket """
+        if self.sock is not None:
+            self.loop.selector.unregister(self.sock)
+            IpHandler.kill_socket(self.sock)
+            self.sock = None
+
+
+class SelectorLoop:
+    """
+    Runs the uplink and downlink of the comm layer for the IP adapter in a single selector loop. This listens for FSW on
+    the same TCP and UDP address and port as the IpAdapter, and connects to the ground TcpServer as TCPGround does.
+    """
+
+    # Maximum bytes waiting on the ground connection before downlinked frames are dropped
+    MAXIMUM_BACKLOG = 64 * 1024 * 1024
+    # Maximum bytes waiting on the FSW connection before uplinked packets fail
+    MAXIMUM_UPLINK_BACKLOG = 1024 * 1024
+    # Statistics of get_stats that are monotonic counters
+    COUNTERS = [
+        "bytes_in",
+        "frames_down",
+        "frames_up",
+        "dropped",
+        "uplink_failed",
+        "resync_bytes",
+        "checksum_failures",
+    ]
+
+    def __init__(
+        self, address, port, ground_address, ground_port, framer, udp_mode="stream"
+    ):
+        """
+        Sets up the loop, no sockets are opened until run is called
+
+        :param address: address of the TCP and UDP servers FSW connects to
+        :param port: port of the TCP and UDP servers FSW connects to
+        :param ground_address: address of the ground TcpServer
+        :param ground_port: port of the ground TcpServer
+        :param framer: framer/deframer of the FSW communication format
+        :param udp_mode: one of IpAdapter.UDP_MODES
+        """
+        if udp_mode not in IpAdapter.UDP_MODES:
+            raise ValueError("Invalid UDP mode of {}".format(udp_mode))
+        self.address = (address, port)
+        self.ground_address = (ground_address, ground_port)
+        self.framer = framer
+        self.chunk_type = Datagram if udp_mode == "datagram" else bytes
+        self.stream = StreamDeframer(framer)
+        self.ground_framer = TcpServerFramerDeframer()
+        self.ground_stream = StreamDeframer(self.ground_framer)
+        self.buffer = memoryview(bytearray(IpAdapter.MAXIMUM_DATA_SIZE))
+        self.selector = selectors.DefaultSelector()
+        self.timers = []
+        self.timer_count = 0
+        self.running = True
+        self.server = None
+        self.udp = None
+        self.fsw = None
+        self.ground = None
+        self.ground_connected = False
+        self.wake_reader, self.wake_writer = socket.socketpair()
+        self.bytes_in = 0
+        self.frames_down = 0
+        self.frames_up = 0
+        self.dropped = 0
+        self.uplink_failed = 0
+
+    def call_later(self, delay, callback):
+        """
+        Runs callback from the loop after delay seconds
+
+        :param delay: seconds to wait
+        :param callback: function taking no arguments
+        """
+        self.timer_count += 1
+        heapq.heappush(
+            self.timers, (time.monotonic() + delay, self.timer_count, callback)
+        )
+
+    def run_timers(self):
+        """
+        Runs the timers that are due
+
+        :return: seconds until the next timer is due, None without timers
+        """
+        while self.timers and self.timers[0][0] <= time.monotonic():
+            heapq.heappop(self.timers)[2]()
+        return max(self.timers[0][0] - time.monotonic(), 0) if self.timers else None
+
+    def stop(self):
+        """ Stops the loop, safe to call from signal handlers and other threads """
+        self.running = False
+        try:
+            self.wake_writer.send(b"\x00")
+        except OSError:
+            pass
+
+    def run(self):
+        """ Opens the sockets and runs the loop until stopped """
+        self.wake_reader.setblocking(False)
+        self.selector.register(self.wake_reader, selectors.EVENT_READ, self.handle_wake)
+        self.server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self.server.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self.server.bind(self.address)
+        self.server.listen(IpHandler.MAX_CLIENT_BACKLOG)
+        self.server.setblocking(False)
+        self.selector.register(self.server, selectors.EVENT_READ, self.handle_accept)
+        self.udp = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.udp.bind(self.address)
+        self.udp.setblocking(False)
+        self.selector.register(self.udp, selectors.EVENT_READ, self.handle_datagrams)
+        self.connect_ground()
+        if IpAdapter.KEEPALIVE_INTERVAL is not None:
+            self.call_later(IpAdapter.KEEPALIVE_INTERVAL, self.keepalive)
+        try:
+            while self.running:
+                timeout = self.run_timers()
+                for key, mask in self.selector.select(timeout):
+                    key.data(mask)
+        finally:
+            self.close()
+
+    def close(self):
+        """ Closes every socket of the loop """
+        for connection in [self.fsw, self.ground]:
+            if connection is not None:
+                connection.close()
+        for sock in [self.server, self.udp, self.wake_reader, self.wake_writer]:
+            if sock is not None:
+                sock.close()
+        self.selector.close()
+
+    def handle_wake(self, _):
+        """ Drains the bytes written by stop """
+        try:
+            self.wake_reader.recv(4096)
+        except BlockingIOError:
+            pass
+
+    def handle_accept(self, _):
+        """ Accepts a FSW connection, replacing any previous one """
+        try:
+            sock, address = self.server.accept()
+        except BlockingIOError:
+            return
+        if self.fsw is not None:
+            self.fsw.close()
+        LOGGER.info("FSW connected from %s:%d", *address)
+        sock.setblocking(False)
+        self.fsw = Connection(
+            self,
+            sock,
+            self.handle_fsw,
+            self.fsw_lost,
+            SelectorLoop.MAXIMUM_UPLINK_BACKLOG,
+        )
+
+    def fsw_lost(self):
+        """ Forgets the lost FSW connection, FSW may reconnect to the server """
+        self.fsw = None
+
+    def handle_fsw(self):
+        """ Reads and deframes FSW data, sending the frames to the ground """
+        count = self.fsw.read(self.buffer)
+        self.bytes_in += count
+        if count:
+            self.downlink(self.stream.deframe_chunks([bytes(self.buffer[:count])]))
+
+    def handle_datagrams(self, _):
+        """ Reads the datagrams waiting on the UDP socket, and sends their frames to the ground """
+        chunks = []
+        try:
+            while len(chunks) < UdpHandler.MAXIMUM_BATCH:
+                data, _ = self.udp.recvfrom(IpAdapter.MAXIMUM_DATA_SIZE)
+                chunks.append(self.chunk_type(data))
+                self.bytes_in += len(data)
+        except OSError:
+            pass
+        self.downlink(self.stream.deframe_chunks(chunks))
+
+    def downlink(self, frames):
+        """
+        Frames packets in the ground format and writes them to the ground connection
+
+        :param frames: list of downlinked packets
+        """
+        if not frames:
+            return
+        self.frames_down += len(frames)
+        if not self.ground_connected or not self.ground.write(
+            b"".join(self.ground_framer.frame(frame) for frame in frames)
+        ):
+            self.dropped += len(frames)
+
+    def connect_ground(self):
+        """ Starts a non-blocking connection to the ground TcpServer """
+        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        sock.setblocking(False)
+        sock.connect_ex(self.ground_address)
+        self.ground = Connection(
+            self,
+            sock,
+            self.handle_ground,
+            self.ground_lost,
+            SelectorLoop.MAXIMUM_BACKLOG,
+        )
+        self.selector.modify(sock, selectors.EVENT_WRITE, self.handle_ground_connect)
+
+    def handle_ground_connect(self, _):
+        """ Completes the connection to the ground, registering as FSW """
+        error = self.ground.sock.getsockopt(socket.SOL_SOCKET, socket.SO_ERROR)
+        if error:
+            LOGGER.warning(
+                "Failed to connect to ground at %s:%d, retrying: %s",
+                self.ground_address[0],
+                self.ground_address[1],
+                os.strerror(error),
+            )
+            self.ground.close()
+            self.ground_lost()
+            return
+        LOGGER.info("Connected to ground at %s:%d", *self.ground_address)
+        self.selector.modify(self.ground.sock, selectors.EVENT_READ, self.ground.handle)
+        self.ground_connected = True
+        self.ground.write(b"Register FSW\n")
+
+    def ground_lost(self):
+        """ Forgets the lost ground connection and schedules a reconnection """
+        self.ground = None
+        self.ground_connected = False
+        if self.running:
+            self.call_later(IpHandler.ERROR_RETRY_INTERVAL, self.connect_ground)
+
+    def handle_ground(self):
+        """ Reads uplink packets from the ground, framing them and writing them to FSW """
+        count = self.ground.read(self.buffer)
+        if not count:
+            return
+        for packet in self.ground_stream.deframe_chunks([bytes(self.buffer[:count])]):
+            self.uplink(bytes(packet))
+
+    def uplink(self, packet):
+        """
+        Frames a packet and writes it to FSW, looping back the handshake to the ground once written
+
+        :param packet: uplinked packet
+        """
+        if not packet:
+            return
+        framed = self.framer.frame(packet)
+        if self.fsw is None or not self.fsw.write(framed):
+            self.uplink_failed += 1
+            LOGGER.warning("Uplink failed to send %d bytes of data", len(framed))
+            return
+        self.frames_up += 1
+        self.downlink([Uplinker.get_handshake(packet)])
+
+    def keepalive(self):
+        """ Sends the keepalive packet to FSW and schedules the next one """
+        if self.fsw is not None:
+            self.fsw.write(IpAdapter.KEEPALIVE_DATA)
+        self.call_later(IpAdapter.KEEPALIVE_INTERVAL, self.keepalive)
+
+    def get_stats(self):
+        """
+        Gets the counters of the loop
+
+        :return: dictionary of bytes and frames downlinked, frames uplinked, dropped downlink frames, failed uplinks,
+                 bytes discarded and checksum failures of the deframer, and bytes waiting on the ground and FSW
+                 connections
+        """
+        return {
+            "bytes_in": self.bytes_in,
+            "frames_down": self.frames_down,
+            "frames_up": self.frames_up,
+            "dropped": self.dropped,
+            "uplink_failed": self.uplink_failed,
+            "resync_bytes": self.framer.resync_bytes,
+            "checksum_failures": self.framer.checksum_failures,
+            "ground_backlog": len(self.ground.pending)
+            if self.ground is not None
+            else 0,
+            "uplink_backlog": len(self.fsw.pending) if self.fsw is not None else 0,
+        }
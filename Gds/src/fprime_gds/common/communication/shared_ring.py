@@ -0,0 +1,162 @@
+"""
+shared_ring.py:
+
+Shared-memory ring buffer used to fan out the downlink stream to any number of consumers on the same host. A single
+writer (the middleware layer) appends length-prefixed messages into the ring once, and each reader follows the ring with
+its own cursor. Readers never block the writer: a reader falling more than the ring's capacity behind loses the
+overwritten messages, which is detected and counted rather than delivered corrupted.
+
+The shared memory block starts with a header holding two absolute byte counters: "reserved" is advanced before the
+writer touches the ring and "committed" once the message is complete. Readers consume up to "committed" and then check
+"reserved" to discard any message overwritten while it was being copied out.
+
+Requires Python 3.8+ for multiprocessing.shared_memory.
+
+@date Created October 16, 2026
+"""
+import struct
+
+try:
+    from multiprocessing import resource_tracker, shared_memory
+except ImportError:
+    resource_tracker = None
+    shared_memory = None
+
+# Header: magic, capacity, reserved counter, committed counter
+HEADER_STRUCT = struct.Struct("<IIQQ")
+HEADER_SIZE = 64
+MAGIC = 0x46505247
+LENGTH_STRUCT = struct.Struct("<I")
+# Length marking the unused end of the ring, the next message starts back at the beginning of the ring
+PADDING = 0xFFFFFFFF
+RESERVED_OFFSET = 8
+COMMITTED_OFFSET = 16
+COUNTER_STRUCT = struct.Struct("<Q")
+DEFAULT_RING_SIZE = 64 * 1024 * 1024
+
+
+def check_available():
+    """ Raises an error when shared memory is not supported by this python """
+    if shared_memory is None:
+        raise NotImplementedError(
+            "Shared memory transport requires python 3.8 or newer"
+        )
+
+
+class SharedRingWriter:
+    """ Writes messages into a shared-memory ring, creating the ring """
+
+    def __init__(self, name, size=DEFAULT_RING_SIZE):
+        """
+        Creates the shared memory ring
+
+        :param name: name of the shared memory block, used by readers to attach
+        :param size: total size of the shared memory block in bytes
+        """
+        check_available()
+        self.memory = shared_memory.SharedMemory(name=name, create=True, size=size)
+        self.capacity = size - HEADER_SIZE
+        self.committed = 0
+        HEADER_STRUCT.pack_into(self.memory.buf, 0, MAGIC, self.capacity, 0, 0)
+
+    def write(self, msg):
+        """
+        Appends a message to the ring
+
+        :param msg: bytes of the message
+        """
+        record_size = LENGTH_STRUCT.size + len(msg)
+        if record_size > self.capacity:
+            raise ValueError(
+                "Message of {} bytes does not fit in the ring".format(len(msg))
+            )
+        buffer = self.memory.buf
+        position = self.committed % self.capacity
+        padding = 0
+        # Messages are contiguous, skip the end of the ring when the message does not fit there
+        if position + record_size > self.capacity:
+            padding = self.capacity - position
+        COUNTER_STRUCT.pack_into(
+            buffer, RESERVED_OFFSET, self.committed + padding + record_size
+        )
+        if padding:
+            if padding >= LENGTH_STRUCT.size:
+                LENGTH_STRUCT.pack_into(buffer, HEADER_SIZE + position, PADDING)
+            position = 0
+        start = HEADER_SIZE + position
+        LENGTH_STRUCT.pack_into(buffer, start, len(msg))
+        buffer[start + LENGTH_STRUCT.size : start + record_size] = msg
+        self.committed += padding + record_size
+        COUNTER_STRUCT.pack_into(buffer, COMMITTED_OFFSET, self.committed)
+
+    def close(self):
+        """ Closes and removes the shared memory ring """
+        self.memory.close()
+        self.memory.unlink()
+
+
+class SharedRingReader:
+    """ Reads messages from a shared-memory ring created by a SharedRingWriter, following it with its own cursor """
+
+    def __init__(self, name):
+        """
+        Attaches to the shared memory ring. Reading starts with the next message written.
+
+        :param name: name of the shared memory block
+        """
+        check_available()
+        self.memory = shared_memory.SharedMemory(name=name)
+        # Readers do not own the block, stop the resource tracker from removing it when this process exits
+        resource_tracker.unregister(self.memory._name, "shared_memory")
+        magic, self.capacity, _, self.cursor = HEADER_STRUCT.unpack_from(
+            self.memory.buf, 0
+        )
+        if magic != MAGIC:
+            self.memory.close()
+            raise ValueError("Shared memory {} is not a ring buffer".format(name))
+        self.lost_bytes = 0
+        self.overruns = 0
+
+    def __lose(self, cursor):
+        """ Skips the reader ahead to cursor, counting the messages behind it as lost """
+        self.lost_bytes += cursor - self.cursor
+        self.overruns += 1
+        self.cursor = cursor
+
+    def read(self):
+        """
+        Reads all messages written since the last read
+
+        :return: list of messages, as bytes
+        """
+        buffer = self.memory.buf
+        committed = COUNTER_STRUCT.unpack_from(buffer, COMMITTED_OFFSET)[0]
+        if committed - self.cursor > self.capacity:
+            self.__lose(committed)
+        msgs = []
+        cursor = self.cursor
+        while cursor < committed:
+            position = cursor % self.capacity
+            if self.capacity - position < LENGTH_STRUCT.size:
+                cursor += self.capacity - position
+                continue
+            start = HEADER_SIZE + position
+            length = LENGTH_STRUCT.unpack_from(buffer, start)[0]
+            if length == PADDING:
+                cursor += self.capacity - position
+                continue
+            start += LENGTH_STRUCT.size
+            msgs.append((cursor, bytes(buffer[start : start + length])))
+            cursor += LENGTH_STRUCT.size + length
+        # Messages starting before this point may have been overwritten while being copied
+        oldest = COUNTER_STRUCT.unpack_from(buffer, RESERVED_OFFSET)[0] - self.capacity
+        if msgs and msgs[0][0] < oldest:
+            valid = [msg for msg in msgs if msg[0] >= oldest]
+            self.__lose(valid[0][0] if valid else cursor)
+            msgs = valid
+        self.cursor = cursor
+        return [msg for _, msg in msgs]
+
+    def close(self):
+        """ Detaches from the shared memory ring """
+        self.memory.close()
@@ -1,28 +1,165 @@
 """ Uplink and Downlink handling for communications layer
 
 Downlink needs to happen in several stages. First, raw data is read from the adapter. This data is collected in a pool
-and the pool is passed to a deframer that extracts frames from this pool. Frames are queued and sent to the ground
+by a streaming deframer that extracts frames from this pool. Frames are queued and sent to the ground
 side where they are and passed into the ground side handler and onto the other GDS processes. Downlink handles multiple
-streams of data the FSW downlink, and loopback data from the uplink adapter.
+streams of data the FSW downlink, and loopback data from the uplink adapter. Frames move between the stages in batches
+through a bounded FrameQueue, whose overflow policy decides what happens when the ground side cannot keep up. Frames
+carrying their receive time (see framing.Timestamped) are used to measure the latency from receipt to the ground side.
 
 Uplink is the reverse, it pulls data in from the ground handler, frames it, and sends it up to the waiting FSW. Uplink
-is represented by a single thread, as it is not dealing with multiple streams of data that need to be multiplexed.
+is represented by a single thread, as it is not dealing with multiple streams of data that need to be multiplexed. When
+a batch size is configured, the frames of pending packets are joined into buffers of up to that size and each buffer is
+written at once.
 
 """
+import collections
 import threading
-from queue import Queue, Full, Empty
 import logging
+import time
 
 from fprime.common.models.serialize.numerical_types import U32Type
 from fprime_gds.common.utils.data_desc_type import DataDescType
 from fprime_gds.common.communication.adapters.base import BaseAdapter
 from fprime_gds.common.communication.ground import GroundHandler
-from fprime_gds.common.communication.framing import FramerDeframer
+from fprime_gds.common.communication.framing import (
+    FramerDeframer,
+    StreamDeframer,
+    Timestamped,
+)
 
 
 DW_LOGGER = logging.getLogger("downlink")
 UP_LOGGER = logging.getLogger("uplink")
 
+# Policies applied by a FrameQueue when full
+OVERFLOW_POLICIES = ["drop-newest", "drop-oldest", "block"]
+DEFAULT_QUEUE_SIZE = 65536
+# Serialized descriptor heading every handshake packet
+HANDSHAKE_HEADER = U32Type(DataDescType["FW_PACKET_HAND"].value).serialize()
+
+
+class FrameQueue:
+    """Bounded queue moving batches of frames between pipeline stages
+
+    Producers put lists of frames and consumers take every queued frame at once, such that locking and wake-ups happen
+    once per batch rather than once per frame. When the queue is full the overflow policy applies:
+
+    1. drop-newest: incoming frames are dropped
+    2. drop-oldest: the oldest queued frames are dropped to make room
+    3. block: the producer waits for room, dropping frames only once its timeout expires
+
+    Counters of frames in, frames out, dropped frames and the high-water mark of the queue are kept to size the queue.
+    """
+
+    def __init__(self, size=DEFAULT_QUEUE_SIZE, policy="drop-newest"):
+        """Constructs the queue
+
+        Args:
+            size: maximum number of queued frames
+            policy: one of OVERFLOW_POLICIES
+        """
+        if policy not in OVERFLOW_POLICIES:
+            raise ValueError(
+                "Unknown overflow policy {}, expected one of {}".format(
+                    policy, OVERFLOW_POLICIES
+                )
+            )
+        self.size = size
+        self.policy = policy
+        self.frames_in = 0
+        self.frames_out = 0
+        self.dropped = 0
+        self.high_water = 0
+        self.__frames = collections.deque()
+        self.__condition = threading.Condition()
+
+    def __len__(self):
+        """ Number of queued frames """
+        return len(self.__frames)
+
+    def put_all(self, frames, timeout=None):
+        """Queues a batch of frames applying the overflow policy
+
+        Args:
+            frames: list of frames to queue
+            timeout: maximum seconds the block policy waits for room, None waits forever
+
+        Returns:
+            number of frames dropped
+        """
+        if not frames:
+            return 0
+        with self.__condition:
+            self.frames_in += len(frames)
+            room = self.size - len(self.__frames)
+            if self.policy == "block":
+                # One deadline bounds the wait of the whole batch
+                deadline = None if timeout is None else time.monotonic() + timeout
+                dropped = 0
+                for index, frame in enumerate(frames):
+                    if len(self.__frames) >= self.size:
+                        remaining = None
+                        if deadline is not None:
+                            remaining = max(deadline - time.monotonic(), 0)
+                        if not self.__condition.wait_for(
+                            lambda: len(self.__frames) < self.size, remaining
+                        ):
+                            # Still full at the deadline, the rest of the batch is dropped
+                            dropped = len(frames) - index
+                            break
+                    self.__frames.append(frame)
+                    self.high_water = max(self.high_water, len(self.__frames))
+                    self.__condition.notify_all()
+                self.dropped += dropped
+                return dropped
+            if self.policy == "drop-newest":
+                dropped = max(len(frames) - room, 0)
+                self.__frames.extend(frames[: len(frames) - dropped])
+            else:
+                dropped = max(len(frames) - room, 0)
+                for _ in range(min(dropped, len(self.__frames))):
+                    self.__frames.popleft()
+                self.__frames.extend(frames[-self.size :])
+            self.dropped += dropped
+            self.high_water = max(self.high_water, len(self.__frames))
+            self.__condition.notify_all()
+            return dropped
+
+    def get_all(self, timeout=None):
+        """Takes every queued frame, waiting for at least one
+
+        Args:
+            timeout: maximum seconds to wait for a frame, None waits forever
+
+        Returns:
+            list of frames, empty when the timeout expired
+        """
+        with self.__condition:
+            if not self.__frames:
+                self.__condition.wait_for(lambda: self.__frames, timeout)
+            frames = list(self.__frames)
+            self.__frames.clear()
+            self.frames_out += len(frames)
+            self.__condition.notify_all()
+            return frames
+
+    def get_stats(self):
+        """Gets the counters of this queue
+
+        Returns:
+            dictionary of the counters and current depth of the queue
+        """
+        with self.__condition:
+            return {
+                "frames_in": self.frames_in,
+                "frames_out": self.frames_out,
+                "dropped": self.dropped,
+                "depth": len(self.__frames),
+                "high_water": self.high_water,
+                "size": self.size,
+            }
+
 
 class Downlinker:
     """Encapsulates communication downlink functions
@@ -35,8 +172,27 @@ class Downlinker:
     waiting for data.
     """
 
+    # Statistics of get_stats that are monotonic counters
+    COUNTERS = [
+        "frames_in",
+        "frames_out",
+        "dropped",
+        "reads",
+        "chunks",
+        "bytes_in",
+        "resync_bytes",
+        "checksum_failures",
+        "timed_frames",
+    ]
+
     def __init__(
-        self, adapter: BaseAdapter, ground: GroundHandler, deframer: FramerDeframer
+        self,
+        adapter: BaseAdapter,
+        ground: GroundHandler,
+        deframer: FramerDeframer,
+        queue_size: int = DEFAULT_QUEUE_SIZE,
+        overflow_policy: str = "drop-newest",
+        recorder=None,
     ):
         """Initialize the downlinker
 
@@ -46,6 +202,9 @@ class Downlinker:
             adapter: adapter used to read raw data from the hardware connection
             ground: handles the ground side connection
             deframer: deframer used to deframe data from the communication format
+            queue_size: maximum number of frames queued for the ground side
+            overflow_policy: one of OVERFLOW_POLICIES applied when the ground side cannot keep up
+            recorder: optional recorder of the chunks read from the adapter, see adapters.replay.LinkRecorder
         """
         self.running = True
         self.th_ground = None
@@ -53,7 +212,17 @@ class Downlinker:
         self.adapter = adapter
         self.ground = ground
         self.deframer = deframer
-        self.outgoing = Queue()
+        self.stream = StreamDeframer(deframer)
+        self.outgoing = FrameQueue(queue_size, overflow_policy)
+        self.recorder = recorder
+        self.reads = 0
+        self.chunks = 0
+        self.bytes_in = 0
+        self.read_size_max = 0
+        self.timed_frames = 0
+        self.latency_last = 0.0
+        self.latency_max = 0.0
+        self.latency_total = 0.0
 
     def start(self):
         """ Starts the downlink pipeline """
@@ -67,19 +236,19 @@ class Downlinker:
     def deframing(self):
         """Deframing stage of downlink
 
-        Reads in data from the raw adapter and runs the deframing. Collects data in a pool and continually runs
-        deframing against it where possible. Then appends new frames into the outgoing queue.
+        Reads in data from the raw adapter and runs the deframing. Collects data in the stream deframer's pool and
+        continually runs deframing against it where possible. Then appends new frames into the outgoing queue.
         """
-        pool = b""
         while self.running:
-            # Blocks until data is available, but may still return b"" if timeout
-            pool += self.adapter.read()
-            frames, pool = self.deframer.deframe_all(pool, no_copy=True)
-            try:
-                for frame in frames:
-                    self.outgoing.put_nowait(frame)
-            except Full:
-                DW_LOGGER.warning("GDS ground queue full, dropping frame")
+            # Blocks until data is available, but may still return no chunks if timeout
+            chunks = self.adapter.read_chunks()
+            self.count_reads(chunks)
+            if self.recorder is not None and chunks:
+                self.recorder.record(chunks)
+            frames = self.stream.deframe_chunks(chunks)
+            dropped = self.outgoing.put_all(frames, 0.500)
+            if dropped:
+                DW_LOGGER.warning("GDS ground queue full, dropped %d frames", dropped)
 
     def sending(self):
         """Outgoing stage of downlink
@@ -88,20 +257,74 @@ class Downlinker:
         packets to the rest of the GDS. This uses the ground send_all method.
         """
         while self.running:
-            frames = []
-            try:
-                # Blocking read of at least one frame, then drain the entire queue
-                frames.append(self.outgoing.get(timeout=0.500))
-                while not self.outgoing.empty():
-                    frames.append(self.outgoing.get_nowait())
-            except Empty:
-                pass
-            self.ground.send_all(frames)
+            # Blocking read of at least one frame, draining the entire queue
+            frames = self.outgoing.get_all(timeout=0.500)
+            if frames:
+                self.ground.send_all(frames)
+                self.measure_latency(frames)
+
+    def count_reads(self, chunks):
+        """Counts the reads, chunks and bytes read from the adapter
+
+        Args:
+            chunks: list of chunks returned by one adapter read
+        """
+        if not chunks:
+            return
+        self.reads += 1
+        self.chunks += len(chunks)
+        for chunk in chunks:
+            self.bytes_in += len(chunk)
+            self.read_size_max = max(self.read_size_max, len(chunk))
+
+    def measure_latency(self, frames):
+        """Measures the latency of the frames carrying their receive time
+
+        Args:
+            frames: frames just sent to the ground side
+        """
+        now = time.time()
+        for frame in frames:
+            if isinstance(frame, Timestamped):
+                self.latency_last = now - frame.time
+                self.latency_max = max(self.latency_max, self.latency_last)
+                self.latency_total += self.latency_last
+                self.timed_frames += 1
 
     def stop(self):
         """ Stop the thread depends will close the ground resource which may be blocking """
         self.running = False
 
+    def get_stats(self):
+        """Gets the counters of the downlink queue
+
+        Returns:
+            dictionary of frames in, frames out, drops, depth and high-water mark of the outgoing queue, the adapter
+            reads, the bytes discarded and checksum failures of the deframer, and the receipt to ground latency in
+            seconds of timestamped frames
+        """
+        stats = self.outgoing.get_stats()
+        stats.update(
+            {
+                "reads": self.reads,
+                "chunks": self.chunks,
+                "bytes_in": self.bytes_in,
+                "read_size_average": self.bytes_in / self.chunks
+                if self.chunks
+                else 0.0,
+                "read_size_max": self.read_size_max,
+                "resync_bytes": self.deframer.resync_bytes,
+                "checksum_failures": self.deframer.checksum_failures,
+                "timed_frames": self.timed_frames,
+                "latency_last": self.latency_last,
+                "latency_max": self.latency_max,
+                "latency_average": self.latency_total / self.timed_frames
+                if self.timed_frames
+                else 0.0,
+            }
+        )
+        return stats
+
     def join(self):
         """ Join on the ending threads """
         for thread in [self.th_data, self.th_ground]:
@@ -117,10 +340,19 @@ class Downlinker:
         Args:
             frame: frame to loopback to ground
         """
-        try:
-            self.outgoing.put_nowait(frame)
-        except Full:
-            DW_LOGGER.warning("GDS ground queue full, dropping loopback frame")
+        self.add_loopback_frames([frame])
+
+    def add_loopback_frames(self, frames):
+        """Adds a batch of frames to loopback to ground
+
+        Args:
+            frames: list of frames to loopback to ground
+        """
+        dropped = self.outgoing.put_all(frames, 0.500)
+        if dropped:
+            DW_LOGGER.warning(
+                "GDS ground queue full, dropped %d loopback frames", dropped
+            )
 
 
 class Uplinker:
@@ -136,6 +368,8 @@ class Uplinker:
     """
 
     RETRY_COUNT = 3
+    # Statistics of get_stats that are monotonic counters
+    COUNTERS = ["frames_out", "bytes_out", "writes", "write_failures"]
 
     def __init__(
         self,
@@ -143,6 +377,7 @@ class Uplinker:
         ground: GroundHandler,
         framer: FramerDeframer,
         loopback: Downlinker,
+        batch_size: int = 0,
     ):
         """Initializes the uplink class
 
@@ -154,6 +389,8 @@ class Uplinker:
             ground: ground handler receiving data from the ground system
             framer: framer used to frame wire bytes
             loopback: used to return handshake packets
+            batch_size: maximum bytes of frames written at once, sized to the FSW uplink buffer. 0 writes each frame
+                        on its own
         """
         self.th_uplink = None
         self.running = True
@@ -161,6 +398,11 @@ class Uplinker:
         self.adapter = adapter
         self.loopback = loopback
         self.framer = framer
+        self.batch_size = batch_size
+        self.frames_out = 0
+        self.bytes_out = 0
+        self.writes = 0
+        self.write_failures = 0
 
     def start(self):
         """ Starts the uplink pipeline """
@@ -177,24 +419,29 @@ class Uplinker:
         """
         try:
             while self.running:
-                packets = self.ground.receive_all()
-                for packet in [
+                packets = [
                     packet
-                    for packet in packets
+                    for packet in self.ground.receive_all()
                     if packet is not None and len(packet) > 0
-                ]:
-                    framed = self.framer.frame(packet)
+                ]
+                for batch in self.batch(packets):
+                    framed = b"".join(self.framer.frame(packet) for packet in batch)
                     # Uplink handles synchronous retries
                     for retry in range(0, Uplinker.RETRY_COUNT):
+                        self.writes += 1
                         if self.adapter.write(framed):
-                            self.loopback.add_loopback_frame(
-                                Uplinker.get_handshake(packet)
+                            self.frames_out += len(batch)
+                            self.bytes_out += len(framed)
+                            self.loopback.add_loopback_frames(
+                                [Uplinker.get_handshake(packet) for packet in batch]
                             )
                             break
+                        self.write_failures += 1
                     else:
                         UP_LOGGER.warning(
                             "Uplink failed to send %d bytes of data after %d retries",
-                            len(framed), Uplinker.RETRY_COUNT 
+                            len(framed),
+                            Uplinker.RETRY_COUNT,
                         )
         # An OSError might occur during shutdown and is harmless. If we are not shutting down, this error should be
         # propagated up the stack.
@@ -202,10 +449,49 @@ class Uplinker:
             if self.running:
                 raise
 
+    def batch(self, packets):
+        """Splits packets into the batches written at once
+
+        Without a batch size every packet is its own batch. Otherwise, consecutive packets are grouped while their frames
+        fit in batch_size bytes. A packet whose frame alone exceeds batch_size is a batch of its own.
+
+        Args:
+            packets: list of packets to uplink
+
+        Returns:
+            list of batches, each a list of packets
+        """
+        if not self.batch_size:
+            return [[packet] for packet in packets]
+        overhead = len(self.framer.frame(b""))
+        batches = []
+        size = 0
+        for packet in packets:
+            framed_size = overhead + len(packet)
+            if not batches or size + framed_size > self.batch_size:
+                batches.append([])
+                size = 0
+            batches[-1].append(packet)
+            size += framed_size
+        return batches
+
     def stop(self):
         """ Stop the thread depends will close the ground resource which may be blocking """
         self.running = False
 
+    def get_stats(self):
+        """Gets the counters of the uplink
+
+        Returns:
+            dictionary of frames and bytes written to the adapter, and of the writes made and failed
+        """
+        return {
+            "frames_out": self.frames_out,
+            "bytes_out": self.bytes_out,
+            "writes": self.writes,
+            "write_failures": self.write_failures,
+        }
+
     def join(self):
         """ Join on the ending threads """
         if self.th_uplink is not None:
@@ -224,4 +510,4 @@ class Uplinker:
         Returns:
             handshake packet
         """
-        return U32Type(DataDescType["FW_PACKET_HAND"].value).serialize() + packet
+        return HANDSHAKE_HEADER + packet
@@ -30,12 +30,13 @@ class ChData(sys_data.SysData):
         Returns:
             An initialized ChData object
         """
-        super().__init__()
+        # Fields are set before the base constructor such that it does not build placeholder defaults
         self.id = ch_temp.get_id()
         self.val_obj = ch_val_obj
         self.time = ch_time
         self.template = ch_temp
         self.pkt = None
+        super().__init__()
 
     @staticmethod
     def get_empty_obj(ch_temp):
@@ -33,11 +33,12 @@ class EventData(sys_data.SysData):
         Returns:
             An initialized EventData object
         """
-        super().__init__()
+        # Fields are set before the base constructor such that it does not build placeholder defaults
         self.id = event_temp.get_id()
         self.args = event_args
         self.time = event_time
         self.template = event_temp
+        super().__init__()
 
     def get_args(self):
         return self.args
@@ -29,11 +29,12 @@ class PktData(SysData):
         Returns:
             An initialized PktData object
         """
-        super().__init__()
+        # Fields are set before the base constructor such that it does not build placeholder defaults
         self.id = pkt_temp.get_id()
         self.chs = pkt_chs
         self.time = pkt_time
         self.template = pkt_temp
+        super().__init__()
 
         # Set the packet of all the channels
         for ch in self.chs:
@@ -89,8 +90,7 @@ class PktData(SysData):
             )
         elif not csv and not verbose:
             pkt_str += "{}: {} {{\n".format(
-                self.time.to_readable(time_zone),
-                self.template.get_name(),
+                self.time.to_readable(time_zone), self.template.get_name()
             )
 
         for i in range(len(self.chs)):
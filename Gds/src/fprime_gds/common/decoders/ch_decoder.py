@@ -17,13 +17,24 @@ Example data that would be sent to a decoder that parses channels:
 @bug No known bugs
 """
 
-import copy
-
 from fprime.common.models.serialize.time_type import TimeType
 from fprime.common.models.serialize.numerical_types import U32Type
 from fprime_gds.common.data_types.ch_data import ChData
+from fprime_gds.common.decoders.compiled_decoder import (
+    CompiledDecoder,
+    group_by_id,
+    numpy,
+)
 from fprime_gds.common.decoders.decoder import Decoder
 
+# Channel ID followed by the time tag, decoded in a single unpack
+HEADER_DECODER = CompiledDecoder([U32Type(), TimeType()])
+HEADER_FORMAT = "I" + TimeType.FIXED_FORMAT
+# Position of the seconds and microseconds in raw header values, followed by the values
+HEADER_SECONDS = 3
+HEADER_USECONDS = 4
+HEADER_COUNT = 5
+
 
 class ChDecoder(Decoder):
     """Decoder class for Channel data"""
@@ -41,6 +52,11 @@ class ChDecoder(Decoder):
         """
         super().__init__()
         self.__dict = ch_dict
+        # Compile each channel's value decoder once, at dictionary load time
+        self.__compiled = {
+            ch_id: CompiledDecoder([ch_temp.get_type_obj()])
+            for ch_id, ch_temp in ch_dict.items()
+        }
 
     def decode_api(self, data):
         """
@@ -56,19 +72,9 @@ class ChDecoder(Decoder):
             Parsed version of the channel telemetry data in the form of a
             ChData object or None if the data is not decodable
         """
-        ptr = 0
-
-        # Decode Ch ID here...
-        id_obj = U32Type()
-        id_obj.deserialize(data, ptr)
-        ptr += id_obj.getSize()
+        (id_obj, ch_time), ptr = HEADER_DECODER.decode(data, 0)
         ch_id = id_obj.val
 
-        # Decode time...
-        ch_time = TimeType()
-        ch_time.deserialize(data, ptr)
-        ptr += ch_time.getSize()
-
         if ch_id in self.__dict:
             # Retrieve the template instance for this channel
             ch_temp = self.__dict[ch_id]
@@ -95,14 +101,92 @@ class ChDecoder(Decoder):
             object, and so the channel value can be retrieved from the obj's
             val field.
         """
-        # This line creates a new object of the same type as the template's
-        # type_obj. This allows us to use the new object to deserialize and
-        # store the data value. If we did not do this, the template's object
-        # would be used to deserialize multiple times and channel objects
-        # referencing the template's type object would seem to have their value
-        # changed randomly
-        val_obj = copy.deepcopy(template.get_type_obj())
+        # The compiled decoder loads the value into a new object of the same type as the template's type_obj. If the
+        # template's object were used, channel objects referencing it would seem to have their value changed randomly
+        compiled = self.__compiled.get(template.get_id())
+        if compiled is None:
+            compiled = CompiledDecoder([template.get_type_obj()])
+            self.__compiled[template.get_id()] = compiled
+        decoded, _ = compiled.decode(val_data, offset)
+        return decoded[0]
+
+    def decode_columns(self, msgs, use_numpy=True):
+        """
+        Decodes a batch of channel telemetry messages into columns per channel, without building ChData objects. This
+        allows bulk consumers (log replay, plotting, analytics) to decode many samples at once. Fixed-size numerical
+        channels are decoded in a single pass over all messages of that channel.
 
-        val_obj.deserialize(val_data, offset)
+        Args:
+            msgs: list of binary telemetry channel data messages
+            use_numpy: produce NumPy structured arrays when NumPy is installed
 
-        return val_obj
+        Returns:
+            Dictionary of channel ID to the columns of that channel, in message order. Columns are a NumPy structured
+            array with id, time and value fields, or a dictionary of id, time and value lists when NumPy is not used.
+            Time is in seconds as returned by TimeType.get_float.
+        """
+        batch = {}
+        for ch_id, group in group_by_id(msgs, HEADER_FORMAT[0]).items():
+            compiled = self.__compiled.get(ch_id)
+            if compiled is None:
+                print("Channel decode error: id %d not in dictionary" % ch_id)
+                continue
+            batch[ch_id] = self.decode_layout(
+                compiled, group, HEADER_FORMAT, [ch_id], use_numpy
+            )[0]
+        return batch
+
+    @staticmethod
+    def decode_layout(compiled, msgs, header_format, ch_ids, use_numpy):
+        """
+        Decodes messages sharing one layout, an ID and time tag header followed by channel values, into columns
+
+        Args:
+            compiled: CompiledDecoder of the channel values following the header
+            msgs: list of binary messages sharing the layout
+            header_format: struct format characters of the ID and time tag header
+            ch_ids: channel IDs of the values decoded by compiled
+            use_numpy: produce NumPy structured arrays when NumPy is installed
+
+        Returns:
+            list of columns, one per channel ID. See decode_columns for the format of columns.
+        """
+        use_numpy = use_numpy and numpy is not None
+        array = compiled.decode_array(msgs, header_format) if use_numpy else None
+        if array is not None:
+            times = (
+                array["f%d" % HEADER_SECONDS] + array["f%d" % HEADER_USECONDS] / 1000000
+            )
+            values = [
+                array["f%d" % (HEADER_COUNT + index)] for index in range(len(ch_ids))
+            ]
+        else:
+            rows = compiled.decode_rows(msgs, header_format)
+            times = [
+                row[HEADER_SECONDS] + row[HEADER_USECONDS] / 1000000 for row in rows
+            ]
+            values = [
+                [row[HEADER_COUNT + index] for row in rows]
+                for index in range(len(ch_ids))
+            ]
+        if not use_numpy:
+            return [
+                {"id": [ch_id] * len(times), "time": list(times), "value": ch_values}
+                for ch_id, ch_values in zip(ch_ids, values)
+            ]
+        columns = []
+        for ch_id, ch_values in zip(ch_ids, values):
+            value_type = ch_values.dtype.newbyteorder("=") if array is not None else "O"
+            column = numpy.empty(
+                len(times), dtype=[("id", "u4"), ("time", "f8"), ("value", value_type)]
+            )
+            column["id"] = ch_id
+            column["time"] = times
+            if array is not None:
+                column["value"] = ch_values
+            else:
+                # Assigned one by one such that list or dictionary values are stored as python objects
+                for index, value in enumerate(ch_values):
+                    column["value"][index] = value
+            columns.append(column)
+        return columns
@@ -0,0 +1,241 @@
+"""
+@brief Compiled decoders for sequences of serialized fprime types
+
+Channel values and event arguments are described in the dictionary by template type objects. Decoding each of these
+by deep-copying the template type and deserializing it field by field is costly when done for every packet. This module
+compiles a sequence of template types once, typically at dictionary load time, into a list of decoding steps:
+
+    - consecutive fixed-layout types are merged into one precompiled struct decoded with a single unpack_from call
+    - variable-layout types (e.g. strings) are deserialized individually
+
+Decoded values are loaded into shallow copies of the template types, so no deepcopy happens per packet. Batches of
+messages sharing a layout may also be decoded straight into rows of python values (or NumPy arrays when NumPy is
+installed) without building any type objects.
+
+@date Created October 16, 2026
+"""
+import copy
+import logging
+import struct
+
+from fprime.common.models.serialize.numerical_types import NumericalType
+from fprime.common.models.serialize.type_base import get_struct
+from fprime.common.models.serialize.type_exceptions import (
+    DeserializeException,
+    TypeException,
+)
+
+# NumPy is optional, batch decoding falls back to python lists without it
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+LOGGER = logging.getLogger("decoder")
+
+# NumPy (big-endian) equivalent of each struct format character used by numerical types
+NUMPY_TYPES = {
+    "b": "i1",
+    "B": "u1",
+    "h": ">i2",
+    "H": ">u2",
+    "i": ">i4",
+    "I": ">u4",
+    "q": ">i8",
+    "Q": ">u8",
+    "f": ">f4",
+    "d": ">f8",
+}
+
+
+class CompiledDecoder:
+    """
+    Decodes a fixed sequence of template types from binary data. Built once per template and reused for every packet
+    matching that template.
+    """
+
+    def __init__(self, type_objs):
+        """
+        Compiles the given template type objects into decoding steps
+
+        Args:
+            type_objs: list of template type objects in serialized order. These are never modified by decoding.
+        """
+        self.__steps = []
+        self.__count = len(type_objs)
+        self.__fixed_format = None
+        # Raw sequences unpack directly to their python values without loading type objects
+        self.__raw = all(isinstance(type_obj, NumericalType) for type_obj in type_objs)
+        fixed_formats = []
+        fixed_objs = []
+        for type_obj in type_objs:
+            fixed_format = type_obj.get_fixed_format()
+            if fixed_format is not None:
+                fixed_formats.append(fixed_format)
+                fixed_objs.append(type_obj)
+                continue
+            self.__flush(fixed_formats, fixed_objs)
+            fixed_formats, fixed_objs = [], []
+            self.__steps.append((None, type_obj))
+        self.__flush(fixed_formats, fixed_objs)
+        if all(codec is not None for codec, _ in self.__steps):
+            self.__fixed_format = "".join(
+                type_obj.get_fixed_format() for type_obj in type_objs
+            )
+
+    def __flush(self, fixed_formats, fixed_objs):
+        """ Merges the pending fixed-layout types into a single struct step """
+        if fixed_objs:
+            self.__steps.append((get_struct("".join(fixed_formats)), tuple(fixed_objs)))
+
+    def __len__(self):
+        """ Number of types decoded by this decoder """
+        return self.__count
+
+    @property
+    def fixed_format(self):
+        """ Struct format characters of the whole sequence when every type has a fixed layout, otherwise None """
+        return self.__fixed_format
+
+    @property
+    def fixed_size(self):
+        """ Serialized size of the whole sequence when every type has a fixed layout, otherwise None """
+        if self.__fixed_format is None:
+            return None
+        return get_struct(self.__fixed_format).size
+
+    @property
+    def raw(self):
+        """ True when the sequence consists only of numerical types, whose unpacked values are their python values """
+        return self.__raw
+
+    def decode(self, data, offset):
+        """
+        Decodes the sequence of types starting at offset in data
+
+        Args:
+            data: binary data to decode
+            offset: location in data where the first type starts
+
+        Returns:
+            Tuple of the list of decoded type objects (in template order) and the offset just past the decoded data.
+            Raises DeserializeException when data is too short.
+        """
+        decoded = []
+        for codec, type_objs in self.__steps:
+            # Variable layout, deserialize it on its own
+            if codec is None:
+                type_obj = copy.copy(type_objs)
+                type_obj.deserialize(data, offset)
+                decoded.append(type_obj)
+                offset += type_obj.getSize()
+                continue
+            try:
+                values = iter(codec.unpack_from(data, offset))
+            except struct.error as err:
+                raise DeserializeException(str(err))
+            for template_obj in type_objs:
+                type_obj = copy.copy(template_obj)
+                type_obj.load_unpacked(values)
+                decoded.append(type_obj)
+            offset += codec.size
+        return decoded, offset
+
+    def decode_values(self, data, offset):
+        """
+        Decodes the sequence of types starting at offset in data into their python values
+
+        Args:
+            data: binary data to decode
+            offset: location in data where the first type starts
+
+        Returns:
+            Tuple of the list of python values (in template order) and the offset just past the decoded data
+        """
+        if self.__raw and self.__fixed_format is not None:
+            codec = get_struct(self.__fixed_format)
+            try:
+                return list(codec.unpack_from(data, offset)), offset + codec.size
+            except struct.error as err:
+                raise DeserializeException(str(err))
+        decoded, offset = self.decode(data, offset)
+        return [type_obj.val for type_obj in decoded], offset
+
+    def decode_rows(self, msgs, header_format):
+        """
+        Decodes a batch of messages made of a fixed header followed by this sequence of types. Raw fixed layouts are
+        decoded with a single iter_unpack over the whole batch when every message has the expected size. Undecodable
+        messages are logged and skipped.
+
+        Args:
+            msgs: list of binary messages to decode
+            header_format: struct format characters of the header preceding the sequence
+
+        Returns:
+            list of tuples of the raw header values followed by the python values of the sequence
+        """
+        header = get_struct(header_format)
+        codec = None
+        if self.__raw and self.__fixed_format is not None:
+            codec = get_struct(header_format + self.__fixed_format)
+            if all(len(msg) == codec.size for msg in msgs):
+                return list(codec.iter_unpack(b"".join(msgs)))
+        rows = []
+        for msg in msgs:
+            try:
+                if codec is not None:
+                    rows.append(codec.unpack_from(msg))
+                    continue
+                values, _ = self.decode_values(msg, header.size)
+                rows.append(header.unpack_from(msg) + tuple(values))
+            except (struct.error, TypeException) as err:
+                LOGGER.warning("Skipping undecodable message in batch: %s", err)
+        return rows
+
+    def decode_array(self, msgs, header_format):
+        """
+        Decodes a batch of messages made of a fixed header followed by this sequence of types into a NumPy structured
+        array without any python level per message work. Fields are named f0, f1, ... in header then sequence order.
+
+        Args:
+            msgs: list of binary messages to decode
+            header_format: struct format characters of the header preceding the sequence
+
+        Returns:
+            NumPy structured array or None when NumPy is not installed, the layout is not raw and fixed or the messages
+            are not all of the expected size
+        """
+        if numpy is None or not self.__raw or self.__fixed_format is None:
+            return None
+        record_format = header_format + self.__fixed_format
+        if any(len(msg) != get_struct(record_format).size for msg in msgs):
+            return None
+        dtype = numpy.dtype(
+            [
+                ("f%d" % index, NUMPY_TYPES[char])
+                for index, char in enumerate(record_format)
+            ]
+        )
+        return numpy.frombuffer(b"".join(msgs), dtype=dtype)
+
+
+def group_by_id(msgs, id_format):
+    """
+    Groups a batch of messages by the ID leading each message, keeping message order within each group. Messages too
+    short to hold an ID are logged and skipped.
+
+    Args:
+        msgs: list of binary messages
+        id_format: struct format character of the leading ID
+
+    Returns:
+        dictionary of ID to the list of messages carrying that ID
+    """
+    id_codec = get_struct(id_format)
+    groups = {}
+    for msg in msgs:
+        try:
+            groups.setdefault(id_codec.unpack_from(msg)[0], []).append(msg)
+        except struct.error as err:
+            LOGGER.warning("Skipping undecodable message in batch: %s", err)
+    return groups
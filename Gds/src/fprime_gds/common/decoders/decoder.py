@@ -63,3 +63,14 @@ class Decoder(
         :param data: binary data to decode
         :return: decoded data object
         """
+
+    def decode_batch(self, msgs):
+        """
+        Decodes a batch of messages. Bulk consumers (e.g. log replay) may use this to decode many messages at once.
+        Consumers not needing data objects may use the faster decode_columns of the decoders providing it instead.
+
+        :param msgs: list of binary data messages to decode
+        :return: list of decoded data objects, skipping messages that decoded to None
+        """
+        decoded = [self.decode_api(msg) for msg in msgs]
+        return [item for item in decoded if item is not None]
@@ -15,7 +15,6 @@ Example data structure:
 @bug No known bugs
 """
 
-import copy
 import traceback
 
 import fprime.common.models.serialize.numerical_types
@@ -23,6 +22,13 @@ from fprime.common.models.serialize import time_type
 from fprime.common.models.serialize.type_exceptions import TypeException
 from fprime_gds.common.data_types import event_data
 from fprime_gds.common.decoders import decoder
+from fprime_gds.common.decoders.compiled_decoder import CompiledDecoder, group_by_id
+
+# Event ID followed by the time tag, decoded in a single unpack
+HEADER_DECODER = CompiledDecoder(
+    [fprime.common.models.serialize.numerical_types.U32Type(), time_type.TimeType()]
+)
+HEADER_FORMAT = "I" + time_type.TimeType.FIXED_FORMAT
 
 
 class EventDecoder(decoder.Decoder):
@@ -41,6 +47,24 @@ class EventDecoder(decoder.Decoder):
         """
         super().__init__()
         self.__dict = event_dict
+        # Compile each event's argument decoder once, at dictionary load time
+        self.__compiled = {
+            event_id: self.compile_args(event_temp)
+            for event_id, event_temp in event_dict.items()
+        }
+
+    @staticmethod
+    def compile_args(template):
+        """
+        Compiles the argument types of an event template into a single decoder
+
+        Args:
+            template: EventTemplate object describing the event's arguments
+
+        Returns:
+            CompiledDecoder for the event's arguments
+        """
+        return CompiledDecoder([arg_obj for _, _, arg_obj in template.get_args()])
 
     def decode_api(self, data):
         """
@@ -56,19 +80,9 @@ class EventDecoder(decoder.Decoder):
             Parsed version of the event data in the form of a EventData object
             or None if the data is not decodable
         """
-        ptr = 0
-
-        # Decode event ID here...
-        id_obj = fprime.common.models.serialize.numerical_types.U32Type()
-        id_obj.deserialize(data, ptr)
-        ptr += id_obj.getSize()
+        (id_obj, event_time), ptr = HEADER_DECODER.decode(data, 0)
         event_id = id_obj.val
 
-        # Decode time...
-        event_time = time_type.TimeType()
-        event_time.deserialize(data, ptr)
-        ptr += event_time.getSize()
-
         if event_id in self.__dict:
             event_temp = self.__dict[event_id]
 
@@ -98,26 +112,44 @@ class EventDecoder(decoder.Decoder):
             corresponding arg_type object in the template parameter. Returns
             none if the arguments can't be parsed
         """
-        arg_results = []
-        args = template.get_args()
-
-        # For each argument, use the arg_obj deserialize method to get the value
-        for arg in args:
-            (arg_name, arg_desc, template_arg_obj) = arg
+        compiled = self.__compiled.get(template.get_id())
+        if compiled is None:
+            compiled = self.compile_args(template)
+            self.__compiled[template.get_id()] = compiled
+
+        # The compiled decoder loads each argument into a new instance of the argument's type object so the template's
+        # object is never used for deserialization and storage of the parsed argument value.
+        try:
+            arg_results, _ = compiled.decode(arg_data, offset)
+        except TypeException as e:
+            print("Event decode exception %s" % (e.getMsg()))
+            traceback.print_exc()
+            return None
 
-            # Create a new instance of the argument's type object so we don't
-            # use the template's object for deserialization and storage of the
-            # parsed argument value.
-            arg_obj = copy.deepcopy(template_arg_obj)
+        return tuple(arg_results)
 
-            try:
-                arg_obj.deserialize(arg_data, offset)
-                arg_results.append(arg_obj)
-            except TypeException as e:
-                print("Event decode exception %s" % (e.getMsg()))
-                traceback.print_exc()
-                return None
+    def decode_columns(self, msgs):
+        """
+        Decodes a batch of event messages into columns per event, without building EventData objects. Events whose
+        arguments are all fixed-size numbers are decoded in a single pass over all messages of that event.
 
-            offset = offset + arg_obj.getSize()
+        Args:
+            msgs: list of binary event data messages
 
-        return tuple(arg_results)
+        Returns:
+            Dictionary of event ID to a dictionary of id, time and args lists in message order. Time is in seconds as
+            returned by TimeType.get_float and args holds a tuple of the python values of the arguments of each event.
+        """
+        batch = {}
+        for event_id, group in group_by_id(msgs, HEADER_FORMAT[0]).items():
+            if event_id not in self.__dict:
+                print("Event decode error: id %d not in dictionary" % event_id)
+                continue
+            # Raw header values are the ID, time base, time context, seconds and microseconds
+            rows = self.__compiled[event_id].decode_rows(group, HEADER_FORMAT)
+            batch[event_id] = {
+                "id": [event_id] * len(rows),
+                "time": [row[3] + row[4] / 1000000 for row in rows],
+                "args": [tuple(row[len(HEADER_FORMAT) :]) for row in rows],
+            }
+        return batch
@@ -22,6 +22,15 @@ from fprime.common.models.serialize.numerical_types import U16Type
 from fprime_gds.common.data_types.ch_data import ChData
 from fprime_gds.common.data_types.pkt_data import PktData
 from fprime_gds.common.decoders.ch_decoder import ChDecoder
+from fprime_gds.common.decoders.compiled_decoder import (
+    CompiledDecoder,
+    group_by_id,
+    numpy,
+)
+
+# Packet ID followed by the time tag, decoded in a single unpack
+HEADER_DECODER = CompiledDecoder([U16Type(), TimeType()])
+HEADER_FORMAT = "H" + TimeType.FIXED_FORMAT
 
 
 class PktDecoder(ChDecoder):
@@ -43,6 +52,13 @@ class PktDecoder(ChDecoder):
         super().__init__(ch_dict)
 
         self.__dict = pkt_name_dict
+        # Compile the values of all channels of each packet into one decoder, at dictionary load time
+        self.__compiled = {
+            pkt_id: CompiledDecoder(
+                [ch_temp.get_type_obj() for ch_temp in pkt_temp.get_ch_list()]
+            )
+            for pkt_id, pkt_temp in pkt_name_dict.items()
+        }
 
     def decode_api(self, data):
         """
@@ -58,19 +74,9 @@ class PktDecoder(ChDecoder):
             Parsed version of the input data in the form of a PktData object
             or None if the data is not decodable
         """
-        ptr = 0
-
-        # Decode Pkt ID here...
-        id_obj = U16Type()
-        id_obj.deserialize(data, ptr)
-        ptr += id_obj.getSize()
+        (id_obj, pkt_time), ptr = HEADER_DECODER.decode(data, 0)
         pkt_id = id_obj.val
 
-        # Decode time...
-        pkt_time = TimeType()
-        pkt_time.deserialize(data, ptr)
-        ptr += pkt_time.getSize()
-
         if pkt_id not in self.__dict:
             # Don't crash if can't find pkt. Just notify and keep going
             print(
@@ -88,10 +94,69 @@ class PktDecoder(ChDecoder):
 
         ch_temps = pkt_temp.get_ch_list()
 
-        ch_data_objs = []
-        for ch_temp in ch_temps:
-            val_obj = self.decode_ch_val(data, ptr, ch_temp)
-            ptr += val_obj.getSize()
-            ch_data_objs.append(ChData(val_obj, pkt_time, ch_temp))
+        val_objs, _ = self.__compiled[pkt_id].decode(data, ptr)
+        ch_data_objs = [
+            ChData(val_obj, pkt_time, ch_temp)
+            for val_obj, ch_temp in zip(val_objs, ch_temps)
+        ]
 
         return PktData(ch_data_objs, pkt_time, pkt_temp)
+
+    def decode_columns(self, msgs, use_numpy=True):
+        """
+        Decodes a batch of packetized telemetry messages into columns per channel, without building PktData or ChData
+        objects. Packets of a fixed-size layout are decoded in a single pass over all messages of that packet.
+
+        Args:
+            msgs: list of binary packetized telemetry data messages
+            use_numpy: produce NumPy structured arrays when NumPy is installed
+
+        Returns:
+            Dictionary of channel ID to the columns of that channel, ordered by time. See ChDecoder.decode_columns for the
+            format of the columns.
+        """
+        batch = {}
+        for pkt_id, group in group_by_id(msgs, HEADER_FORMAT[0]).items():
+            if pkt_id not in self.__dict:
+                print("Packet decode error: id %d not in dictionary" % pkt_id)
+                continue
+            ch_ids = [ch_temp.get_id() for ch_temp in self.__dict[pkt_id].get_ch_list()]
+            columns = self.decode_layout(
+                self.__compiled[pkt_id], group, HEADER_FORMAT, ch_ids, use_numpy
+            )
+            for ch_id, column in zip(ch_ids, columns):
+                batch.setdefault(ch_id, []).append(column)
+        return {ch_id: self.merge_columns(columns) for ch_id, columns in batch.items()}
+
+    @staticmethod
+    def merge_columns(columns):
+        """
+        Merges the columns of a channel decoded from different packets into a single set of columns ordered by time.
+        NumPy columns of different value types are merged with python object values.
+
+        Args:
+            columns: list of columns of a single channel
+
+        Returns:
+            merged columns
+        """
+        if len(columns) == 1:
+            return columns[0]
+        if numpy is not None and not isinstance(columns[0], dict):
+            if len({column.dtype for column in columns}) > 1:
+                # Channels decoded from both fixed and variable layouts keep their values as python objects, as the
+                # variable layout does, instead of leaving NumPy to promote them
+                columns = [
+                    column.astype([("id", "u4"), ("time", "f8"), ("value", "O")])
+                    for column in columns
+                ]
+            merged = numpy.concatenate(columns)
+            return merged[numpy.argsort(merged["time"], kind="stable")]
+        merged = {
+            key: [item for column in columns for item in column[key]]
+            for key in columns[0]
+        }
+        order = sorted(range(len(merged["time"])), key=merged["time"].__getitem__)
+        return {
+            key: [values[index] for index in order] for key, values in merged.items()
+        }
@@ -13,9 +13,13 @@ descriptor header will be passed on to the registered objects.
 
 @bug No known bugs
 """
-import fprime.common.models.serialize.numerical_types
+import logging
+
+from fprime.common.models.serialize.type_base import get_struct
 from fprime_gds.common.utils import config_manager, data_desc_type
 
+LOGGER = logging.getLogger("distributor")
+
 
 # NOTE decoder function to call is called data_callback(data)
 class Distributor:
@@ -25,6 +29,9 @@ class Distributor:
     Decoders can register with a distributor to recv packets of data of a certain description.
     """
 
+    # Consumed bytes tolerated at the front of the internal buffer before it is compacted
+    COMPACT_SIZE = 65536
+
     def __init__(self, config=None):
         """
         Sets up the dictionary of connected decoders and socket client object.
@@ -42,9 +49,15 @@ class Distributor:
             config = config_manager.ConfigManager()
 
         self.__decoders = {key.name: [] for key in list(data_desc_type.DataDescType)}
-
-        # Internal buffer for un distributed data
-        self.__buf = b""
+        # Descriptor value to the (shared) list of decoders registered for that descriptor
+        self.__decoders_by_desc = {
+            key.value: self.__decoders[key.name]
+            for key in list(data_desc_type.DataDescType)
+        }
+
+        # Internal buffer for un distributed data, consumed up to the offset
+        self.__buf = bytearray()
+        self.__offset = 0
         # Setup key framing
         self.key_frame = None
         tmp_frame = config.get("framing", "use_key", fallback="false")
@@ -52,6 +65,12 @@ class Distributor:
             self.key_frame = int(config.get("framing", "key_val"), 16)
         self.key_obj = config.get_type("key_val")
         self.len_obj = config.get_type("msg_len")
+        # Precompiled codecs of the length and of the length + U32 descriptor header
+        self.__len_codec = self.len_obj.get_codec()
+        self.__header_codec = get_struct(self.len_obj.get_fixed_format() + "I")
+        self.__key_bytes = None
+        if self.key_frame is not None:
+            self.__key_bytes = self.key_obj.get_codec().pack(self.key_frame)
 
     # NOTE we could use either the type of the object or an enum as the type argument. It should indicate what the decoder decodes.
 
@@ -81,43 +100,42 @@ class Distributor:
             Where leftover_data is a bytearray of anything at the end of data
             that could not be parsed (due to insufficient length).
         """
-        data_left = data
+        offset, bounds = self.__parse(data, 0)
+        return (data[offset:], [data[start:end] for start, end in bounds])
 
-        raw_msgs = []
-        # Search data looking for key-frame
-        if not self.key_frame is None:
-            while True:
-                # Check if we have enough data to parse a key
-                # if not, bail on the function
-                if len(data_left) < self.key_obj.getSize():
-                    return (data_left, raw_msgs)
-                # Check leading key size bytes to see if it is the key
-                self.key_obj.deserialize(data_left, 0)
-                if self.key_obj.val != self.key_frame:
-                    data_left = data_left[1:]
-                    continue
-                # Key found break
-                data_left = data_left[self.key_obj.getSize() :]
-                break
+    def __parse(self, data, offset):
+        """
+        Locates raw messages in data without copying it.
 
-        # Keep parsing and then break when you can't parse no more
-        while True:
-            # Check if we have enough data to parse a length
-            if len(data_left) < self.len_obj.getSize():
-                break
-            self.len_obj.deserialize(data_left, 0)
+        Args:
+            data (bytearray): Binary data to parse
+            offset (int): location in data where parsing starts
 
-            expected_len = self.len_obj.val + self.len_obj.getSize()
+        Returns:
+            (leftover_offset, [(start1, end1), ..., (startN, endN)])
+            Where leftover_offset is the location of the data that could not be
+            parsed and each start/end pair bounds a raw message.
+        """
+        bounds = []
+        # Search data looking for key-frame
+        if self.__key_bytes is not None:
+            found = data.find(self.__key_bytes, offset)
+            # Not found, keep only the tail that could be the start of a key
+            if found == -1:
+                return (max(offset, len(data) - len(self.__key_bytes) + 1), bounds)
+            offset = found + len(self.__key_bytes)
 
+        # Keep parsing and then break when you can't parse no more
+        len_size = self.__len_codec.size
+        total = len(data)
+        while total - offset >= len_size:
+            end = offset + len_size + self.__len_codec.unpack_from(data, offset)[0]
             # Check if we have enough data to parse
-            if len(data_left) < expected_len:
+            if end > total:
                 break
-
-            raw_msgs.append(data_left[:expected_len])
-
-            data_left = data_left[expected_len:]
-
-        return (data_left, raw_msgs)
+            bounds.append((offset, end))
+            offset = end
+        return (offset, bounds)
 
     def parse_raw_msg_api(self, raw_msg):
         """
@@ -143,21 +161,10 @@ class Distributor:
         # | ..                        |      |
         #   .                                :
 
-        offset = 0
-
-        # Parse length
-        self.len_obj.deserialize(raw_msg, offset)
-        offset += self.len_obj.getSize()
-        length = self.len_obj.val
-
-        # Parse Descriptor type
-        desc_obj = fprime.common.models.serialize.numerical_types.U32Type()
-        desc_obj.deserialize(raw_msg, offset)
-        offset += desc_obj.getSize()
-        desc = desc_obj.val
+        length, desc = self.__header_codec.unpack_from(raw_msg, 0)
 
         # Retrieve message section
-        msg = raw_msg[offset:]
+        msg = raw_msg[self.__header_codec.size :]
 
         return (length, desc, msg)
 
@@ -179,16 +186,28 @@ class Distributor:
         #       messages through the TCP Server.
 
         # Add new data to end of buffer
+        self.__buf += data
 
-        self.__buf = self.__buf + data
-
-        (leftover_data, raw_msgs) = self.parse_into_raw_msgs_api(self.__buf)
-        self.__buf = leftover_data
+        (offset, bounds) = self.__parse(self.__buf, self.__offset)
 
-        for raw_msg in raw_msgs:
-            (length, data_desc, msg) = self.parse_raw_msg_api(raw_msg)
+        header_size = self.__header_codec.size
+        with memoryview(self.__buf) as view:
+            for start, end in bounds:
+                # Decoders are looked up from the header, before the payload is copied out of the buffer
+                (length, data_desc) = self.__header_codec.unpack_from(view, start)
 
-            data_desc_key = data_desc_type.DataDescType(data_desc).name
-
-            for d in self.__decoders[data_desc_key]:
-                d.data_callback(msg)
+                decoders = self.__decoders_by_desc.get(data_desc)
+                if decoders is None:
+                    LOGGER.warning(
+                        "Dropped message of unknown data descriptor %d", data_desc
+                    )
+                    continue
+                msg = bytes(view[start + header_size : end])
+                for d in decoders:
+                    d.data_callback(msg)
+
+        # Compact the buffer only once enough of it has been consumed
+        self.__offset = offset
+        if self.__offset == len(self.__buf) or self.__offset >= self.COMPACT_SIZE:
+            del self.__buf[: self.__offset]
+            self.__offset = 0
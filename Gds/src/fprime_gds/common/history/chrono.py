@@ -4,10 +4,18 @@ chrono.py:
 A chronologically-ordered history that relies on predicates to provide filtering, searching, and
 retrieval operations. This history will re-order itself based on FSW time.
 
+Objects are kept sorted alongside a parallel list of their order keys, such that inserts and time lookups are binary
+searches. Objects arriving in order are appended. Order keys are the time key of the object and its negated arrival
+number, placing an object before the objects of the same time that arrived earlier. Objects are also indexed by id,
+component and time, see index.py, such that predicate searches are index lookups where possible.
+
 :author: koran
 """
+import bisect
+
 from fprime.common.models.serialize.time_type import TimeType
 from fprime_gds.common.history.history import History
+from fprime_gds.common.history.index import HistoryIndex, time_key
 from fprime_gds.common.testing_fw import predicates
 
 
@@ -30,6 +38,11 @@ class ChronologicalHistory(History):
         """
         self.objects = []
         self.new_objects = []
+        # Order keys of the objects, in the same order
+        self.keys = []
+        self.new_keys = []
+        self.index = HistoryIndex()
+        self.arrivals = 0
 
         self.filter = predicates.always_true()
         if filter_pred is not None:
@@ -49,8 +62,11 @@ class ChronologicalHistory(History):
             data: object to store
         """
         if self.filter(data):
-            self.__insert_chrono(data, self.new_objects)
-            index = self.__insert_chrono(data, self.objects)
+            key = (time_key(data.get_time()), -self.arrivals)
+            self.arrivals += 1
+            self.index.add(data, key)
+            self.__insert_chrono(data, key, self.new_objects, self.new_keys)
+            index = self.__insert_chrono(data, key, self.objects, self.keys)
             self.retrieved_cursor = min(index, self.retrieved_cursor)
 
     def retrieve(self, start=None):
@@ -68,11 +84,40 @@ class ChronologicalHistory(History):
         if start is None:
             index = 0
         else:
-            index = self.__get_index(start, self.objects)
+            index = self.__get_index(start, self.objects, self.keys)
         self.retrieved_cursor = self.size()
         self.new_objects.clear()
+        self.new_keys.clear()
         return self.objects[index:]
 
+    def retrieve_matching(self, search_pred, start=None):
+        """
+        Retrieve the objects from this history that satisfy a predicate, like retrieve does. The predicate is planned
+        into index lookups, and only called on the objects these select.
+
+        Args:
+            search_pred: a predicate the objects must satisfy
+            start: optional first object to retrieve. can either be an index (int) or a predicate.
+        Returns:
+            a list of objects in chronological order
+        """
+        if start is None:
+            index = 0
+        else:
+            index = self.__get_index(start, self.objects, self.keys)
+        candidates = self.index.candidates(search_pred)
+        if candidates is None:
+            matching = [obj for obj in self.objects[index:] if search_pred(obj)]
+        elif index >= len(self.keys):
+            matching = []
+        else:
+            first = bisect.bisect_left(candidates, (self.keys[index],))
+            matching = [obj for _, obj in candidates[first:] if search_pred(obj)]
+        self.retrieved_cursor = self.size()
+        self.new_objects.clear()
+        self.new_keys.clear()
+        return matching
+
     def retrieve_new(self, repeats=False):
         """
         Retrieves a chronological order of objects that haven't been accessed through retrieve or
@@ -86,10 +131,12 @@ class ChronologicalHistory(History):
 
         if repeats:
             self.new_objects.clear()
+            self.new_keys.clear()
             return self.objects[index:]
         else:
             new = self.new_objects
             self.new_objects = []
+            self.new_keys = []
             return new
 
     def clear(self, start=None):
@@ -105,13 +152,16 @@ class ChronologicalHistory(History):
             start: start: an optional indicator for the first item to remove. Can be a predicate, a
                 TimeType or an index in the ordering
         """
-        index = self.__clear_list(start, self.objects)
+        index = self.__clear_list(start, self.objects, self.keys)
 
         if len(self.objects) > 0:
             start = self.objects[0].get_time()
-            self.__clear_list(start, self.new_objects)
+            self.__clear_list(start, self.new_objects, self.new_keys)
+            self.index.trim(self.keys[0])
         else:
             self.new_objects.clear()
+            self.new_keys.clear()
+            self.index.clear()
 
         self.retrieved_cursor -= index
         if self.retrieved_cursor < 0:
@@ -151,60 +201,71 @@ class ChronologicalHistory(History):
     ###########################################################################
     #   helper methods
     ###########################################################################
-    def __insert_chrono(self, data_object, ordered):
+    def __insert_chrono(self, data_object, key, ordered, keys):
         """
-        traverses the existing order (back to front) and inserts the data object in the correct
-        position chronologically.
+        binary searches the existing order and inserts the data object after every earlier object,
+        keeping its key in the same position of keys.
         Args:
             data_object: an item to insert in the history. Must have a get_time() method.
+            key: the order key of the item
             ordered: a list to insert the item into.
+            keys: the order keys of the list
         Returns:
-            the index that the item was inserted at (int)
+            the index of the item preceding the inserted item, 0 if it was inserted first (int)
         """
-        for i, item in reversed(list(enumerate(ordered))):
-            if item.get_time() < data_object.get_time():
-                ordered.insert(i + 1, data_object)
-                return i
-        # If the data object is the earliest in the list or the list was empty
-        ordered.insert(0, data_object)
-        return 0
+        if not keys or keys[-1] < key:
+            ordered.append(data_object)
+            keys.append(key)
+            return max(len(keys) - 2, 0)
+        index = bisect.bisect_left(keys, key)
+        ordered.insert(index, data_object)
+        keys.insert(index, key)
+        return max(index - 1, 0)
 
-    def __clear_list(self, start, ordered):
+    def __clear_list(self, start, ordered, keys):
         """
         finds the index that start specifies
         Args:
             start: an optional indicator for the first item to remove. Can be a predicate, a
                 TimeType or an index in the ordering
             ordered: the list to clear
+            keys: the order keys of the list
         Returns:
             the index in the given list that start refers to
         """
         if start is None:
             index = len(ordered)
         else:
-            index = self.__get_index(start, ordered)
+            index = self.__get_index(start, ordered, keys)
         del ordered[:index]
+        del keys[:index]
         return index
 
-    def __get_index(self, start, ordered):
+    def __get_index(self, start, ordered, keys):
         """
         finds the index that start specifies
         Args:
             start: an indicator of a position in an order can be a predicate, a TimeType time
                 stamp or an index in the ordering
             ordered: the list to clear
+            keys: the order keys of the list
         Returns:
             the index in the given list that start refers to
         """
         if predicates.is_predicate(start):
+            candidates = None
+            if keys is self.keys:
+                candidates = self.index.candidates(start)
+            if candidates is not None:
+                for key, obj in candidates:
+                    if start(obj):
+                        return bisect.bisect_left(keys, key)
+                return len(ordered)
             index = 0
             while index < len(ordered) and not start(ordered[index]):
                 index += 1
             return index
         elif isinstance(start, TimeType):
-            index = 0
-            while index < len(ordered) and ordered[index].get_time() < start:
-                index += 1
-            return index
+            return bisect.bisect_left(keys, (time_key(start),))
         else:
             return start
@@ -0,0 +1,310 @@
+"""
+index.py:
+
+Indices letting the predicate-searched histories answer common searches without calling a predicate on every object.
+An index keeps a posting list of the objects of each id, a posting list of the objects of each component and a list of
+the objects sorted by time. Predicates are planned into lookups on these: ids in a set, components in a set and a time
+range are recognized in the predicates the test API and the CLI build, through satisfies_all and satisfies_any. The
+search predicate is then only called on the objects of the most selective lookup.
+
+Entries carry an order key given by the history, such that candidates are returned in the history's order and entries
+before a cleared point are trimmed off the front of each list.
+
+@date Created October 16, 2026
+"""
+import bisect
+import heapq
+
+from fprime.common.models.serialize.time_type import TimeType
+from fprime_gds.common.gds_cli import filtering_utils
+from fprime_gds.common.testing_fw import predicates
+
+
+def time_key(time):
+    """
+    Gets a sort key ordering times like TimeType.compare does: by time base, seconds, microseconds then context
+
+    Args:
+        time: a TimeType, other times are their own key
+    Returns:
+        a key to order times by
+    """
+    if isinstance(time, TimeType):
+        return (time.timeBase.value, time.seconds, time.useconds, time.timeContext)
+    return time
+
+
+def component_of(obj):
+    """
+    Gets the component of an object the way component_predicate does
+
+    Args:
+        obj: a data object or template
+    Returns:
+        the component name, None if the object has no component information
+    """
+    if hasattr(obj, "get_comp_name"):
+        return obj.get_comp_name()
+    if hasattr(obj, "get_template") and hasattr(obj.get_template(), "get_comp_name"):
+        return obj.get_template().get_comp_name()
+    return None
+
+
+class Lookup:
+    """
+    The index lookups a predicate is planned into. Every dimension left as None is unconstrained. Lookups are supersets:
+    every object satisfying the predicate satisfies the lookup, but not the reverse.
+    """
+
+    def __init__(self, ids=None, components=None, lower=None, upper=None):
+        """
+        Constructor of a lookup
+
+        Args:
+            ids: set of ids of the objects, None for all
+            components: set of components of the objects, None for all
+            lower: time key of the earliest objects, None for no bound
+            upper: time key of the latest objects, None for no bound
+        """
+        self.ids = ids
+        self.components = components
+        self.lower = lower
+        self.upper = upper
+
+    def intersect(self, other):
+        """
+        Returns:
+            a lookup of the objects selected by both lookups
+        """
+        return Lookup(
+            self.__combine(self.ids, other.ids, set.intersection),
+            self.__combine(self.components, other.components, set.intersection),
+            self.__combine(self.lower, other.lower, max),
+            self.__combine(self.upper, other.upper, min),
+        )
+
+    def union(self, other):
+        """
+        Returns:
+            a lookup of the objects selected by either lookup
+        """
+        return Lookup(
+            self.__both(self.ids, other.ids, set.union),
+            self.__both(self.components, other.components, set.union),
+            self.__both(self.lower, other.lower, min),
+            self.__both(self.upper, other.upper, max),
+        )
+
+    @staticmethod
+    def __combine(first, second, function):
+        """ Combines constraints where either one is enough to constrain the result """
+        if first is None:
+            return second
+        if second is None:
+            return first
+        return function(first, second)
+
+    @staticmethod
+    def __both(first, second, function):
+        """ Combines constraints where both are needed to constrain the result """
+        if first is None or second is None:
+            return None
+        return function(first, second)
+
+
+def plan_time(pred):
+    """
+    Plans a predicate called on a time into a lookup. Only bounds given as TimeType objects are planned, as they order
+    like the keys of the index.
+
+    Args:
+        pred: a predicate expecting a TimeType
+    Returns:
+        a Lookup
+    """
+    lower = getattr(pred, "lower_limit", None)
+    upper = getattr(pred, "upper_limit", None)
+    if not isinstance(
+        pred,
+        (
+            predicates.greater_than,
+            predicates.greater_than_or_equal_to,
+            predicates.less_than,
+            predicates.less_than_or_equal_to,
+            predicates.within_range,
+        ),
+    ):
+        return Lookup()
+    return Lookup(
+        lower=time_key(lower) if isinstance(lower, TimeType) else None,
+        upper=time_key(upper) if isinstance(upper, TimeType) else None,
+    )
+
+
+def plan_id(pred):
+    """
+    Plans a predicate called on an id into a lookup
+
+    Args:
+        pred: a predicate expecting an id
+    Returns:
+        a Lookup
+    """
+    if isinstance(pred, predicates.equal_to):
+        return Lookup(ids={pred.expected})
+    if isinstance(pred, predicates.is_a_member_of):
+        return Lookup(ids=set(pred.set))
+    return Lookup()
+
+
+def plan(pred):
+    """
+    Plans a predicate called on history objects into index lookups. Predicates of unknown shapes select every object.
+
+    Args:
+        pred: a predicate expecting a history object
+    Returns:
+        a Lookup
+    """
+    if isinstance(pred, predicates.satisfies_all):
+        lookup = Lookup()
+        for child in pred.p_list:
+            lookup = lookup.intersect(plan(child))
+        return lookup
+    if isinstance(pred, predicates.satisfies_any):
+        if not pred.p_list:
+            return Lookup()
+        lookup = plan(pred.p_list[0])
+        for child in pred.p_list[1:]:
+            lookup = lookup.union(plan(child))
+        return lookup
+    if isinstance(pred, (predicates.event_predicate, predicates.telemetry_predicate)):
+        return plan_id(pred.id_pred).intersect(plan_time(pred.time_pred))
+    if isinstance(pred, filtering_utils.id_predicate):
+        return Lookup(ids={pred.id_num})
+    if isinstance(pred, filtering_utils.component_predicate):
+        return Lookup(components={pred.comp})
+    if isinstance(pred, filtering_utils.time_to_data_predicate):
+        return plan_time(pred.time_pred)
+    return Lookup()
+
+
+class HistoryIndex:
+    """
+    Posting lists by id and component and a time index over the objects of a history. Posting lists hold (order,
+    object) entries sorted by the order key of the history. The time index holds the same entries sorted by time, with
+    a parallel list of their time keys. Objects without an id or a TimeType time are not indexed, and are candidates of
+    every lookup.
+    """
+
+    def __init__(self):
+        """
+        Constructor of an empty index
+        """
+        self.ids = {}
+        self.components = {}
+        self.times = []
+        self.time_keys = []
+        self.unindexed = []
+
+    def add(self, obj, order):
+        """
+        Indexes an object
+
+        Args:
+            obj: object stored by the history
+            order: key of the object in the history's order, unique and comparable with other order keys
+        """
+        entry = (order, obj)
+        time = obj.get_time() if hasattr(obj, "get_time") else None
+        if not hasattr(obj, "get_id") or not isinstance(time, TimeType):
+            self.__insert(self.unindexed, entry)
+            return
+        self.__insert(self.ids.setdefault(obj.get_id(), []), entry)
+        self.__insert(self.components.setdefault(component_of(obj), []), entry)
+        key = time_key(time)
+        if not self.time_keys or self.time_keys[-1] <= key:
+            self.times.append(entry)
+            self.time_keys.append(key)
+        else:
+            index = bisect.bisect_right(self.time_keys, key)
+            self.times.insert(index, entry)
+            self.time_keys.insert(index, key)
+
+    def trim(self, order):
+        """
+        Drops the entries of the objects before an order key, as the history cleared them
+
+        Args:
+            order: order key of the earliest object kept
+        """
+        for postings in [self.ids, self.components]:
+            for key, entries in list(postings.items()):
+                del entries[: bisect.bisect_left(entries, (order,))]
+                if not entries:
+                    del postings[key]
+        del self.unindexed[: bisect.bisect_left(self.unindexed, (order,))]
+        kept = [index for index, entry in enumerate(self.times) if entry[0] >= order]
+        self.times = [self.times[index] for index in kept]
+        self.time_keys = [self.time_keys[index] for index in kept]
+
+    def clear(self):
+        """
+        Drops every entry
+        """
+        self.ids.clear()
+        self.components.clear()
+        self.times = []
+        self.time_keys = []
+        self.unindexed = []
+
+    def candidates(self, pred):
+        """
+        Finds the objects that may satisfy a predicate through the most selective lookup planned from it
+
+        Args:
+            pred: a predicate expecting a history object
+        Returns:
+            a list of (order, object) entries in the history's order, None if the predicate could not be planned
+        """
+        lookup = plan(pred)
+        # Options are the number of entries of a lookup and a function gathering them
+        options = []
+        if lookup.ids is not None:
+            options.append(self.__postings(self.ids, lookup.ids))
+        if lookup.components is not None:
+            # Objects without component information satisfy every component predicate
+            options.append(self.__postings(self.components, lookup.components | {None}))
+        if lookup.lower is not None or lookup.upper is not None:
+            first = 0
+            last = len(self.time_keys)
+            if lookup.lower is not None:
+                first = bisect.bisect_left(self.time_keys, lookup.lower)
+            if lookup.upper is not None:
+                last = bisect.bisect_right(self.time_keys, lookup.upper)
+            options.append(
+                (max(last - first, 0), lambda: sorted(self.times[first:last]))
+            )
+        if not options:
+            return None
+        candidates = min(options, key=lambda option: option[0])[1]()
+        if self.unindexed:
+            return list(heapq.merge(candidates, self.unindexed))
+        return candidates
+
+    @staticmethod
+    def __insert(entries, entry):
+        """ Inserts an entry in a sorted list, appending when in order """
+        if not entries or entries[-1] < entry:
+            entries.append(entry)
+        else:
+            bisect.insort(entries, entry)
+
+    @staticmethod
+    def __postings(postings, keys):
+        """ Number of entries of a set of keys and a function merging their posting lists """
+        lists = [postings[key] for key in keys if key in postings]
+        return (
+            sum(len(entries) for entries in lists),
+            lambda: list(heapq.merge(*lists)),
+        )
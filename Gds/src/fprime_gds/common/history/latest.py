@@ -0,0 +1,147 @@
+"""
+latest.py:
+
+A history indexing the latest value of each telemetry channel. Most telemetry queries only want the current state of the
+channels, which this history keeps up to date in O(1) per update instead of walking a full chronological history.
+Packets are unpacked into their channels.
+
+Note: like the RAM history, this history treats "start times" as session tokens. A session receives the latest value of
+every channel updated since its previous retrieval, and the whole current state on its first retrieval.
+
+@date Created October 16, 2026
+"""
+import collections
+import threading
+
+from fprime_gds.common.history.history import History
+
+
+class LatestHistory(History):
+    """
+    History of the latest value of each channel, keyed by channel id, optionally keeping the last few values of each
+    channel as well.
+    """
+
+    def __init__(self, depth=1):
+        """
+        Constructor used to set-up the index
+
+        :param depth: number of recent values kept for each channel by get_recent
+        """
+        self.lock = threading.Lock()
+        self.depth = depth
+        # Channel id to (sequence number of the update, latest value)
+        self.latest = {}
+        self.recent = {}
+        self.retrieved_cursors = {}
+        self.new_cursor = 0
+        self.next_sequence = 0
+
+    def data_callback(self, data, sender=None):
+        """
+        Data callback updating the latest value of a channel, or of every channel of a packet
+
+        :param data: channel or packet object to index
+        """
+        channels = data.get_chs() if hasattr(data, "get_chs") else [data]
+        with self.lock:
+            for channel in channels:
+                self.latest[channel.id] = (self.next_sequence, channel)
+                self.next_sequence += 1
+                if self.depth > 1:
+                    recent = self.recent.get(channel.id, None)
+                    if recent is None:
+                        recent = self.recent[channel.id] = collections.deque(
+                            maxlen=self.depth
+                        )
+                    recent.append(channel)
+
+    def retrieve(self, start=None):
+        """
+        Retrieve the latest value of channels. If session is not specified, the latest value of every channel is
+        retrieved. If session is specified, only the channels updated since the session's previous retrieval are
+        returned, and a new session receives every channel.
+
+        :param start: session key
+        :return: list of the latest value of channels in the order they were updated
+        """
+        with self.lock:
+            cursor = 0
+            if start is not None:
+                cursor = self.retrieved_cursors.get(start, 0)
+                self.retrieved_cursors[start] = self.next_sequence
+            self.new_cursor = self.next_sequence
+            return self.__since(cursor)
+
+    def retrieve_new(self):
+        """
+        Retrieves the latest value of the channels updated since the last call to retrieve or retrieve_new
+
+        :return: list of the latest value of channels in the order they were updated
+        """
+        with self.lock:
+            cursor, self.new_cursor = self.new_cursor, self.next_sequence
+            return self.__since(cursor)
+
+    def clear(self, start=None):
+        """
+        Clears a session when one is supplied, otherwise forgets every channel value
+
+        :param start: session key
+        """
+        with self.lock:
+            if start is not None:
+                self.retrieved_cursors.pop(start, None)
+                return
+            self.latest.clear()
+            self.recent.clear()
+
+    def size(self):
+        """
+        Accessor for the number of channels in the index
+
+        :return: the number of channels (int)
+        """
+        return len(self.latest)
+
+    def snapshot(self, ids=None):
+        """
+        Gets the current telemetry state without copying any history
+
+        :param ids: channel ids to include, None for every channel
+        :return: dictionary of channel id to its latest value
+        """
+        with self.lock:
+            if ids is None:
+                return {key: value for key, (_, value) in self.latest.items()}
+            return {key: self.latest[key][1] for key in ids if key in self.latest}
+
+    def get_latest(self, channel_id):
+        """
+        Gets the latest value of a channel
+
+        :param channel_id: id of the channel
+        :return: latest value of the channel, None if it was never received
+        """
+        with self.lock:
+            entry = self.latest.get(channel_id, None)
+            return None if entry is None else entry[1]
+
+    def get_recent(self, channel_id):
+        """
+        Gets the last values of a channel, up to the depth of this index
+
+        :param channel_id: id of the channel
+        :return: list of values of the channel, oldest first
+        """
+        with self.lock:
+            if self.depth > 1:
+                return list(self.recent.get(channel_id, []))
+            entry = self.latest.get(channel_id, None)
+            return [] if entry is None else [entry[1]]
+
+    def __since(self, cursor):
+        """ Latest values updated at or after sequence number cursor, in update order. Lock must be held. """
+        updated = [entry for entry in self.latest.values() if entry[0] >= cursor]
+        updated.sort(key=lambda entry: entry[0])
+        return [value for _, value in updated]
@@ -7,8 +7,17 @@ middle-ware layer.
 
 Note: this RAM history treats "start times" as session tokens to remember where it was last fetched from.
 
+Objects are kept in a ring buffer bounded by a count and/or an estimated size in bytes, evicting the oldest objects once
+full. Every object is given a monotonically increasing sequence number, and session cursors hold the sequence number of
+the next object the session has not seen. Retrieving k new objects therefore costs O(k) regardless of the history's size,
+and cursors stay valid as objects are evicted underneath them.
+
 :author: lestarch
 """
+import collections
+import heapq
+import itertools
+import sys
 import threading
 
 from fprime_gds.common.history.history import History
@@ -20,39 +29,75 @@ class RamHistory(History):
     to handle incoming objects, and store them for retrieval.
     """
 
-    def __init__(self):
+    COUNTERS = ["stored", "evicted", "evicted_unread", "cleared"]
+
+    def __init__(self, max_count=None, max_bytes=None, sizer=sys.getsizeof):
         """
         Constructor used to set-up in-memory store for history
+
+        :param max_count: maximum number of objects kept, None for no limit
+        :param max_bytes: maximum estimated size of the objects kept, None for no limit
+        :param sizer: function estimating the size of an object in bytes. The default is shallow, which is enough to
+                      bound objects of a similar make-up, but does not account for what they reference.
         """
         self.lock = threading.Lock()
-        self.objects = []
+        self.objects = collections.deque()
+        self.sizes = collections.deque()
         self.retrieved_cursors = {}
+        self.max_count = max_count
+        self.max_bytes = max_bytes
+        self.sizer = sizer
+        self.first_sequence = 0
+        self.next_sequence = 0
+        self.bytes = 0
+        self.stored = 0
+        self.evicted = 0
+        self.evicted_unread = 0
+        self.cleared = 0
+        # Cursors are kept in a heap of (sequence, order, session) for the earliest cursor. Entries are superseded rather
+        # than removed when cursors move, and are discarded once they reach the top of the heap.
+        self.__cursor_heap = []
+        self.__order = itertools.count()
+        self.__newest = None
 
     def data_callback(self, data, sender=None):
         """
-        Data callback to store
+        Data callback to store, evicting the oldest objects when over capacity
 
         :param data: object to store
         """
         with self.lock:
             self.objects.append(data)
+            if self.max_bytes is not None:
+                size = self.sizer(data)
+                self.sizes.append(size)
+                self.bytes += size
+            self.next_sequence += 1
+            self.stored += 1
+            if self.__full():
+                earliest = self.__earliest_cursor()
+                while self.__full():
+                    if earliest is not None and self.first_sequence >= earliest:
+                        self.evicted_unread += 1
+                    self.evicted += 1
+                    self.__popleft(1)
 
     def retrieve(self, start=None):
         """
         Retrieve objects from this history. 'start' is the session token for retrieving new elements. If session is not
         specified, all elements are retrieved. If session is specified, then unseen elements are returned. If the
-        session itself is new, it is recorded and set to the newest data.
+        session itself is new, it is recorded and set to the newest data. Sessions that fell behind the eviction of
+        their unseen elements receive what remains.
 
         :param start: return all objects newer than given start session key
         :return: a list of objects
         """
-        index = 0
-        size = self.size()
-        if start is not None:
-            index = self.retrieved_cursors.get(start, size)
         with self.lock:
-            objs = self.objects[index:size]
-            self.retrieved_cursors[start] = size
+            cursor = self.first_sequence
+            if start is not None:
+                cursor = self.retrieved_cursors.get(start, self.next_sequence)
+            objs = self.__since(cursor)
+            self.__set_cursor(start, self.next_sequence)
         return objs
 
     def retrieve_new(self):
@@ -63,11 +108,10 @@ class RamHistory(History):
         Returns:
             a list of objects in chronological order
         """
-        index = 0
-        if len(self.retrieved_cursors.values()) > 0:
-            index = max(self.retrieved_cursors.values())
         with self.lock:
-            return self.objects[index:]
+            return self.__since(
+                self.first_sequence if self.__newest is None else self.__newest
+            )
 
     def clear(self, start=None):
         """
@@ -78,17 +122,14 @@ class RamHistory(History):
             start: a position in the history's order (int).
         """
         with self.lock:
-            try:
-                if start is not None:
-                    del self.retrieved_cursors[start]
-            except KeyError:
-                pass
-            earliest = 0
-            if len(self.retrieved_cursors.values()) > 0:
-                earliest = min(self.retrieved_cursors.values())
-            del self.objects[:earliest]
-            for key in self.retrieved_cursors.keys():
-                self.retrieved_cursors[key] -= earliest
+            if start is not None and start in self.retrieved_cursors:
+                cursor = self.retrieved_cursors.pop(start)
+                if cursor == self.__newest:
+                    self.__newest = max(self.retrieved_cursors.values(), default=None)
+            earliest = self.__earliest_cursor()
+            if earliest is not None and earliest > self.first_sequence:
+                self.cleared += earliest - self.first_sequence
+                self.__popleft(earliest - self.first_sequence)
 
     def size(self):
         """
@@ -97,3 +138,70 @@ class RamHistory(History):
             the number of objects (int)
         """
         return len(self.objects)
+
+    def get_stats(self):
+        """
+        Gets the occupancy and eviction statistics of the history
+
+        :return: dictionary of objects and estimated bytes held (0 unless bounded by size), sessions, and counts of
+                 objects stored, evicted for capacity (evicted_unread of which some session had not seen yet) and cleared
+                 after being seen by every session
+        """
+        with self.lock:
+            return {
+                "size": len(self.objects),
+                "bytes": self.bytes,
+                "sessions": len(self.retrieved_cursors),
+                "stored": self.stored,
+                "evicted": self.evicted,
+                "evicted_unread": self.evicted_unread,
+                "cleared": self.cleared,
+            }
+
+    def __full(self):
+        """ Whether the history is over capacity. The newest object is always kept. Lock must be held. """
+        if self.max_count is not None and len(self.objects) > self.max_count:
+            return True
+        return (
+            self.max_bytes is not None
+            and self.bytes > self.max_bytes
+            and len(self.objects) > 1
+        )
+
+    def __popleft(self, count):
+        """ Drops the count oldest objects. Lock must be held. """
+        for _ in range(count):
+            self.objects.popleft()
+            if self.max_bytes is not None:
+                self.bytes -= self.sizes.popleft()
+        self.first_sequence += count
+
+    def __since(self, cursor):
+        """ Objects from sequence number cursor on, read from the newest end in O(k). Lock must be held. """
+        count = self.next_sequence - max(cursor, self.first_sequence)
+        if count >= len(self.objects):
+            return list(self.objects)
+        objs = list(itertools.islice(reversed(self.objects), count))
+        objs.reverse()
+        return objs
+
+    def __set_cursor(self, session, sequence):
+        """ Moves the cursor of a session. Lock must be held. """
+        self.retrieved_cursors[session] = sequence
+        heapq.heappush(self.__cursor_heap, (sequence, next(self.__order), session))
+        if self.__newest is None or sequence > self.__newest:
+            self.__newest = sequence
+        # Superseded entries stuck under a stale session's cursor are compacted away
+        if len(self.__cursor_heap) > 2 * len(self.retrieved_cursors) + 64:
+            self.__cursor_heap = [
+                (cursor, next(self.__order), key)
+                for key, cursor in self.retrieved_cursors.items()
+            ]
+            heapq.heapify(self.__cursor_heap)
+
+    def __earliest_cursor(self):
+        """ Earliest session cursor, None without sessions. Lock must be held. """
+        heap = self.__cursor_heap
+        while heap and self.retrieved_cursors.get(heap[0][2]) != heap[0][0]:
+            heapq.heappop(heap)
+        return heap[0][0] if heap else None
@@ -0,0 +1,322 @@
+"""
+sqlite.py:
+
+A persistent history storing commands, events or channels in an append-only SQLite database in WAL mode. Records survive
+restarts of the GDS and the history is not capped by memory: objects are buffered in small batches before being written,
+and only query results are loaded back into memory.
+
+Channels and events are stored as their id, component, time and the F prime serialization of their value or arguments.
+Commands are stored with the argument text they were built from, as serializable and array arguments are never set from
+it. Objects are rebuilt from the dictionary's templates when retrieved. Records are indexed by time, by id and time and by component and
+time, such that range queries by any of these are index lookups.
+
+Note: like the RAM history, this history treats "start times" as session tokens. Sessions are kept in memory, clearing
+forgets a session, and records are only dropped by the max_records retention. Retrievals return at most PAGE_SIZE
+objects: a session behind by more receives the rest on its next retrievals, and retrieving without a session returns the
+newest objects.
+
+@date Created October 16, 2026
+"""
+import json
+import sqlite3
+import threading
+import time
+
+from fprime.common.models.serialize.time_type import TimeType
+from fprime_gds.common.data_types.ch_data import ChData
+from fprime_gds.common.data_types.cmd_data import CmdData, CommandArgumentsException
+from fprime_gds.common.data_types.event_data import EventData
+from fprime_gds.common.decoders.compiled_decoder import CompiledDecoder
+from fprime_gds.common.history.history import History
+
+KINDS = ["commands", "events", "channels"]
+
+SCHEMA = [
+    "CREATE TABLE IF NOT EXISTS records (seq INTEGER PRIMARY KEY, id INTEGER NOT NULL, component TEXT NOT NULL, "
+    + "time_base INTEGER NOT NULL, seconds INTEGER NOT NULL, useconds INTEGER NOT NULL, context INTEGER NOT NULL, "
+    + "payload BLOB NOT NULL)",
+    "CREATE INDEX IF NOT EXISTS records_time ON records (time_base, seconds, useconds)",
+    "CREATE INDEX IF NOT EXISTS records_id ON records (id, time_base, seconds, useconds)",
+    "CREATE INDEX IF NOT EXISTS records_component ON records (component, time_base, seconds, useconds)",
+]
+COLUMNS = "seq, id, time_base, seconds, useconds, context, payload"
+
+
+def serialize_values(type_objs):
+    """
+    Serializes the value objects of a command or event, which may be missing when they could not be decoded
+
+    :param type_objs: list of type objects, or None
+    :return: serialized values
+    """
+    return b"".join(type_obj.serialize() for type_obj in (type_objs or []))
+
+
+class SqliteHistory(History):
+    """
+    Persistent history of one kind of object: commands, events or channels. Packets stored in a channel history are
+    stored as their channels.
+    """
+
+    BATCH_SIZE = 256
+    PAGE_SIZE = 10000
+    FLUSH_INTERVAL = 0.5
+    COUNTERS = ["stored", "dropped", "flushes"]
+
+    def __init__(self, path, kind, templates, max_records=None):
+        """
+        Opens or creates the database, continuing the records of a previous run
+
+        :param path: path of the database file
+        :param kind: one of KINDS
+        :param templates: dictionary of id to template of this kind, used to rebuild objects
+        :param max_records: number of most recent records kept, None to keep everything
+        """
+        if kind not in KINDS:
+            raise ValueError("Invalid history kind of {}".format(kind))
+        self.path = path
+        self.kind = kind
+        self.templates = templates
+        self.max_records = max_records
+        self.lock = threading.Lock()
+        self.connection = sqlite3.connect(path, check_same_thread=False)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+        for statement in SCHEMA:
+            self.connection.execute(statement)
+        self.connection.commit()
+        self.pending = []
+        self.last_flush = time.monotonic()
+        self.decoders = {}
+        self.retrieved_cursors = {}
+        self.count, last = self.connection.execute(
+            "SELECT COUNT(*), MAX(seq) FROM records"
+        ).fetchone()
+        # Sequence number of the next record, records are numbered by their rowid
+        self.next_sequence = (last or 0) + 1
+        self.stored = 0
+        self.dropped = 0
+        self.flushes = 0
+
+    def data_callback(self, data, sender=None):
+        """
+        Data callback buffering an object to store. Batches are written when full or after FLUSH_INTERVAL.
+
+        :param data: object to store
+        """
+        objects = data.get_chs() if hasattr(data, "get_chs") else [data]
+        with self.lock:
+            for obj in objects:
+                record = self.__encode(obj)
+                if record is None:
+                    self.dropped += 1
+                    continue
+                self.pending.append(record)
+            if (
+                len(self.pending) >= self.BATCH_SIZE
+                or time.monotonic() - self.last_flush >= self.FLUSH_INTERVAL
+            ):
+                self.__flush()
+
+    def flush(self):
+        """ Writes buffered objects to the database """
+        with self.lock:
+            self.__flush()
+
+    def close(self):
+        """ Writes buffered objects and closes the database """
+        with self.lock:
+            self.__flush()
+            self.connection.close()
+
+    def retrieve(self, start=None):
+        """
+        Retrieve objects from this history. 'start' is the session token for retrieving new elements. If session is not
+        specified, the newest PAGE_SIZE objects are retrieved. If session is specified, then at most PAGE_SIZE unseen
+        elements are returned, the oldest first. If the session itself is new, it is recorded and set to the newest data.
+
+        :param start: session key
+        :return: a list of objects in the order they were received
+        """
+        with self.lock:
+            self.__flush()
+            if start is None:
+                cursor = max(self.next_sequence - self.PAGE_SIZE, 0)
+            else:
+                cursor = self.retrieved_cursors.get(start, self.next_sequence)
+            objs, self.retrieved_cursors[start] = self.__page(cursor)
+            return objs
+
+    def retrieve_new(self):
+        """
+        Retrieves the objects that haven't been accessed through retrieve before, at most PAGE_SIZE of them
+
+        :return: a list of objects in the order they were received
+        """
+        with self.lock:
+            self.__flush()
+            cursor = max(self.retrieved_cursors.values(), default=0)
+            return self.__page(cursor)[0]
+
+    def clear(self, start=None):
+        """
+        Forgets a session when supplied. Stored objects are kept, they are only dropped by the max_records retention.
+
+        :param start: session key
+        """
+        with self.lock:
+            if start is not None:
+                self.retrieved_cursors.pop(start, None)
+
+    def size(self):
+        """
+        Accessor for the number of objects in the history
+
+        :return: the number of objects (int)
+        """
+        with self.lock:
+            return self.count + len(self.pending)
+
+    def query(self, start=None, end=None, ids=None, components=None, limit=None):
+        """
+        Queries stored objects by time range, ids and components
+
+        :param start: earliest TimeType of the objects, None for no bound
+        :param end: latest TimeType of the objects, None for no bound
+        :param ids: ids of the objects to return, None for all
+        :param components: component names of the objects to return, None for all
+        :param limit: maximum number of objects returned, the earliest first. None for no limit.
+        :return: a list of objects in chronological order
+        """
+        conditions = []
+        parameters = []
+        for bound, operator in [(start, ">="), (end, "<=")]:
+            if bound is not None:
+                conditions.append(
+                    "(time_base, seconds, useconds) {} (?, ?, ?)".format(operator)
+                )
+                parameters.extend([bound.timeBase.value, bound.seconds, bound.useconds])
+        for column, values in [("id", ids), ("component", components)]:
+            if values is not None:
+                values = list(values)
+                conditions.append(
+                    "{} IN ({})".format(column, ", ".join("?" * len(values)))
+                )
+                parameters.extend(values)
+        order = "time_base, seconds, useconds, context, seq"
+        if limit is not None:
+            order += " LIMIT {:d}".format(limit)
+        with self.lock:
+            self.__flush()
+            return self.__select(" AND ".join(conditions) or "1", parameters, order)
+
+    def get_stats(self):
+        """
+        Gets the statistics of the history
+
+        :return: dictionary of records stored, objects pending a write, objects stored, objects dropped because they
+                 could not be encoded, and batches written
+        """
+        with self.lock:
+            return {
+                "records": self.count,
+                "pending": len(self.pending),
+                "stored": self.stored,
+                "dropped": self.dropped,
+                "flushes": self.flushes,
+            }
+
+    def __encode(self, obj):
+        """ Encodes an object into a record row without its sequence number, None when it cannot be stored """
+        if self.kind == "channels" and isinstance(obj, ChData):
+            if obj.val_obj is None:
+                return None
+            payload = obj.val_obj.serialize()
+        elif self.kind == "events" and isinstance(obj, EventData):
+            payload = serialize_values(obj.args)
+        elif self.kind == "commands" and isinstance(obj, CmdData):
+            payload = json.dumps(list(obj.get_arg_vals()), default=str).encode()
+        else:
+            return None
+        obj_time = obj.get_time()
+        return (
+            obj.id,
+            obj.template.get_comp_name(),
+            obj_time.timeBase.value,
+            obj_time.seconds,
+            obj_time.useconds,
+            obj_time.timeContext,
+            payload,
+        )
+
+    def __decode(self, row):
+        """ Rebuilds an object from a selected row, None when its id is no longer in the dictionary """
+        _, obj_id, time_base, seconds, useconds, context, payload = row
+        template = self.templates.get(obj_id, None)
+        if template is None:
+            return None
+        obj_time = TimeType(time_base, context, seconds, useconds)
+        if self.kind == "commands":
+            try:
+                return CmdData(tuple(json.loads(payload)), template, obj_time)
+            except CommandArgumentsException:
+                return None
+        decoder = self.decoders.get(obj_id, None)
+        if decoder is None:
+            if self.kind == "channels":
+                decoder = CompiledDecoder([template.get_type_obj()])
+            else:
+                decoder = CompiledDecoder([arg for _, _, arg in template.get_args()])
+            self.decoders[obj_id] = decoder
+        if self.kind == "channels":
+            return ChData(decoder.decode(payload, 0)[0][0], obj_time, template)
+        return EventData(tuple(decoder.decode(payload, 0)[0]), obj_time, template)
+
+    def __page(self, cursor):
+        """ Objects of a page of records from sequence number cursor on, and the cursor after them. Lock must be held. """
+        rows = self.connection.execute(
+            "SELECT {} FROM records WHERE seq >= ? ORDER BY seq LIMIT ?".format(
+                COLUMNS
+            ),
+            [cursor, self.PAGE_SIZE],
+        ).fetchall()
+        if len(rows) < self.PAGE_SIZE:
+            cursor = self.next_sequence
+        else:
+            cursor = rows[-1][0] + 1
+        return [obj for obj in map(self.__decode, rows) if obj is not None], cursor
+
+    def __select(self, condition, parameters, order):
+        """ Selects and rebuilds records. Lock must be held. """
+        rows = self.connection.execute(
+            "SELECT {} FROM records WHERE {} ORDER BY {}".format(
+                COLUMNS, condition, order
+            ),
+            parameters,
+        )
+        return [obj for obj in map(self.__decode, rows) if obj is not None]
+
+    def __flush(self):
+        """ Writes pending records and applies the retention. Lock must be held. """
+        self.last_flush = time.monotonic()
+        if not self.pending:
+            return
+        first = self.next_sequence
+        self.connection.executemany(
+            "INSERT INTO records (seq, id, component, time_base, seconds, useconds, context, payload) "
+            + "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            [(first + index,) + record for index, record in enumerate(self.pending)],
+        )
+        self.next_sequence += len(self.pending)
+        self.count += len(self.pending)
+        self.stored += len(self.pending)
+        self.pending = []
+        # Retention is applied once a tenth over the limit, deleting in large steps
+        if self.max_records is not None and self.count > self.max_records * 1.1:
+            self.connection.execute(
+                "DELETE FROM records WHERE seq < ?",
+                [self.next_sequence - self.max_records],
+            )
+            self.count = self.max_records
+        self.connection.commit()
+        self.flushes += 1
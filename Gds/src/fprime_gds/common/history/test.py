@@ -2,11 +2,15 @@
 test.py:
 
 A receive-ordered history that relies on predicates to provide filtering, searching, and
-retrieval operations
+retrieval operations. Objects are also indexed by id, component and time under their receive
+sequence number, see index.py, such that predicate searches are index lookups where possible.
 
 :author: koran
 """
+import bisect
+
 from fprime_gds.common.history.history import History
+from fprime_gds.common.history.index import HistoryIndex
 from fprime_gds.common.testing_fw import predicates
 
 
@@ -29,6 +33,9 @@ class TestHistory(History):
             filter_pred: an optional predicate to filter incoming data_objects
         """
         self.objects = []
+        self.index = HistoryIndex()
+        # Receive sequence number of the first object
+        self.first_sequence = 0
 
         self.filter = predicates.always_true()
         if filter_pred is not None:
@@ -48,6 +55,7 @@ class TestHistory(History):
             data: object to store
         """
         if self.filter(data):
+            self.index.add(data, self.first_sequence + len(self.objects))
             self.objects.append(data)
 
     def retrieve(self, start=None):
@@ -69,6 +77,28 @@ class TestHistory(History):
         self.retrieved_cursor = self.size()
         return self.objects[index:]
 
+    def retrieve_matching(self, search_pred, start=None):
+        """
+        Retrieve the objects from this history that satisfy a predicate, like retrieve does. The
+        predicate is planned into index lookups, and only called on the objects these select.
+
+        Args:
+            search_pred: a predicate the objects must satisfy
+            start: optional first object to retrieve. can either be an index (int) or a predicate.
+        Returns:
+            a list of objects in the order they were received
+        """
+        if start is not None:
+            index = self.__get_index(start)
+        else:
+            index = 0
+        self.retrieved_cursor = self.size()
+        candidates = self.index.candidates(search_pred)
+        if candidates is None:
+            return [obj for obj in self.objects[index:] if search_pred(obj)]
+        first = bisect.bisect_left(candidates, (self.first_sequence + index,))
+        return [obj for _, obj in candidates[first:] if search_pred(obj)]
+
     def retrieve_new(self):
         """
         Retrieves a chronological order of objects that haven't been accessed through retrieve or
@@ -102,7 +132,9 @@ class TestHistory(History):
         if self.retrieved_cursor < 0:
             self.retrieved_cursor = 0
 
+        self.first_sequence += min(index, len(self.objects))
         del self.objects[:index]
+        self.index.trim(self.first_sequence)
 
     def size(self):
         """
@@ -145,6 +177,12 @@ class TestHistory(History):
             the index in the given list that start refers to
         """
         if predicates.is_predicate(start):
+            candidates = self.index.candidates(start)
+            if candidates is not None:
+                for sequence, obj in candidates:
+                    if start(obj):
+                        return sequence - self.first_sequence
+                return self.size()
             index = 0
             while index < self.size() and not start(self.objects[index]):
                 index += 1
@@ -6,7 +6,15 @@ to compose in this code.
 
 @author mstarch
 """
+import os
+
+import fprime_gds.common.history.latest
 import fprime_gds.common.history.ram
+import fprime_gds.common.history.sqlite
+
+# Default number of objects kept by each history of the HTML GUI, bounding memory on long passes. Histories are
+# unbounded unless given a size.
+DEFAULT_HISTORY_SIZE = 250000
 
 
 class Histories:
@@ -16,6 +24,7 @@ class Histories:
     1. Channel history
     2. Event history
     3. Command history (short-circuited feedback from encoder)
+    4. Latest channel values, indexed by channel id
     """
 
     def __init__(self):
@@ -23,22 +32,60 @@ class Histories:
         self._command_hist = None
         self._event_hist = None
         self._channel_hist = None
+        self._latest_channel_hist = None
 
-    def setup_histories(self, coders):
+    def setup_histories(
+        self,
+        coders,
+        history_size=None,
+        history_bytes=None,
+        history_store=None,
+        dictionaries=None,
+        history_store_records=None,
+    ):
         """
         Setup a set of history objects in order to store the events of the decoders. This registers itself with the
         supplied coders object.
 
         :param coders: coders object to register histories with
+        :param history_size: maximum number of objects kept by each RAM history, None for no limit
+        :param history_bytes: maximum estimated bytes kept by each RAM history, None for no limit
+        :param history_store: directory of persistent SQLite histories, None for RAM histories
+        :param dictionaries: dictionaries rebuilding the objects of persistent histories
+        :param history_store_records: number of most recent objects kept by each persistent history, None for no limit
         """
-        # Create histories, RAM histories for now
-        self._command_hist = fprime_gds.common.history.ram.RamHistory()
-        self._event_hist = fprime_gds.common.history.ram.RamHistory()
-        self._channel_hist = fprime_gds.common.history.ram.RamHistory()
+        if history_store is not None:
+            os.makedirs(history_store, exist_ok=True)
+            self._command_hist, self._event_hist, self._channel_hist = [
+                fprime_gds.common.history.sqlite.SqliteHistory(
+                    os.path.join(history_store, "{}.sqlite3".format(kind)),
+                    kind,
+                    templates,
+                    history_store_records,
+                )
+                for kind, templates in [
+                    ("commands", dictionaries.command_id),
+                    ("events", dictionaries.event_id),
+                    ("channels", dictionaries.channel_id),
+                ]
+            ]
+        else:
+            self._command_hist = fprime_gds.common.history.ram.RamHistory(
+                history_size, history_bytes
+            )
+            self._event_hist = fprime_gds.common.history.ram.RamHistory(
+                history_size, history_bytes
+            )
+            self._channel_hist = fprime_gds.common.history.ram.RamHistory(
+                history_size, history_bytes
+            )
+        self._latest_channel_hist = fprime_gds.common.history.latest.LatestHistory()
         # Register histories where channels and packets are routed together
         coders.register_event_consumer(self._event_hist)
         coders.register_channel_consumer(self._channel_hist)
         coders.register_packet_consumer(self._channel_hist)
+        coders.register_channel_consumer(self._latest_channel_hist)
+        coders.register_packet_consumer(self._latest_channel_hist)
         coders.register_command_consumer(self._command_hist)
 
     @property
@@ -55,9 +102,24 @@ class Histories:
         """
         return self._channel_hist
 
+    @property
+    def latest_channels(self):
+        """
+        Latest channel values property
+        """
+        return self._latest_channel_hist
+
     @property
     def commands(self):
         """
         Commands history property
         """
         return self._command_hist
+
+    def close(self):
+        """
+        Closes histories holding resources, writing out what persistent histories have buffered
+        """
+        for history in [self._command_hist, self._event_hist, self._channel_hist]:
+            if hasattr(history, "close"):
+                history.close()
@@ -47,7 +47,17 @@ class StandardPipeline:
         self.__filing = files.Filing()
 
     def setup(
-        self, config, dictionary, down_store, logging_prefix=None, packet_spec=None
+        self,
+        config,
+        dictionary,
+        down_store,
+        logging_prefix=None,
+        packet_spec=None,
+        shared_memory=None,
+        history_size=None,
+        history_bytes=None,
+        history_store=None,
+        history_store_records=None,
     ):
         """
         Setup the standard pipeline for moving data from the middleware layer through the GDS layers using the standard
@@ -58,18 +68,35 @@ class StandardPipeline:
         :param down_store: downlink storage directory
         :param logging_prefix: logging prefix. Defaults to not logging at all.
         :param packet_spec: location of packetized telemetry XML specification.
+        :param shared_memory: name of the middleware's shared-memory ring to receive data from. None uses the socket.
+        :param history_size: maximum number of objects kept by each history, None for no limit
+        :param history_bytes: maximum estimated bytes kept by each history, None for no limit
+        :param history_store: directory of persistent SQLite histories, None for RAM histories
+        :param history_store_records: number of most recent objects kept by each persistent history, None for no limit
         """
         # Loads the distributor and client socket
         self.distributor = fprime_gds.common.distributor.distributor.Distributor(config)
-        self.client_socket = (
-            fprime_gds.common.client_socket.client_socket.ThreadedTCPSocketClient()
-        )
+        if shared_memory is None:
+            self.client_socket = (
+                fprime_gds.common.client_socket.client_socket.ThreadedTCPSocketClient()
+            )
+        else:
+            self.client_socket = fprime_gds.common.client_socket.client_socket.SharedMemorySocketClient(
+                shared_memory
+            )
         # Setup dictionaries encoders and decoders
         self.dictionaries.load_dictionaries(dictionary, packet_spec)
         self.coders.setup_coders(
             self.dictionaries, self.distributor, self.client_socket
         )
-        self.histories.setup_histories(self.coders)
+        self.histories.setup_histories(
+            self.coders,
+            history_size,
+            history_bytes,
+            history_store,
+            self.dictionaries,
+            history_store_records,
+        )
         self.files.setup_file_handling(
             down_store,
             self.coders.file_encoder,
@@ -134,6 +161,7 @@ class StandardPipeline:
         """
         self.client_socket.disconnect()
         self.files.uplinker.exit()
+        self.histories.close()
 
     def send_command(self, command, args):
         """
@@ -981,6 +981,13 @@ class IntegrationTestAPI(DataHandler):
             """
             return self.repeats
 
+        def get_search_pred(self):
+            """
+            Returns a predicate every item the search accepts satisfies, such that indexed histories only return the
+            items that may satisfy it. None when the search needs every item.
+            """
+            return None
+
     class TimeoutException(Exception):
         """
         This exception is used by the history searches to signal the end of the timeout.
@@ -1030,7 +1037,11 @@ class IntegrationTestAPI(DataHandler):
             t_pred = self.get_event_pred(time_pred=time_pred)
             start = predicates.satisfies_any([e_pred, t_pred])
 
-        current = history.retrieve(start)
+        search_pred = searcher.get_search_pred()
+        if search_pred is not None and hasattr(history, "retrieve_matching"):
+            current = history.retrieve_matching(search_pred, start)
+        else:
+            current = history.retrieve(start)
         if searcher.search_current_history(current):
             return searcher.get_return_value()
 
@@ -1092,6 +1103,9 @@ class IntegrationTestAPI(DataHandler):
                         return True
                 return False
 
+            def get_search_pred(self):
+                return self.search_pred
+
             def incremental_search(self, item):
                 if self.search_pred(item):
                     msg = "History search found the specified item: {}".format(item)
@@ -1221,6 +1235,9 @@ class IntegrationTestAPI(DataHandler):
                     return True
                 return False
 
+            def get_search_pred(self):
+                return self.search_pred
+
             def incremental_search(self, item):
                 if self.search_pred(item):
                     self.log("Count search counted another item: {}".format(item))
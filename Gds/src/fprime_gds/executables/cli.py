@@ -21,6 +21,11 @@ import fprime_gds.common.communication.adapters.base
 
 # Include basic adapters
 import fprime_gds.common.communication.adapters.ip
+import fprime_gds.common.communication.adapters.replay
+import fprime_gds.common.communication.framing
+import fprime_gds.common.communication.selectorloop
+import fprime_gds.common.communication.updown
+import fprime_gds.common.pipeline.histories
 import fprime_gds.common.utils.config_manager
 
 try:
@@ -173,6 +178,18 @@ class CommParser(ParserBase):
     user may import other adapter implementation files.
     """
 
+    # Options of the threaded backend the selector loop has no counterpart for, with their destinations and defaults
+    THREADS_ONLY = [
+        (
+            "--downlink-queue-size",
+            "downlink_queue_size",
+            fprime_gds.common.communication.updown.DEFAULT_QUEUE_SIZE,
+        ),
+        ("--downlink-overflow-policy", "downlink_overflow_policy", "drop-newest"),
+        ("--uplink-batch-size", "uplink_batch_size", 0),
+        ("--comm-record", "comm_record", None),
+    ]
+
     @staticmethod
     def get_parser():
         """
@@ -220,6 +237,75 @@ class CommParser(ParserBase):
             choices=adapters,
             default="ip",
         )
+        parser.add_argument(
+            "--comm-checksum-type",
+            dest="checksum_type",
+            action="store",
+            type=str,
+            help="Checksum used to verify frames on the wire. Must match the flight deployment. [default: %(default)s]",
+            choices=list(
+                fprime_gds.common.communication.framing.CHECKSUM_MAPPING.keys()
+            ),
+            default="fixed",
+        )
+        parser.add_argument(
+            "--downlink-queue-size",
+            dest="downlink_queue_size",
+            action="store",
+            type=int,
+            help="Maximum number of frames queued for the ground side. [default: %(default)s]",
+            default=fprime_gds.common.communication.updown.DEFAULT_QUEUE_SIZE,
+        )
+        parser.add_argument(
+            "--downlink-overflow-policy",
+            dest="downlink_overflow_policy",
+            action="store",
+            type=str,
+            help="Policy applied to frames when the downlink queue is full. [default: %(default)s]",
+            choices=fprime_gds.common.communication.updown.OVERFLOW_POLICIES,
+            default="drop-newest",
+        )
+        parser.add_argument(
+            "--uplink-batch-size",
+            dest="uplink_batch_size",
+            action="store",
+            type=int,
+            help="Maximum bytes of uplink frames written at once, sized to the FSW uplink buffer. 0 writes each frame on its own. [default: %(default)s]",
+            default=0,
+        )
+        parser.add_argument(
+            "--metrics-interval",
+            dest="metrics_interval",
+            action="store",
+            type=float,
+            help="Seconds between two link statistics log lines, 0 turns them off. [default: %(default)s]",
+            default=0.0,
+        )
+        parser.add_argument(
+            "--metrics-port",
+            dest="metrics_port",
+            action="store",
+            type=int,
+            help="Local port serving link statistics as Prometheus text (/metrics) and JSON (/metrics.json), 0 turns it off. [default: %(default)s]",
+            default=0,
+        )
+        parser.add_argument(
+            "--comm-record",
+            dest="comm_record",
+            action="store",
+            type=str,
+            help="File recording the downlinked data with its timing, for replay with the replay adapter. [default: %(default)s]",
+            default=None,
+        )
+        parser.add_argument(
+            "--comm-backend",
+            dest="comm_backend",
+            action="store",
+            type=str,
+            help="Run the comm layer with a thread per stage, or in a single selector loop (ip adapter only, without the downlink queue, uplink batch and recording options). [default: %(default)s]",
+            choices=fprime_gds.common.communication.selectorloop.BACKENDS,
+            default="threads",
+        )
         return parser
 
     @classmethod
@@ -231,10 +317,20 @@ class CommParser(ParserBase):
         :return: namespace with "comm_adapter" value added
         """
         args = copy.copy(args)
-        args.comm_adapter = (
-            fprime_gds.common.communication.adapters.base.BaseAdapter.construct_adapter(
-                args.adapter, args
-            )
+        if args.comm_backend == "selector":
+            unsupported = [
+                option
+                for option, dest, default in cls.THREADS_ONLY
+                if getattr(args, dest) != default
+            ]
+            if unsupported:
+                raise ValueError(
+                    "The selector backend does not support {}".format(
+                        ", ".join(unsupported)
+                    )
+                )
+        args.comm_adapter = fprime_gds.common.communication.adapters.base.BaseAdapter.construct_adapter(
+            args.adapter, args
         )
         return args
 
@@ -342,6 +438,15 @@ class MiddleWareParser(ParserBase):
             help="set the threaded TCP socket server address [default: %(default)s]",
             default="0.0.0.0",
         )
+        parser.add_argument(
+            "--shared-memory",
+            dest="shared_memory",
+            action="store",
+            type=str,
+            help="Name of a shared-memory ring the threaded TCP socket server writes downlink data into, read by local "
+            + "clients instead of their own socket copy. Requires python 3.8+. [default: %(default)s]",
+            default=None,
+        )
         return parser
 
     @classmethod
@@ -410,6 +515,42 @@ class GdsParser(ParserBase):
             type=str,
             help="Configuration for wx GUI. Ignored if not using wx.",
         )
+        parser.add_argument(
+            "--history-size",
+            dest="history_size",
+            action="store",
+            type=int,
+            default=fprime_gds.common.pipeline.histories.DEFAULT_HISTORY_SIZE,
+            help="Maximum number of commands, events and channels each kept in memory by the HTML GUI, the oldest are "
+            + "evicted first. 0 for no limit. [default: %(default)s]",
+        )
+        parser.add_argument(
+            "--history-bytes",
+            dest="history_bytes",
+            action="store",
+            type=int,
+            default=0,
+            help="Maximum estimated bytes of commands, events and channels each kept in memory by the HTML GUI. 0 for "
+            + "no limit. [default: %(default)s]",
+        )
+        parser.add_argument(
+            "--history-store",
+            dest="history_store",
+            action="store",
+            type=str,
+            default=None,
+            help="Directory of SQLite databases persisting the commands, events and channels of the HTML GUI across "
+            + "restarts, instead of keeping them in memory. [default: %(default)s]",
+        )
+        parser.add_argument(
+            "--history-store-records",
+            dest="history_store_records",
+            action="store",
+            type=int,
+            default=0,
+            help="Number of most recent commands, events and channels each kept by --history-store. 0 for no limit. "
+            + "[default: %(default)s]",
+        )
         return parser
 
     @classmethod
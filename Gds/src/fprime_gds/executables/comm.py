@@ -10,6 +10,9 @@ deployments that exist on the other end of a "wire" (some communication bus). Th
    interfaces ensuring that ground data is framed and written to the wire, and flight data is deframed and sent to the
    ground side.
 
+With the "selector" backend and the ip adapter, steps 1 and 3 are instead handled by a single selector loop
+multiplexing the adapter and ground sockets (see selectorloop.py).
+
 Note: assuming the module containing the ground adapter has been imported, then this code should provide it as a CLI
       argument, removing the need to rewrite most of this class to use something different.
 
@@ -26,10 +29,17 @@ import signal
 import fprime_gds.common.communication.adapters.base
 import fprime_gds.common.communication.ground
 import fprime_gds.common.communication.adapters.ip
+import fprime_gds.common.communication.adapters.replay
 import fprime_gds.common.logger
 import fprime_gds.executables.cli
 
 from fprime_gds.common.communication.framing import FpFramerDeframer
+from fprime_gds.common.communication.metrics import (
+    MetricsRegistry,
+    MetricsReporter,
+    MetricsServer,
+)
+from fprime_gds.common.communication.selectorloop import SelectorLoop
 from fprime_gds.common.communication.updown import Downlinker, Uplinker
 
 # Uses non-standard PIP package pyserial, so test the waters before getting a hard-import crash
@@ -42,6 +52,24 @@ except ImportError:
 LOGGER = logging.getLogger("comm")
 
 
+def start_metrics(args, registry):
+    """
+    Starts the link statistics log line and server selected by the arguments
+
+    :param args: parsed arguments
+    :param registry: MetricsRegistry holding the statistics sources
+    :return: list of started reporter and server, each to be stopped
+    """
+    started = []
+    if args.metrics_interval > 0:
+        started.append(MetricsReporter(registry, args.metrics_interval, LOGGER))
+    if args.metrics_port:
+        started.append(MetricsServer(registry, "127.0.0.1", args.metrics_port))
+    for metrics in started:
+        metrics.start()
+    return started
+
+
 def main():
     """
     Main program, degenerates into the run loop.
@@ -57,6 +85,8 @@ def main():
         description="F prime communications layer.",
         client=True,
     )
+    if args.comm_backend == "selector":
+        return run_selector_loop(args)
     # Create the handling components for either side of this script, adapter for hardware, and ground for the GDS side
     ground = fprime_gds.common.communication.ground.TCPGround(
         args.tts_addr, args.tts_port
@@ -66,8 +96,37 @@ def main():
     # Set the framing class used and pass it to the uplink and downlink component constructions giving each a separate
     # instantiation
     framer_class = FpFramerDeframer
-    downlinker = Downlinker(adapter, ground, framer_class())
-    uplinker = Uplinker(adapter, ground, framer_class(), downlinker)
+    if isinstance(
+        adapter, fprime_gds.common.communication.adapters.replay.ReplayAdapter
+    ):
+        # Replayed packets are framed with the checksum the downlink deframes with
+        adapter.framer = framer_class(args.checksum_type)
+    recorder = None
+    if args.comm_record is not None:
+        recorder = fprime_gds.common.communication.adapters.replay.LinkRecorder(
+            args.comm_record
+        )
+    downlinker = Downlinker(
+        adapter,
+        ground,
+        framer_class(args.checksum_type),
+        args.downlink_queue_size,
+        args.downlink_overflow_policy,
+        recorder,
+    )
+    uplinker = Uplinker(
+        adapter,
+        ground,
+        framer_class(args.checksum_type),
+        downlinker,
+        args.uplink_batch_size,
+    )
+
+    registry = MetricsRegistry()
+    registry.register("downlink", downlinker.get_stats, Downlinker.COUNTERS)
+    registry.register("uplink", uplinker.get_stats, Uplinker.COUNTERS)
+    registry.register("adapter", adapter.get_stats, adapter.COUNTERS)
+    metrics = start_metrics(args, registry)
 
     # Open resources for the handlers on either side, this prepares the resources needed for reading/writing data
     ground.open()
@@ -90,6 +149,54 @@ def main():
     signal.signal(signal.SIGINT, shutdown)
     uplinker.join()
     downlinker.join()
+    for started in metrics:
+        started.stop()
+    if recorder is not None:
+        recorder.close()
+    LOGGER.info("Downlink queue statistics: %s", downlinker.get_stats())
+    LOGGER.info("Uplink statistics: %s", uplinker.get_stats())
+    return 0
+
+
+def run_selector_loop(args):
+    """
+    Runs the comm layer in a single selector loop. Only available with the ip adapter.
+
+    :param args: parsed arguments
+    :return: return code
+    """
+    if not isinstance(
+        args.comm_adapter, fprime_gds.common.communication.adapters.ip.IpAdapter
+    ):
+        print(
+            "[ERROR] The selector backend requires the ip adapter, not {}".format(
+                args.adapter
+            ),
+            file=sys.stderr,
+        )
+        return 1
+    loop = SelectorLoop(
+        args.address,
+        args.port,
+        args.tts_addr,
+        args.tts_port,
+        FpFramerDeframer(args.checksum_type),
+        args.udp_mode,
+    )
+    registry = MetricsRegistry()
+    registry.register("loop", loop.get_stats, SelectorLoop.COUNTERS)
+    metrics = start_metrics(args, registry)
+
+    def shutdown(*_):
+        """ Shutdown function for signals"""
+        loop.stop()
+
+    signal.signal(signal.SIGTERM, shutdown)
+    signal.signal(signal.SIGINT, shutdown)
+    loop.run()
+    for started in metrics:
+        started.stop()
+    LOGGER.info("Selector loop statistics: %s", loop.get_stats())
     return 0
 
 
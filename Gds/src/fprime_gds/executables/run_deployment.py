@@ -182,13 +182,14 @@ def launch_process(cmd, logfile=None, name=None, env=None, launch_time=5):
         )
 
 
-def launch_tts(tts_port, tts_addr, logs, **_):
+def launch_tts(tts_port, tts_addr, logs, shared_memory=None, **_):
     """
     Launch the Threaded TCP Server
 
     :param tts_port: port to attach to
     :param tts_addr: address to bind to
     :param logs: logs output directory
+    :param shared_memory: name of the shared-memory ring to write downlink data into, None for no ring
     :return: process
     """
     # Open log, and prepare to close it cleanly on exit
@@ -204,6 +205,8 @@ def launch_tts(tts_port, tts_addr, logs, **_):
         "--host",
         str(tts_addr),
     ]
+    if shared_memory is not None:
+        tts_cmd.extend(["--shared-memory", shared_memory])
     return launch_process(tts_cmd, logfile=tts_log, name="TCP Server")
 
 
@@ -278,6 +281,16 @@ def launch_html(tts_port, dictionary, connect_address, logs, **extras):
             "SERVE_LOGS": "YES",
         }
     )
+    if extras.get("shared_memory") is not None:
+        gse_env["SHARED_MEMORY"] = extras["shared_memory"]
+    if extras.get("history_size") is not None:
+        gse_env["HISTORY_SIZE"] = str(extras["history_size"])
+    if extras.get("history_bytes") is not None:
+        gse_env["HISTORY_BYTES"] = str(extras["history_bytes"])
+    if extras.get("history_store") is not None:
+        gse_env["HISTORY_STORE"] = extras["history_store"]
+    if extras.get("history_store_records") is not None:
+        gse_env["HISTORY_STORE_RECORDS"] = str(extras["history_store_records"])
     gse_args = ["python3", "-u", "-m", "flask", "run"]
     ret = launch_process(gse_args, name="HTML GUI", env=gse_env, launch_time=2)
     if extras["gui"] == "html":
@@ -323,7 +336,23 @@ def launch_comm(comm_adapter, tts_port, connect_address, logs, **all_args):
         "--log-directly",
         "--comm-adapter",
         all_args["adapter"],
+        "--comm-checksum-type",
+        all_args["checksum_type"],
+        "--downlink-queue-size",
+        str(all_args["downlink_queue_size"]),
+        "--downlink-overflow-policy",
+        all_args["downlink_overflow_policy"],
+        "--uplink-batch-size",
+        str(all_args["uplink_batch_size"]),
+        "--metrics-interval",
+        str(all_args["metrics_interval"]),
+        "--metrics-port",
+        str(all_args["metrics_port"]),
+        "--comm-backend",
+        all_args["comm_backend"],
     ]
+    if all_args["comm_record"] is not None:
+        app_cmd.extend(["--comm-record", all_args["comm_record"]])
     # Manufacture arguments for the selected adapter
     for arg in comm_adapter.get_arguments().keys():
         definition = comm_adapter.get_arguments()[arg]
@@ -1,489 +1,515 @@
 #!/usr/bin/env python3
-
-import errno
+"""
+tcpserver.py:
+
+Socket server routing data between the flight software (via the comm layer) and the ground system clients. Clients
+register by sending "Register <name> [policy]\n" and then send messages of the form "A5A5 <GUI|FSW> <data>", which are
+routed to every client registered under that destination. "List\n" replies with the names of the registered clients,
+"Stats\n" with the queue metrics of each client and "Quit\n" shuts the server down. Telemetry may also be received as UDP
+datagrams on the same port. When a shared memory name is given, everything routed to GUI clients is also written once
+into a shared-memory ring read by local consumers (see shared_ring.py).
+
+The server runs on a single asyncio event loop. Each registered client owns a bounded outbound queue drained by its own
+writer task, so a slow client never delays delivery to the others. When a queue is full, the client's policy (chosen at
+registration, defaulting to the server's policy) applies. Clients receiving FSW data and the replies to List and Stats
+always use the block policy, such that uplinked data and replies are never dropped. The other policies are meant for GUI
+clients preferring fresh telemetry to a stalled ground system:
+
+1. block: the sending client waits for space (lossless, but back-pressures the sender)
+2. drop-oldest: the oldest queued message is discarded
+3. drop-newest: the new message is discarded
+4. disconnect: the slow client is disconnected
+"""
+import asyncio
+import collections
 import os
 import signal
-import socket
 import struct
 import sys
-import threading
 import time
 from optparse import OptionParser
 
 from fprime.constants import DATA_ENCODING
+from fprime_gds.common.communication.shared_ring import (
+    DEFAULT_RING_SIZE,
+    SharedRingWriter,
+)
 
-try:
-    import socketserver
-except ImportError:
-    import SocketServer as socketserver
-
-
-__version__ = 0.1
+__version__ = 0.2
 __date__ = "2015-04-03"
-__updated__ = "2016-04-07"
-
-# Universal server id global
-SERVER = None
-LOCK = None
-shutdown_event = threading.Event()
-
-FSW_clients = []
-GUI_clients = []
-FSW_ids = []
-GUI_ids = []
-
-
-def signal_handler(*_):
-    print("Ctrl-C received, server shutting down.")
-    shutdown_event.set()
+__updated__ = "2026-10-16"
 
+POLICIES = ["block", "drop-oldest", "drop-newest", "disconnect"]
+DEFAULT_POLICY = "block"
+DEFAULT_QUEUE_SIZE = 4096
+# Seconds given to clients to receive their queued messages on shutdown
+SHUTDOWN_TIMEOUT = 1.0
 
-def now():
-    return time.ctime(time.time())
+SIZE_STRUCT = struct.Struct(">I")
+QUIT_MARKER = SIZE_STRUCT.pack(0xA5A5A5A5)
+# Destinations messages can be routed to
+DESTINATIONS = [b"FSW", b"GUI"]
 
 
-class ThreadedTCPRequestHandler(socketserver.StreamRequestHandler):
+class Subscriber:
     """
-    Derived from original Stable demo during R&TD and adapted
-    for use in new FSW gse.py applicaiton.
-
-    TCP socket server for commands, log events, and telemetry data.
-    Later this will handle other things such as sequence files and parameters.
-
-    Handle is instanced in own thread for each client.
-
-    Registration is done by sending the string "Register <name>".
-    Sending a message to destination <name> is done as
-    "A5A5 <name> <data>" Note only <data> is sent.
-    Any client that sends a "List" comment makes the server display all
-    registered clients.
+    Registered client of the server. Messages routed to the client are held in a bounded queue written out to the
+    client's socket by a dedicated writer task.
     """
 
-    socketserver.StreamRequestHandler.allow_reuse_address = True
-    socketserver.StreamRequestHandler.timeout = 1
-
-    def handle(self):  # on each client connect
+    def __init__(self, name, writer, queue_size, policy, destination=None, client_id=0):
         """
-        The function that is invoked upon a new client.  This function listens
-        for data on the socket.  Packets for now are assumed to be separated
-        by a newline.  For each packet, call processPkt.
-        """
-
-        self.partial = b""
-        self.cmdQueue = []
-        self.registered = False
-        self.name = b""
-        self.id = 0
-
-        # print self.client_address, now()        # show this client's address
-        # Read the data from the socket
-        data = self.recv(13)
-
-        # Connection was closed by the client
-        if not data:
-            print("Client exited.")
-            return
+        Constructor
 
-        else:
-            # Process the data into the cmdQueue
-            self.getCmds(data)
-
-            # Process the cmdQueue
-            self.processQueue()
-
-            if self.registered:
-                print("Registration complete waiting for message.")
-                self.getNewMsg()
-            else:
-                print("Unable to register client.")
-                return
-
-        LOCK.acquire()
-        del SERVER.dest_obj[self.name]
-        if self.name in FSW_clients:
-            FSW_clients.remove(self.name)
-            FSW_ids.remove(self.id)
-        elif self.name in GUI_clients:
-            GUI_clients.remove(self.name)
-            GUI_ids.remove(self.id)
-        LOCK.release()
-
-        print("Closed %s connection." % self.name.decode(DATA_ENCODING))
-        self.registered = False
-        self.request.close()
-
-    def getCmds(self, inputString, end_of_command=b"\n"):
-        """
-        Build a command from partial or full socket input
+        :param name: registered name of the client
+        :param writer: asyncio stream writer of the client's connection
+        :param queue_size: maximum number of queued messages
+        :param policy: one of POLICIES applied when the queue is full
+        :param destination: destination the client receives messages for, None when it receives none
+        :param client_id: number of the client within its destination
         """
-        commands = inputString.split(end_of_command)
-        if len(self.partial):
-            commands[0] = self.partial + commands[0]
-            self.partial = b""
-        if len(commands[-1]):
-            self.partial = commands[-1]
-            self.cmdQueue.extend(commands[:-1])
-        else:
-            self.cmdQueue.extend(commands[:-1])
-
-    def processQueue(self):
-        for cmd in self.cmdQueue:
-            self.processRegistration(cmd)
-        self.cmdQueue = []
-
-    def processRegistration(self, cmd):
-
-        params = cmd.split()
-        process_id = 0
-
-        if params[0] == b"Register":
-            LOCK.acquire()
-            name = params[1]
-            if b"FSW" in name:
-                if FSW_clients:
-                    process_id = sorted(FSW_ids)[-1] + 1
-
-                name = params[1] + b"_" + bytes(process_id)
-                FSW_clients.append(name)
-                FSW_ids.append(process_id)
-            elif b"GUI" in name:
-                if GUI_clients:
-                    process_id = sorted(GUI_ids)[-1] + 1
-
-                name = params[1] + b"_" + bytes(process_id)
-                GUI_clients.append(name)
-                GUI_ids.append(process_id)
-
-            SERVER.dest_obj[name] = DestObj(name, self.request)
-            LOCK.release()
-
-            self.registered = True
-            self.name = name
-            self.id = process_id
-            print("Registered client " + self.name.decode(DATA_ENCODING))
-
-    #################################################
-    # New Routines to process the command messages
-    #################################################
-    def getNewMsg(self):
-        """
-        After registration wait for an incoming message
-        The first part must always be an "A5A5 " or a "List "
+        self.name = name
+        self.destination = destination
+        self.client_id = client_id
+        self.writer = writer
+        self.queue_size = queue_size
+        self.policy = policy
+        self.queue = collections.deque()
+        self.closed = False
+        # Metrics of the client, latencies are measured from queuing to the end of the write in seconds
+        self.dropped = 0
+        self.bytes_sent = 0
+        self.writes = 0
+        self.last_latency = 0.0
+        self.max_latency = 0.0
+        self.total_latency = 0.0
+        self.__queued_time = None
+        self.__ready = asyncio.Event()
+        self.__space = asyncio.Event()
+        self.__task = asyncio.ensure_future(self.__write_queue())
+
+    def offer(self, msg, policy=None):
         """
+        Queues a message without waiting, applying the overflow policy when the queue is full
 
-        # Loop while the connected client has packets to send/receive
-        while not shutdown_event.is_set():
-            # Read the header data from the socket either A5A5 or List
-            header = self.readHeader()
-
-            # If the received header is an empty string, connection closed, exit loop
-            if not header:
-                break
-
-            elif header == b"Quit":
-                LOCK.acquire()
-                print("Quit received!")
-                SERVER.dest_obj[self.name].put(struct.pack(">I", 0xA5A5A5A5))
-                shutdown_event.set()
-                time.sleep(1)
-                print("Quit processed!")
-                SERVER.shutdown()
-                SERVER.server_close()
-                LOCK.release()
-                break
-
-            # Got the header data so read the data of the message here...
-            data = self.readData(header)
-
-            # Process and send the packet of the message here...
-            self.processNewPkt(header, data)
-
-    def recv(self, l):
-        """
-        Read l bytes from socket.
+        :param msg: message to send to the client
+        :param policy: one of POLICIES overriding the client's policy for this message. None uses the client's policy.
+        :return: False when the message was not handled as the block policy requires waiting, True otherwise
         """
-        chunk = b""
-        msg = b""
-        n = 0
-        while l > n:
-            try:
-                chunk = self.request.recv(l - n)
-                if chunk == b"":
-                    print("read data from socket is empty!")
-                    return b""
-                msg = msg + chunk
-                n = len(msg)
-            except socket.timeout:
-                if shutdown_event.is_set():
-                    print("socket timed out and shutdown is requested")
-                    return b"Quit\n"
-                continue
-            except OSError as err:
-                if err.errno == errno.ECONNRESET:
-                    print(
-                        "Socket error "
-                        + str(err.errno)
-                        + " (Connection reset by peer) occurred on recv()."
+        if self.closed:
+            return True
+        policy = self.policy if policy is None else policy
+        if len(self.queue) >= self.queue_size:
+            if policy == "block":
+                return False
+            if policy == "drop-newest":
+                self.dropped += 1
+                return True
+            if policy == "disconnect":
+                print(
+                    "Disconnecting slow client {}".format(
+                        self.name.decode(DATA_ENCODING)
                     )
-                else:
-                    print("Socket error " + str(err.errno) + " occurred on recv().")
-        return msg
+                )
+                self.abort()
+                return True
+            self.queue.popleft()
+            self.dropped += 1
+        if not self.queue:
+            self.__queued_time = time.monotonic()
+        self.queue.append(msg)
+        self.__ready.set()
+        return True
+
+    async def put(self, msg, policy=None):
+        """
+        Queues a message, waiting for space in the queue when required by the block policy
 
-    def readHeader(self):
+        :param msg: message to send to the client
+        :param policy: one of POLICIES overriding the client's policy for this message. None uses the client's policy.
         """
-        Read the 9 byte header (e.g. "A5A5 GUI " or "A5A5 FSW "),
-        or just read the "List\n" command.
+        while not self.offer(msg, policy):
+            self.__space.clear()
+            await self.__space.wait()
+
+    def close(self):
+        """ Closes the client once its already queued messages are written """
+        self.closed = True
+        self.__ready.set()
+        self.__space.set()
+
+    def abort(self):
+        """ Closes the client immediately, discarding queued and unsent messages """
+        self.queue.clear()
+        self.close()
+        self.writer.transport.abort()
+
+    async def wait_closed(self):
+        """ Waits for the writer task to finish """
+        await self.__task
+
+    def get_stats(self):
         """
-        header = self.recv(5)
+        Gets the metrics of this client
 
-        if len(header) == 0:
-            print(
-                "Header information is empty, client "
-                + self.name.decode(DATA_ENCODING)
-                + " exiting."
+        :return: string describing the policy, queue depth, drops, bytes sent and send latencies of the client
+        """
+        mean_latency = self.total_latency / self.writes if self.writes else 0.0
+        return (
+            "{} policy={} depth={}/{} drops={} bytes={} writes={} "
+            "latency_ms=(last={:.3f} mean={:.3f} max={:.3f})".format(
+                self.name.decode(DATA_ENCODING),
+                self.policy,
+                len(self.queue),
+                self.queue_size,
+                self.dropped,
+                self.bytes_sent,
+                self.writes,
+                self.last_latency * 1000,
+                mean_latency * 1000,
+                self.max_latency * 1000,
             )
-            return header
-        if header == b"List\n":
-            return b"List"
-        elif header == b"Quit\n":
-            return b"Quit"
-        elif header[:-1] == b"A5A5":
-            header2 = self.recv(4)
-            return header + header2
-        else:
-            return
+        )
 
-    def readData(self, header):
-        """
-        Read the data part of the message sent to either GUI or FSW.
-        GUI receives telemetry.
-        FSW receives commands of various lengths.
-        """
-        data = b""
-        if header == b"List":
-            return b""
-        elif header == b"Quit":
-            return b""
-        dst = header.split(b" ")[1].strip(b" ")
-        if dst == b"FSW":
-            # Read variable length command data here...
-            desc = self.recv(4)
-            sizeb = self.recv(4)
-            size = struct.unpack(">I", sizeb)[0]
-            data = desc + sizeb + self.recv(size)
-        elif dst == b"GUI":
-            # Read telemetry data here...
-            tlm_packet_size = self.recv(4)
-            size = struct.unpack(">I", tlm_packet_size)[0]
-            data = tlm_packet_size + self.recv(size)
-
-        else:
-            raise RuntimeError("unrecognized client %s" % dst.decode(DATA_ENCODING))
-        return data
-
-    def processNewPkt(self, header, data):
-        """
-        Process a single command here header and data here.
-        The command must always start with A5A5 except if it is a List.
-        Once the entire header tstring is processed send it on queue.
-        If something goes wrong report and shutdown server.
-        """
-        dest_list = []
-
-        if header == b"List":
-            print("List of registered clients: ")
-            LOCK.acquire()
-            for d in list(SERVER.dest_obj.keys()):
-                print("\t" + SERVER.dest_obj[d].name.decode(DATA_ENCODING))
-                reg_client_str = b"List " + SERVER.dest_obj[d].name
-                l = len(reg_client_str)
-                reg_client_str = struct.pack("i%ds" % l, l, reg_client_str)
-                self.request.send(reg_client_str)
-            LOCK.release()
-            return 0
-
-        # Process data here...
-        head, dst = header.strip(b" ").split(b" ")
-        if head == b"A5A5":  # Packet Header
-            # print "Received Packet: %s %s...\n" % (head,dst)
-            if data == b"":
-                print(" Data is empty, returning.")
-            if b"GUI" in dst:
-                dest_list = GUI_clients
-            elif b"FSW" in dst:
-                dest_list = FSW_clients
-            for dest_elem in dest_list:
-                # print "Locking TCP"
-                LOCK.acquire()
-                if dest_elem in list(SERVER.dest_obj.keys()):
-                    # Send the message here....
-                    # print "Sending TCP msg to ", dest_elem
-
-                    SERVER.dest_obj[dest_elem].put(data)
-                LOCK.release()
-        else:
-            raise RuntimeError("Packet missing A5A5 header")
-
-
-class ThreadedUDPRequestHandler(socketserver.BaseRequestHandler):
+    async def __write_queue(self):
+        """ Writes out queued messages in batches until closed """
+        try:
+            while True:
+                if not self.queue:
+                    if self.closed:
+                        break
+                    self.__ready.clear()
+                    await self.__ready.wait()
+                    continue
+                batch = b"".join(self.queue)
+                self.queue.clear()
+                queued_time = self.__queued_time
+                self.__space.set()
+                self.writer.write(batch)
+                await self.writer.drain()
+                latency = time.monotonic() - queued_time
+                self.bytes_sent += len(batch)
+                self.writes += 1
+                self.last_latency = latency
+                self.max_latency = max(self.max_latency, latency)
+                self.total_latency += latency
+        except (ConnectionError, OSError) as err:
+            print("Socket error {} occurred on send().".format(err))
+        finally:
+            self.closed = True
+            self.queue.clear()
+            self.__space.set()
+            self.writer.close()
+
+
+class TcpServer:
     """
-    Derived from original Stable demo during R&TD and adapted
-    for use in new FSW gse.py applicaiton.
-
-    TCP socket server for commands, log events, and telemetry data.
-    Later this will handle other things such as sequence files and parameters.
-
-    Handle is instanced in own thread for each client.
-
-    Registration is done by sending the string "Register <name>".
-    Sending a message to destination <name> is done as
-    "A5A5 <name> <data>" Note only <data> is sent.
-    Any client that sends a "List" comment makes the server display all
-    registered clients.
+    Routes messages between registered clients. Routing tables are replaced rather than mutated on registration
+    changes, so that routing may iterate over them without copying.
     """
 
-    socketserver.BaseRequestHandler.allow_reuse_address = True
+    def __init__(
+        self, queue_size=DEFAULT_QUEUE_SIZE, policy=DEFAULT_POLICY, shared_ring=None
+    ):
+        """
+        Constructor
 
-    def handle(self):  # on each packet
+        :param queue_size: maximum number of queued messages of each client
+        :param policy: one of POLICIES applied when a client's queue is full
+        :param shared_ring: SharedRingWriter also receiving the data routed to GUI clients. None to disable.
         """
-        The function that is invoked when a packet is received.  This function listens
-        for data on the socket.  Packets for now are assumed to be separated
-        by a newline.  For each packet, call processPkt.
+        if policy not in POLICIES:
+            raise ValueError(
+                "Unknown policy {}, expected one of {}".format(policy, POLICIES)
+            )
+        self.queue_size = queue_size
+        self.policy = policy
+        self.shared_ring = shared_ring
+        self.clients = {}
+        self.routes = {destination: () for destination in DESTINATIONS}
+        # Client numbers in use by destination, clients of no destination are numbered under None
+        self.ids = {destination: set() for destination in DESTINATIONS + [None]}
+        self.port = None
+        self.__server = None
+        self.__udp_transport = None
+        self.__udp_task = None
+        self.__udp_queue = None
+        self.__stopped = None
+        self.__handlers = set()
+
+    def register(self, name, writer, policy=None):
         """
+        Registers a client, numbering it within its destination such that clients registering under the same name are
+        kept apart
+
+        :param name: name the client registered as
+        :param writer: asyncio stream writer of the client's connection
+        :param policy: one of POLICIES applied when the client's queue is full. None uses the server's policy. Clients
+                       receiving FSW data always use the block policy.
+        :return: subscriber of the registered client
+        """
+        if policy is None:
+            policy = self.policy
+        destination = next((dest for dest in DESTINATIONS if dest in name), None)
+        if destination == b"FSW":
+            policy = "block"
+        ids = self.ids[destination]
+        process_id = max(ids) + 1 if ids else 0
+        ids.add(process_id)
+        name = name + b"_" + str(process_id).encode(DATA_ENCODING)
+        subscriber = Subscriber(
+            name, writer, self.queue_size, policy, destination, process_id
+        )
+        self.clients[name] = subscriber
+        if destination is not None:
+            self.routes[destination] = self.routes[destination] + (subscriber,)
+        print("Registered client {} ({})".format(name.decode(DATA_ENCODING), policy))
+        return subscriber
 
-        self.getNewMsg(self.request[0])
-
-    #################################################
-    # New Routines to process the command messages
-    #################################################
-    def getNewMsg(self, packet):
+    def unregister(self, subscriber):
         """
-        After registration wait for an incoming message
-        The first part must always be an "A5A5 " or a "List "
+        Removes a client from the routing tables and closes it
+
+        :param subscriber: subscriber of the client to remove
         """
+        if self.clients.get(subscriber.name) is subscriber:
+            del self.clients[subscriber.name]
+        if subscriber.destination is not None:
+            self.routes[subscriber.destination] = tuple(
+                other
+                for other in self.routes[subscriber.destination]
+                if other is not subscriber
+            )
+        self.ids[subscriber.destination].discard(subscriber.client_id)
+        subscriber.close()
+        print("Closed %s connection." % subscriber.name.decode(DATA_ENCODING))
 
-        # Read the header data from the socket either A5A5 or List
-        (header, packet) = self.readHeader(packet)
+    async def route(self, destination, data):
+        """
+        Routes data to all clients registered for the destination
 
-        # If the received header is an empty string, connection closed, exit loop
-        if not header:
-            return
+        :param destination: destination of the data, one of DESTINATIONS
+        :param data: data to send
+        """
+        if self.shared_ring is not None and destination == b"GUI":
+            try:
+                self.shared_ring.write(data)
+            except ValueError as err:
+                print("Unable to write to shared memory: {}".format(err))
+        for subscriber in self.routes.get(destination, ()):
+            if not subscriber.offer(data):
+                await subscriber.put(data)
+
+    def list_clients(self):
+        """
+        Produces the reply to a List command, printing the registered clients
 
-        # Got the header data so read the data of the message here...
-        data = self.readData(header, packet)
+        :return: reply to send to the client
+        """
+        print("List of registered clients: ")
+        replies = []
+        for name in self.clients:
+            print("\t" + name.decode(DATA_ENCODING))
+            reg_client_str = b"List " + name
+            replies.append(
+                struct.pack(
+                    "i%ds" % len(reg_client_str), len(reg_client_str), reg_client_str
+                )
+            )
+        return b"".join(replies)
 
-        # Process and send the packet of the message here...
-        self.processNewPkt(header, data)
+    def client_stats(self):
+        """
+        Produces the reply to a Stats command, printing the metrics of the registered clients
 
-    def readHeader(self, packet):
+        :return: reply to send to the client
         """
-        Read the 9 byte header (e.g. "A5A5 GUI " or "A5A5 FSW "),
-        or just read the "List\n" command.
+        print("Statistics of registered clients: ")
+        replies = []
+        for subscriber in self.clients.values():
+            stats = subscriber.get_stats()
+            print("\t" + stats)
+            stats_str = b"Stats " + stats.encode(DATA_ENCODING)
+            replies.append(
+                struct.pack("i%ds" % len(stats_str), len(stats_str), stats_str)
+            )
+        return b"".join(replies)
+
+    async def handle_client(self, reader, writer):
         """
-        header = packet[:4]
-        header2 = packet[4:9]
-        packet = packet[9:]
-        return (header + header2, packet)
+        Handles a client connection: registration followed by messages until the client disconnects or quits
 
-    def readData(self, header, packet):
+        :param reader: asyncio stream reader of the connection
+        :param writer: asyncio stream writer of the connection
         """
-        Read the data part of the message sent to either GUI or FSW.
-        GUI receives telemetry.
-        FSW receives commands of various lengths.
+        try:
+            registration = (await reader.readline()).split()
+        except (ConnectionError, OSError):
+            registration = []
+        if len(registration) < 2 or registration[0] != b"Register":
+            print("Unable to register client.")
+            writer.close()
+            return
+        policy = None
+        if len(registration) > 2:
+            policy = registration[2].decode(DATA_ENCODING)
+            if policy not in POLICIES:
+                print("Unknown policy {}, using {}".format(policy, self.policy))
+                policy = None
+        subscriber = self.register(registration[1], writer, policy)
+        print("Registration complete waiting for message.")
+        handled = asyncio.get_event_loop().create_future()
+        self.__handlers.add(handled)
+        try:
+            while not subscriber.closed:
+                header = await reader.readexactly(5)
+                if header == b"List\n":
+                    await subscriber.put(self.list_clients(), "block")
+                elif header == b"Stats":
+                    # Trailing newline of the command
+                    await reader.readexactly(1)
+                    await subscriber.put(self.client_stats(), "block")
+                elif header == b"Quit\n":
+                    print("Quit received!")
+                    subscriber.offer(QUIT_MARKER)
+                    self.shutdown()
+                    break
+                elif header == b"A5A5 ":
+                    destination = (await reader.readexactly(4)).strip()
+                    if destination == b"FSW":
+                        # Descriptor and size precede variable length command data
+                        prefix = await reader.readexactly(8)
+                        size = SIZE_STRUCT.unpack_from(prefix, 4)[0]
+                    elif destination == b"GUI":
+                        prefix = await reader.readexactly(4)
+                        size = SIZE_STRUCT.unpack(prefix)[0]
+                    else:
+                        print(
+                            "unrecognized client %s" % destination.decode(DATA_ENCODING)
+                        )
+                        break
+                    await self.route(
+                        destination, prefix + await reader.readexactly(size)
+                    )
+                else:
+                    print("Packet missing A5A5 header")
+                    break
+        except asyncio.IncompleteReadError:
+            pass
+        except (ConnectionError, OSError) as err:
+            print("Socket error {} occurred on recv().".format(err))
+        finally:
+            self.unregister(subscriber)
+            await subscriber.wait_closed()
+            self.__handlers.discard(handled)
+            handled.set_result(None)
+
+    def datagram_received(self, data):
         """
-        data = ""
-        header.split(b" ")[1].strip(b" ")
-        # Read telemetry data here...
-        tlm_packet_size = packet[:4]
-        size = struct.unpack(">I", tlm_packet_size)[0]
-        data = tlm_packet_size + packet[4 : 4 + size]
-
-        return data
+        Queues a UDP telemetry datagram of the form "A5A5 GUI <size> <data>" for routing
 
-    def processNewPkt(self, header, data):
-        """
-        Process a single command here header and data here.
-        The command must always start with A5A5 except if it is a List.
-        Once the entire header string is processed send it on queue.
-        If something goes wrong report and shutdown server.
+        :param data: datagram received
         """
-        dest_list = []
-        # Process data here...
-        head, dst = header.strip(b" ").split(b" ")
-        if head == b"A5A5":  # Packet Header
-            # print "Received Packet: %s %s...\n" % (head,dst)
-            if data == "":
-                print(" Data is empty, returning.")
-            if b"GUI" in dst:
-                dest_list = GUI_clients
-            else:
-                print("dest? %s" % dst.decode(DATA_ENCODING))
-            for dest_elem in dest_list:
-                LOCK.acquire()
-                if dest_elem in list(SERVER.dest_obj.keys()):
-                    # Send the message here....
-                    # print "Sending UDP msg to ", dest_elem
-
-                    SERVER.dest_obj[dest_elem].put(data)
-                LOCK.release()
-        else:
-            raise RuntimeError("Telemetry missing A5A5 header")
-
-
-class ThreadedTCPServer(socketserver.ThreadingMixIn, socketserver.TCPServer):
-    """
-    TCP Socket server.
+        if data[:5] != b"A5A5 ":
+            print("Telemetry missing A5A5 header")
+            return
+        destination = data[5:9].strip()
+        if destination != b"GUI":
+            print("dest? %s" % destination.decode(DATA_ENCODING))
+            return
+        size = SIZE_STRUCT.unpack_from(data, 9)[0]
+        self.__udp_queue.put_nowait(data[9 : 13 + size])
 
-    Keep a dictionary of destination objects containing queues and
-    socket id's for writting to destinations.
-    """
+    async def __route_datagrams(self):
+        """ Routes queued UDP telemetry in order of reception """
+        while True:
+            await self.route(b"GUI", await self.__udp_queue.get())
 
-    dest_obj = dict()
-    lock_obj = threading.Lock()
+    async def start(self, host, port):
+        """
+        Starts listening for TCP clients and UDP telemetry
 
+        :param host: address to bind to
+        :param port: port to bind to, 0 selects a free port
+        :return: port listened on
+        """
+        loop = asyncio.get_event_loop()
+        self.__stopped = asyncio.Event()
+        self.__udp_queue = asyncio.Queue()
+        self.__server = await asyncio.start_server(self.handle_client, host, port)
+        self.port = self.__server.sockets[0].getsockname()[1]
+        self.__udp_transport, _ = await loop.create_datagram_endpoint(
+            lambda: UdpProtocol(self), local_addr=(host, self.port)
+        )
+        self.__udp_task = asyncio.ensure_future(self.__route_datagrams())
+        return self.port
 
-class ThreadedUDPServer(socketserver.ThreadingMixIn, socketserver.UDPServer):
-    """
-    UDP Socket server.
-    """
+    def shutdown(self):
+        """ Stops the server, closing all clients once their queued messages are written """
+        if self.__stopped is None or self.__stopped.is_set():
+            return
+        self.__server.close()
+        self.__udp_transport.close()
+        self.__udp_task.cancel()
+        for subscriber in list(self.clients.values()):
+            subscriber.close()
+        self.__stopped.set()
+
+    async def wait_closed(self):
+        """ Waits for the server to be shutdown and all clients to be closed """
+        await self.__stopped.wait()
+        subscribers = list(self.clients.values())
+        if subscribers:
+            _, pending = await asyncio.wait(
+                [
+                    asyncio.ensure_future(subscriber.wait_closed())
+                    for subscriber in subscribers
+                ],
+                timeout=SHUTDOWN_TIMEOUT,
+            )
+            if pending:
+                for subscriber in subscribers:
+                    subscriber.abort()
+                await asyncio.wait(pending)
+        if self.__handlers:
+            await asyncio.wait(list(self.__handlers))
+
+    async def serve(self, host, port):
+        """
+        Serves clients until shutdown
 
+        :param host: address to bind to
+        :param port: port to bind to
+        """
+        await self.start(host, port)
+        print(
+            "TCP Socket Server listening on host addr {}, port {}".format(
+                host, self.port
+            )
+        )
+        await self.wait_closed()
 
-class DestObj:
-    """
-    Destination object for all clients registered.
-    """
 
-    def __init__(self, name, request):
-        """
-        Constructor
-        """
-        self.name = name
-        self.socket = request
-        self.packet = b""
+class UdpProtocol(asyncio.DatagramProtocol):
+    """ Passes UDP datagrams to the server """
 
-    def put(self, msg):
-        """
-        Write out the message to the destination socket
-        """
+    def __init__(self, server):
+        """ Constructor """
+        self.server = server
 
+    def datagram_received(self, data, addr):
+        """ Passes a received datagram to the server """
         try:
-            # print "about to send data to " + self.name
-            self.socket.send(msg)
-        except OSError as err:
-            print("Socket error " + str(err.errno) + " occurred on send().")
-
-    def fileno(self):
-        """"""
-        return self.socket
+            self.server.datagram_received(data)
+        except struct.error:
+            print("Truncated UDP telemetry dropped")
 
 
 def main(argv=None):
-    global SERVER, LOCK
-
     program_name = os.path.basename(sys.argv[0])
     program_license = "Copyright 2015 user_name (California Institute of Technology)                                            \
                 ALL RIGHTS RESERVED. U.S. Government Sponsorship acknowledged."
-    program_version = "v0.1"
+    program_version = "v0.2"
     program_build_date = "%s" % __updated__
     program_version_string = "%prog {} ({})".format(program_version, program_build_date)
     program_longdesc = (
@@ -517,43 +543,66 @@ def main(argv=None):
             help="Set threaded tcp socket server ip [default: %default]",
             default="127.0.0.1",
         )
+        parser.add_option(
+            "-q",
+            "--queue-size",
+            dest="queue_size",
+            action="store",
+            type="int",
+            help="Set the maximum number of messages queued for each client [default: %default]",
+            default=DEFAULT_QUEUE_SIZE,
+        )
+        parser.add_option(
+            "--policy",
+            dest="policy",
+            action="store",
+            type="choice",
+            choices=POLICIES,
+            help="Set the policy applied when a client's queue is full, unless chosen by the client at "
+            "registration {} [default: %default]".format(POLICIES),
+            default=DEFAULT_POLICY,
+        )
+
+        parser.add_option(
+            "--shared-memory",
+            dest="shared_memory",
+            action="store",
+            type="string",
+            help="Set the name of a shared-memory ring to also write GUI data into [default: %default]",
+            default=None,
+        )
+        parser.add_option(
+            "--shared-memory-size",
+            dest="shared_memory_size",
+            action="store",
+            type="int",
+            help="Set the size in bytes of the shared-memory ring [default: %default]",
+            default=DEFAULT_RING_SIZE,
+        )
 
         # process options
         (opts, args) = parser.parse_args(argv)
 
-        HOST = opts.host
-        PORT = opts.port
-        server = ThreadedTCPServer((HOST, PORT), ThreadedTCPRequestHandler)
-        udp_server = ThreadedUDPServer((HOST, PORT), ThreadedUDPRequestHandler)
-        # Hopefully this will allow address reuse and server to restart immediately
-        server.allow_reuse_address = True
-        SERVER = server
-        LOCK = server.lock_obj
-
-        print("TCP Socket Server listening on host addr {}, port {}".format(HOST, PORT))
-        # Start a thread with the server -- that thread will then start one
-        # more thread for each request
-        server_thread = threading.Thread(target=server.serve_forever)
-        udp_server_thread = threading.Thread(target=udp_server.serve_forever)
-        signal.signal(signal.SIGINT, signal_handler)
-        server_thread.daemon = False
-        server_thread.start()
-        udp_server_thread.daemon = False
-        udp_server_thread.start()
+        shared_ring = None
+        if opts.shared_memory is not None:
+            shared_ring = SharedRingWriter(opts.shared_memory, opts.shared_memory_size)
+        server = TcpServer(opts.queue_size, opts.policy, shared_ring)
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
 
-        while not shutdown_event.is_set():
-            server_thread.join(timeout=5.0)
-            udp_server_thread.join(timeout=5.0)
+        def signal_handler(*_):
+            print("Ctrl-C received, server shutting down.")
+            loop.call_soon_threadsafe(server.shutdown)
 
+        signal.signal(signal.SIGINT, signal_handler)
+        try:
+            loop.run_until_complete(server.serve(opts.host, opts.port))
+        finally:
+            loop.close()
+            if shared_ring is not None:
+                shared_ring.close()
         print("shutdown from main thread")
 
-        SERVER.shutdown()
-        SERVER.server_close()
-        udp_server.shutdown()
-        udp_server.server_close()
-
-        time.sleep(1)
-
     except Exception as e:
         indent = len(program_name) * " "
         sys.stderr.write(program_name + ": " + repr(e) + "\n")
@@ -62,6 +62,11 @@ def construct_app():
         app.config["LOG_DIR"],
         app.config["ADDRESS"],
         app.config["PORT"],
+        app.config["SHARED_MEMORY"],
+        app.config["HISTORY_SIZE"],
+        app.config["HISTORY_BYTES"],
+        app.config["HISTORY_STORE"],
+        app.config["HISTORY_STORE_RECORDS"],
     )
     # Restful API registration
     api = flask_restful.Api(app)
@@ -105,6 +110,11 @@ def construct_app():
         "/channels",
         resource_class_args=[pipeline.histories.channels],
     )
+    api.add_resource(
+        fprime_gds.flask.channels.ChannelLatest,
+        "/channels/latest",
+        resource_class_args=[pipeline.histories.latest_channels],
+    )
     api.add_resource(
         fprime_gds.flask.updown.Destination,
         "/upload/destination",
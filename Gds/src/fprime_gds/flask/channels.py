@@ -15,6 +15,23 @@ import flask_restful
 import flask_restful.reqparse
 
 
+def add_display_text(chans):
+    """
+    Adds the 'display_text' formatted from the template to each channel, along with a getter
+
+    :param chans: list of channel objects
+    """
+    for chan in chans:
+        if chan.template.get_format_str() is not None:
+            setattr(
+                chan,
+                "display_text",
+                chan.template.get_format_str() % (chan.val_obj.val),
+            )
+            func = lambda this: this.display_text
+            setattr(chan, "get_display_text", types.MethodType(func, chan))
+
+
 class ChannelDictionary(flask_restful.Resource):
     """
     Channel dictionary endpoint. Will return dictionary when hit with a GET.
@@ -58,16 +75,7 @@ class ChannelHistory(flask_restful.Resource):
         args = self.parser.parse_args()
         new_chans = self.history.retrieve(start=args.get("session"))
         self.history.clear()
-        for chan in new_chans:
-            # Add the 'display_text' to the event, along with a getter
-            if chan.template.get_format_str() is not None:
-                setattr(
-                    chan,
-                    "display_text",
-                    chan.template.get_format_str() % (chan.val_obj.val),
-                )
-                func = lambda this: this.display_text
-                setattr(chan, "get_display_text", types.MethodType(func, chan))
+        add_display_text(new_chans)
         return {"history": new_chans}
 
     def delete(self):
@@ -76,3 +84,39 @@ class ChannelHistory(flask_restful.Resource):
         """
         args = self.parser.parse_args()
         self.history.clear(start=args.get("session"))
+
+
+class ChannelLatest(flask_restful.Resource):
+    """
+    Endpoint returning the latest value of each channel. With a session, only the channels updated since the session's
+    previous request are returned.
+    """
+
+    def __init__(self, history):
+        """
+        Constructor used to setup the session argument
+
+        :param history: latest channel values history
+        """
+        self.parser = flask_restful.reqparse.RequestParser()
+        self.parser.add_argument(
+            "session", required=False, help="Session key for fetching updates."
+        )
+        self.history = history
+
+    def get(self):
+        """
+        Return the latest channel values
+        """
+        args = self.parser.parse_args()
+        latest = self.history.retrieve(start=args.get("session"))
+        add_display_text(latest)
+        return {"latest": latest}
+
+    def delete(self):
+        """
+        Forget a session, its next request receives every channel again. Without a session nothing is cleared.
+        """
+        args = self.parser.parse_args()
+        if args.get("session") is not None:
+            self.history.clear(start=args.get("session"))
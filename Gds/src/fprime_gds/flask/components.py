@@ -6,6 +6,7 @@ pipeline and other components are created to interact with Flask.
 """
 import os
 
+import fprime_gds.common.pipeline.histories
 import fprime_gds.common.pipeline.standard
 
 # Module variables, should remain hidden. These are singleton top-level objects used by Flask, and its various
@@ -14,7 +15,19 @@ __PIPELINE = None
 
 
 def setup_pipelined_components(
-    debug, logger, config, dictionary, down_store, log_dir, tts_address, tts_port
+    debug,
+    logger,
+    config,
+    dictionary,
+    down_store,
+    log_dir,
+    tts_address,
+    tts_port,
+    shared_memory=None,
+    history_size=fprime_gds.common.pipeline.histories.DEFAULT_HISTORY_SIZE,
+    history_bytes=0,
+    history_store=None,
+    history_store_records=0,
 ):
     """
     Setup the standard pipeline and related components. This is done once, and then the resulting singletons are
@@ -26,6 +39,11 @@ def setup_pipelined_components(
     :param log_dir: log directory to write logs to, and serve logs from
     :param tts_address: address to the middleware layer
     :param tts_port: port of the middleware layer
+    :param shared_memory: name of the middleware's shared-memory ring to read data from, None to read the socket
+    :param history_size: maximum number of objects kept by each history, 0 for no limit
+    :param history_bytes: maximum estimated bytes kept by each history, 0 for no limit
+    :param history_store: directory of persistent histories, None to keep histories in memory
+    :param history_store_records: number of most recent objects kept by each persistent history, 0 for no limit
     :return: F prime pipeline
     """
     global __PIPELINE
@@ -35,7 +53,17 @@ def setup_pipelined_components(
         or os.environ.get("WERKZEUG_RUN_MAIN") == "true"
     ):
         pipeline = fprime_gds.common.pipeline.standard.StandardPipeline()
-        pipeline.setup(config, dictionary, down_store, logging_prefix=log_dir)
+        pipeline.setup(
+            config,
+            dictionary,
+            down_store,
+            logging_prefix=log_dir,
+            shared_memory=shared_memory,
+            history_size=history_size or None,
+            history_bytes=history_bytes or None,
+            history_store=history_store,
+            history_store_records=history_store_records or None,
+        )
         logger.info(
             "Connecting to GDS at: {}:{} from pid: {}".format(
                 tts_address, tts_port, os.getpid()
@@ -10,6 +10,7 @@
 ####
 import os
 
+import fprime_gds.common.pipeline.histories
 import fprime_gds.common.utils.config_manager
 
 # Select uploads directory and create it
@@ -20,6 +21,16 @@ DOWNLINK_DIR = os.environ.get("DOWN_FILES_DIR", "/tmp/fprime-downlink/")
 DICTIONARY = os.environ.get("DICTIONARY", None)
 PORT = int(os.environ.get("TTS_PORT", "50050"), 0)
 ADDRESS = os.environ.get("TTS_ADDR", "0.0.0.0")
+SHARED_MEMORY = os.environ.get("SHARED_MEMORY", None)
+# Capacity of each history, 0 for no limit
+HISTORY_SIZE = int(
+    os.environ.get(
+        "HISTORY_SIZE", str(fprime_gds.common.pipeline.histories.DEFAULT_HISTORY_SIZE)
+    )
+)
+HISTORY_BYTES = int(os.environ.get("HISTORY_BYTES", "0"))
+HISTORY_STORE = os.environ.get("HISTORY_STORE", None)
+HISTORY_STORE_RECORDS = int(os.environ.get("HISTORY_STORE_RECORDS", "0"))
 LOG_DIR = os.environ.get("LOG_DIR", None)
 SERVE_LOGS = os.environ.get("SERVE_LOGS", "YES") == "YES"
 UPLOADED_UPLINK_DEST = uplink_dir
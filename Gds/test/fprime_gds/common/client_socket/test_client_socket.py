@@ -0,0 +1,101 @@
+"""
+Tests the receive path of the threaded client socket
+
+Created on Oct 16, 2026
+"""
+import os
+import socket
+import threading
+import time
+
+import pytest
+
+from fprime_gds.common.client_socket.client_socket import (
+    GUI_TAG,
+    SharedMemorySocketClient,
+    ThreadedTCPSocketClient,
+)
+from fprime_gds.common.communication.shared_ring import SharedRingWriter, shared_memory
+
+
+class RecordingDistributor:
+    """ Distributor recording the data it receives """
+
+    def __init__(self):
+        self.chunks = []
+
+    def on_recv(self, data):
+        self.chunks.append(data)
+
+
+def test_recv_coalesces():
+    """ Tests data already waiting on the socket is coalesced into buffer sized dispatches """
+    local, remote = socket.socketpair()
+    client = ThreadedTCPSocketClient(sock=local, buffer_size=4096)
+    distributor = RecordingDistributor()
+    client.register_distributor(distributor)
+    data = bytes(range(256)) * 40
+    remote.sendall(data)
+    remote.close()
+
+    thread = threading.Thread(target=client.recv)
+    thread.start()
+    thread.join(timeout=5)
+    local.close()
+
+    assert not thread.is_alive(), "receive thread should stop when the server closes"
+    assert b"".join(distributor.chunks) == data
+    assert all(len(chunk) <= 4096 for chunk in distributor.chunks)
+    assert client.bytes_received == len(data)
+    assert client.dispatches == len(distributor.chunks) <= client.reads
+    bytes_rate, reads_rate = client.get_rates()
+    assert bytes_rate > 0 and reads_rate > 0
+
+
+@pytest.mark.skipif(shared_memory is None, reason="shared memory requires python 3.8+")
+def test_shared_memory_client():
+    """ Tests the shared memory client distributes the ring's data and registers as send only """
+    ring_name = "fprime_test_client_ring_{}".format(os.getpid())
+    writer = SharedRingWriter(ring_name, 4096)
+    local, remote = socket.socketpair()
+    client = SharedMemorySocketClient(ring_name, sock=local, poll_interval=0.001)
+    distributor = RecordingDistributor()
+    client.register_distributor(distributor)
+    client.register_to_server(GUI_TAG)
+    assert remote.recv(100) == b"Register SHM\n"
+
+    thread = threading.Thread(target=client.recv)
+    thread.start()
+    try:
+        # Wait for the client to attach before writing
+        time.sleep(0.1)
+        for index in range(10):
+            writer.write(bytes([index]) * 100)
+        deadline = time.time() + 5
+        while len(b"".join(distributor.chunks)) < 1000 and time.time() < deadline:
+            time.sleep(0.01)
+    finally:
+        client.stop_event.set()
+        thread.join()
+        local.close()
+        remote.close()
+        writer.close()
+    assert b"".join(distributor.chunks) == b"".join(
+        bytes([index]) * 100 for index in range(10)
+    )
+    assert client.bytes_received == 1000
+
+
+@pytest.mark.skipif(shared_memory is None, reason="shared memory requires python 3.8+")
+def test_shared_memory_client_missing_ring():
+    """ Tests a missing ring is reported by connect rather than ending the receive thread """
+    local, remote = socket.socketpair()
+    client = SharedMemorySocketClient(
+        "fprime_test_missing_ring_{}".format(os.getpid()), sock=local
+    )
+    try:
+        with pytest.raises(FileNotFoundError):
+            client.connect("127.0.0.1", 0)
+    finally:
+        local.close()
+        remote.close()
@@ -0,0 +1,206 @@
+"""
+framing_benchmark.py:
+
+Benchmark of the comm layer deframers. Synthetic streams are generated for each deframer and pushed through both the
+"deframe_all" pool contract (as used by TCPGround) and the StreamDeframer (as used by the Downlinker). The following
+stream scenarios are produced:
+
+1. clean: back to back frames of random sizes
+2. garbage: random garbage (never containing a start token byte) between frames
+3. split: the clean stream delivered in small chunks of a random size, such that frames are split across chunks
+4. maximum: frames of the largest size accepted by the deframer
+
+Frames/sec and bytes/sec are reported for each deframer, scenario and mode. The same streams are used by
+test_framing_corpus.py to check that every packet is recovered, along with the splits of generate_splits cutting a few
+frames at every byte offset. Run with:
+
+```
+python framing_benchmark.py [--duration SECONDS] [--minimum FRAMES_PER_SECOND]
+```
+
+When --minimum is supplied, the exit code is non-zero if any run falls below that rate, allowing this benchmark to be
+used as a regression gate on the deframing hot path.
+"""
+import argparse
+import random
+import sys
+import time
+
+from fprime_gds.common.communication.framing import (
+    FpFramerDeframer,
+    StreamDeframer,
+    TcpServerFramerDeframer,
+)
+
+SCENARIOS = ["clean", "garbage", "split", "maximum"]
+MODES = ["deframe_all", "stream"]
+
+
+def tcp_server_frame(packet):
+    """ Frames a packet in the uplink format consumed by the TcpServerFramerDeframer """
+    return b"ZZZZ" + len(packet).to_bytes(4, "big") + packet
+
+
+# Deframer name to (deframer factory, frame function, byte never part of a start token, maximum packet size)
+DEFRAMERS = {
+    "fp": (
+        FpFramerDeframer,
+        lambda packet: FpFramerDeframer().frame(packet),
+        0xDE,
+        FpFramerDeframer.MAXIMUM_DATA_SIZE - 1,
+    ),
+    "tcp-server": (TcpServerFramerDeframer, tcp_server_frame, ord("Z"), 65535),
+}
+
+
+def random_bytes(rng, size):
+    """ Random bytes of the given size """
+    return rng.getrandbits(8 * size).to_bytes(size, "big") if size else b""
+
+
+def garbage(rng, size, excluded):
+    """ Random garbage of the given size never containing the excluded byte """
+    return bytes(
+        value if value != excluded else value ^ 0x01
+        for value in random_bytes(rng, size)
+    )
+
+
+def generate_stream(deframer_name, scenario, count=1000, seed=0):
+    """
+    Generates a synthetic stream for the given deframer and scenario
+
+    :param deframer_name: key of DEFRAMERS
+    :param scenario: one of SCENARIOS
+    :param count: number of packets in the stream
+    :param seed: seed of the random generator, streams are reproducible for a given seed
+    :return: (list of packets, list of chunks making up the stream)
+    """
+    rng = random.Random(seed)
+    _, frame, excluded, maximum = DEFRAMERS[deframer_name]
+    if scenario == "maximum":
+        packets = [random_bytes(rng, maximum) for _ in range(count)]
+    else:
+        packets = [random_bytes(rng, rng.randint(0, 256)) for _ in range(count)]
+    pieces = []
+    for packet in packets:
+        if scenario == "garbage":
+            pieces.append(garbage(rng, rng.randint(0, 64), excluded))
+        pieces.append(frame(packet))
+    stream = b"".join(pieces)
+    chunk_size = rng.randint(1, 17) if scenario == "split" else 4096
+    chunks = [
+        stream[index : index + chunk_size]
+        for index in range(0, len(stream), chunk_size)
+    ]
+    return packets, chunks
+
+
+def generate_splits(deframer_name, count=3, seed=0):
+    """
+    Generates a short clean stream delivered cut at every byte offset, such that each split falls once in the start
+    token, length, payload and checksum of every frame. The stream delivered one byte per chunk is included.
+
+    :param deframer_name: key of DEFRAMERS
+    :param count: number of packets in the stream
+    :param seed: seed of the random generator, streams are reproducible for a given seed
+    :return: (list of packets, list of the chunk lists delivering the stream)
+    """
+    rng = random.Random(seed)
+    frame = DEFRAMERS[deframer_name][1]
+    packets = [random_bytes(rng, rng.randint(1, 16)) for _ in range(count)]
+    stream = b"".join(frame(packet) for packet in packets)
+    splits = [[stream[:offset], stream[offset:]] for offset in range(1, len(stream))]
+    splits.append([stream[index : index + 1] for index in range(len(stream))])
+    return packets, splits
+
+
+def deframe_chunks(deframer, chunks, mode):
+    """
+    Deframes the chunks of a stream in the given mode
+
+    :param deframer: deframer instance
+    :param chunks: list of chunks of the stream
+    :param mode: one of MODES
+    :return: list of deframed packets
+    """
+    packets = []
+    if mode == "stream":
+        stream = StreamDeframer(deframer)
+        for chunk in chunks:
+            packets.extend(stream.deframe(chunk))
+        return packets
+    pool = bytearray()
+    for chunk in chunks:
+        pool += chunk
+        frames, pool = deframer.deframe_all(pool, no_copy=True)
+        packets.extend(frames)
+    return packets
+
+
+def run(deframer_name, scenario, mode, duration):
+    """
+    Repeatedly deframes the stream of a scenario for at least duration seconds
+
+    :return: (frames per second, bytes per second)
+    """
+    packets, chunks = generate_stream(deframer_name, scenario)
+    stream_size = sum(len(chunk) for chunk in chunks)
+    deframer = DEFRAMERS[deframer_name][0]()
+    iterations = 0
+    start = time.perf_counter()
+    elapsed = 0
+    while elapsed < duration:
+        deframe_chunks(deframer, chunks, mode)
+        iterations += 1
+        elapsed = time.perf_counter() - start
+    return iterations * len(packets) / elapsed, iterations * stream_size / elapsed
+
+
+def main():
+    """ Runs all benchmarks and reports their rates """
+    parser = argparse.ArgumentParser(
+        description="Benchmark of the comm layer deframers"
+    )
+    parser.add_argument(
+        "--duration",
+        type=float,
+        default=1.0,
+        help="Seconds to run each benchmark. [default: %(default)s]",
+    )
+    parser.add_argument(
+        "--minimum",
+        type=float,
+        default=None,
+        help="Minimum frames/sec accepted from every run, otherwise exit with an error",
+    )
+    args = parser.parse_args()
+    failures = 0
+    print(
+        "{:<12}{:<10}{:<13}{:>14}{:>14}".format(
+            "deframer", "scenario", "mode", "frames/sec", "MiB/sec"
+        )
+    )
+    for deframer_name in DEFRAMERS:
+        for scenario in SCENARIOS:
+            for mode in MODES:
+                frames_rate, bytes_rate = run(
+                    deframer_name, scenario, mode, args.duration
+                )
+                failed = args.minimum is not None and frames_rate < args.minimum
+                failures += 1 if failed else 0
+                print(
+                    "{:<12}{:<10}{:<13}{:>14.0f}{:>14.2f}{}".format(
+                        deframer_name,
+                        scenario,
+                        mode,
+                        frames_rate,
+                        bytes_rate / (1024 * 1024),
+                        "  [BELOW MINIMUM]" if failed else "",
+                    )
+                )
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
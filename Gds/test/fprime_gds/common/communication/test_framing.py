@@ -0,0 +1,148 @@
+"""
+Tests the framing and streaming deframing of the comm layer
+
+Created on Oct 16, 2026
+"""
+import pytest
+
+from fprime_gds.common.communication.framing import (
+    CHECKSUM_MAPPING,
+    Datagram,
+    FpFramerDeframer,
+    StreamDeframer,
+    TcpServerFramerDeframer,
+    Timestamped,
+    register_checksum,
+)
+
+PACKETS = [b"", b"a", b"\xde\xad\xbe\xef", bytes(range(256)) * 3]
+
+
+def test_fp_deframe_all():
+    """ Tests the deframe and deframe_all contracts with garbage and partial frames """
+    framer = FpFramerDeframer()
+    framed = [framer.frame(packet) for packet in PACKETS]
+    data = b"\xde\xad" + framed[0] + b"garbage\xde\xad\xbe" + b"".join(framed[1:])
+    packets, leftover = framer.deframe_all(data + framed[0][:5], no_copy=False)
+    assert packets == PACKETS
+    assert all(isinstance(packet, bytes) for packet in packets)
+    assert leftover == framed[0][:5]
+
+    packet, leftover = framer.deframe(b"junk" + framed[1] + b"\xde")
+    assert packet == PACKETS[1]
+    assert leftover == b"\xde"
+    # Garbage without any start token is dropped, keeping only a possible partial token
+    assert framer.deframe(b"x" * 100) == (None, b"xxx")
+
+
+def test_fp_stream_deframer():
+    """ Tests the streaming deframer with frames split at every boundary """
+    framer = FpFramerDeframer()
+    data = b"".join(b"\xef\xbe" + framer.frame(packet) for packet in PACKETS)
+    for split in range(1, len(data)):
+        stream = StreamDeframer(framer)
+        frames = stream.deframe(data[:split]) + stream.deframe(data[split:])
+        assert [bytes(frame) for frame in frames] == PACKETS
+        assert stream.leftover() == b""
+
+
+def test_stream_deframer_compaction():
+    """ Tests that held frames stay valid while the stream buffer is compacted and extended """
+    framer = FpFramerDeframer()
+    StreamDeframer.COMPACT_SIZE, original = 16, StreamDeframer.COMPACT_SIZE
+    try:
+        stream = StreamDeframer(framer)
+        held = []
+        for index in range(200):
+            packet = bytes([index % 256]) * (index % 7)
+            framed = framer.frame(packet)
+            held.extend(stream.deframe(framed[:3]))
+            held.extend(stream.deframe(framed[3:]))
+        assert [bytes(frame) for frame in held] == [
+            bytes([index % 256]) * (index % 7) for index in range(200)
+        ]
+    finally:
+        StreamDeframer.COMPACT_SIZE = original
+
+
+def test_stream_deframer_chunks():
+    """ Tests deframing a list of chunks while earlier frames are held """
+    framer = FpFramerDeframer()
+    data = b"".join(framer.frame(packet) for packet in PACKETS)
+    chunks = [data[index : index + 5] for index in range(0, len(data), 5)]
+    stream = StreamDeframer(framer)
+    held = stream.deframe_chunks(chunks[:10])
+    held.extend(stream.deframe_chunks(chunks[10:]))
+    assert [bytes(frame) for frame in held] == PACKETS
+    assert stream.deframe_chunks([]) == []
+    assert stream.leftover() == b""
+
+
+def test_stream_deframer_datagrams():
+    """ Tests datagram chunks are deframed on their own without disturbing the stream """
+    framer = FpFramerDeframer()
+    framed = [framer.frame(packet) for packet in PACKETS]
+    stream = StreamDeframer(framer)
+    chunks = [
+        framed[0][:5],
+        Datagram(framed[1] + framed[2]),
+        framed[0][5:],
+        Datagram(framed[3] + b"trailing"),
+        Datagram(b"garbage" + framed[1]),
+    ]
+    frames = stream.deframe_chunks(chunks)
+    assert [bytes(frame) for frame in frames] == PACKETS[1:] + [PACKETS[1], PACKETS[0]]
+    assert stream.leftover() == b""
+    # Datagrams hold the received data without copying it
+    datagram = Datagram(framed[1])
+    assert datagram.data is framed[1] and len(datagram) == len(framed[1])
+
+
+def test_stream_deframer_timestamps():
+    """ Tests frames carry the receive time of the chunk holding their last byte """
+    framer = FpFramerDeframer()
+    data = b"".join(framer.frame(packet) for packet in PACKETS[1:3])
+    split = len(framer.frame(PACKETS[1])) + 3
+    stream = StreamDeframer(framer)
+    frames = stream.deframe_chunks(
+        [Timestamped(data[:split], 1.0), Timestamped(data[split:], 2.0)]
+    )
+    assert frames == PACKETS[1:3]
+    assert [frame.time for frame in frames] == [1.0, 2.0]
+    # Untimed chunks keep returning memoryviews
+    assert isinstance(stream.deframe(framer.frame(b"x"))[0], memoryview)
+
+
+def test_tcp_server_deframe():
+    """ Tests the tcp server deframer finds uplink packets between garbage """
+    deframer = TcpServerFramerDeframer()
+    data = b"ab" + b"ZZZZ\x00\x00\x00\x03abc" + b"ZZZZ\x00\x00\x00\x01d" + b"ZZ"
+    packets, leftover = deframer.deframe_all(data, no_copy=False)
+    assert packets == [b"abc", b"d"]
+    assert leftover == b"ZZ"
+    stream = StreamDeframer(deframer)
+    assert [bytes(frame) for frame in stream.deframe(data[:9])] == []
+    assert [bytes(frame) for frame in stream.deframe(data[9:])] == [b"abc", b"d"]
+
+
+def test_checksums():
+    """ Tests the known checksum values and that corrupted frames are rejected """
+    assert CHECKSUM_MAPPING["crc32"](b"123456789") == 0xCBF43926
+    assert CHECKSUM_MAPPING["crc16-ccitt"](b"123456789") == 0x29B1
+    assert FpFramerDeframer().frame(b"")[-4:] == b"\xca\xfe\xca\xfe"
+    with pytest.raises(ValueError):
+        FpFramerDeframer("not-a-checksum")
+
+    for checksum_type in ["crc32", "crc16-ccitt"]:
+        framer = FpFramerDeframer(checksum_type)
+        framed = framer.frame(b"payload")
+        corrupted = framed[:9] + b"P" + framed[10:]
+        packets, _ = framer.deframe_all(corrupted + framed, no_copy=False)
+        assert packets == [b"payload"]
+        # Frames checked by the legacy constant no longer pass
+        assert FpFramerDeframer().deframe_all(framed, no_copy=False)[0] == []
+
+    register_checksum("sum", lambda data: sum(bytes(data)))
+    framer = FpFramerDeframer("sum")
+    assert framer.deframe_all(framer.frame(b"abc"), no_copy=False)[0] == [b"abc"]
+    del CHECKSUM_MAPPING["sum"]
@@ -0,0 +1,39 @@
+"""
+Runs the synthetic streams of the framing benchmark as a fuzz corpus, checking that every packet is recovered by each
+deframer in each mode.
+
+Created on Oct 16, 2026
+"""
+import pytest
+
+from framing_benchmark import (
+    DEFRAMERS,
+    MODES,
+    SCENARIOS,
+    deframe_chunks,
+    generate_splits,
+    generate_stream,
+)
+
+
+@pytest.mark.parametrize("deframer_name", list(DEFRAMERS.keys()))
+@pytest.mark.parametrize("scenario", SCENARIOS)
+@pytest.mark.parametrize("mode", MODES)
+def test_framing_corpus(deframer_name, scenario, mode):
+    """ Deframes the corpus stream of each scenario for a few seeds """
+    for seed in range(3):
+        packets, chunks = generate_stream(deframer_name, scenario, count=50, seed=seed)
+        deframer = DEFRAMERS[deframer_name][0]()
+        deframed = deframe_chunks(deframer, chunks, mode)
+        assert [bytes(packet) for packet in deframed] == packets
+
+
+@pytest.mark.parametrize("deframer_name", list(DEFRAMERS.keys()))
+@pytest.mark.parametrize("mode", MODES)
+def test_framing_splits(deframer_name, mode):
+    """ Deframes a few frames cut at every byte offset """
+    packets, splits = generate_splits(deframer_name)
+    for chunks in splits:
+        deframer = DEFRAMERS[deframer_name][0]()
+        deframed = deframe_chunks(deframer, chunks, mode)
+        assert [bytes(packet) for packet in deframed] == packets
@@ -0,0 +1,64 @@
+"""
+Tests the ground side handler of the comm layer
+
+Created on Oct 16, 2026
+"""
+import socket
+import threading
+
+from fprime_gds.common.communication.adapters.ip import IOV_MAX, IpHandler
+from fprime_gds.common.communication.framing import TcpServerFramerDeframer
+from fprime_gds.common.communication.ground import TCPGround
+
+
+def receive_exactly(sock, size):
+    """ Receives exactly size bytes from sock """
+    data = b""
+    while len(data) < size:
+        chunk = sock.recv(size - len(data))
+        assert chunk, "connection closed early"
+        data += chunk
+    return data
+
+
+def test_sendmsg_all():
+    """ Tests scatter/gather sends continue after partial sends and across IOV_MAX buffers """
+    sender, receiver = socket.socketpair()
+    sender.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, 4096)
+    buffers = [b"", bytes(range(256))] + [
+        memoryview(bytes([index % 256]) * 97) for index in range(IOV_MAX * 2)
+    ]
+    expected = b"".join(bytes(buffer) for buffer in buffers)
+    received = []
+    reader = threading.Thread(
+        target=lambda: received.append(receive_exactly(receiver, len(expected)))
+    )
+    reader.start()
+    IpHandler.sendmsg_all(sender, buffers)
+    reader.join(5.0)
+    sender.close()
+    receiver.close()
+    assert received == [expected]
+
+
+def test_tcp_ground_send_all():
+    """ Tests frames are sent to the ground server in the tcp server format """
+    server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    server.bind(("127.0.0.1", 0))
+    server.listen(1)
+    ground = TCPGround("127.0.0.1", server.getsockname()[1])
+    try:
+        assert ground.open()
+        client, _ = server.accept()
+        client.settimeout(5.0)
+        assert receive_exactly(client, 13) == b"Register FSW\n"
+        packets = [b"abc", memoryview(b"--defg--")[2:6], b""]
+        ground.send_all(packets)
+        expected = b"".join(
+            TcpServerFramerDeframer().frame(bytes(packet)) for packet in packets
+        )
+        assert receive_exactly(client, len(expected)) == expected
+        client.close()
+    finally:
+        ground.close()
+        server.close()
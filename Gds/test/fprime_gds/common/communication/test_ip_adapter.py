@@ -0,0 +1,71 @@
+"""
+Tests the IpAdapter read path
+
+Created on Oct 16, 2026
+"""
+import socket
+import time
+
+from fprime_gds.common.communication.adapters.ip import IpAdapter
+from fprime_gds.common.communication.framing import (
+    Datagram,
+    FpFramerDeframer,
+    StreamDeframer,
+)
+
+
+def free_port():
+    """ Finds a port free for both TCP and UDP """
+    with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def read_all(adapter, count, timeout=5.0):
+    """ Reads chunks from the adapter until count chunks are read """
+    chunks = []
+    end = time.time() + timeout
+    while len(chunks) < count and time.time() < end:
+        chunks.extend(adapter.read_chunks(timeout=0.1))
+    return chunks
+
+
+def test_ip_adapter_read_chunks():
+    """ Tests chunks received over UDP are returned as a list without being joined """
+    port = free_port()
+    adapter = IpAdapter("127.0.0.1", port)
+    adapter.open()
+    try:
+        sender = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        datagrams = [bytes([index]) * (index * 100) for index in range(1, 6)]
+        datagrams.append(b"\xaa" * 60000)
+        for datagram in datagrams:
+            sender.sendto(datagram, ("127.0.0.1", port))
+            time.sleep(0.01)
+        sender.close()
+        assert read_all(adapter, len(datagrams)) == datagrams
+        # No data within the timeout returns nothing
+        assert adapter.read_chunks(timeout=0.05) == []
+        assert adapter.read(timeout=0.05) == b""
+    finally:
+        adapter.close()
+
+
+def test_ip_adapter_datagram_mode():
+    """ Tests datagrams are returned as Datagram chunks deframed one by one in datagram mode """
+    port = free_port()
+    adapter = IpAdapter("127.0.0.1", port, udp_mode="datagram")
+    adapter.open()
+    try:
+        framer = FpFramerDeframer()
+        packets = [bytes([index]) * index for index in range(50)]
+        sender = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        for packet in packets:
+            sender.sendto(framer.frame(packet), ("127.0.0.1", port))
+        sender.close()
+        chunks = read_all(adapter, len(packets))
+        assert all(isinstance(chunk, Datagram) for chunk in chunks)
+        frames = StreamDeframer(framer).deframe_chunks(chunks)
+        assert [bytes(frame) for frame in frames] == packets
+    finally:
+        adapter.close()
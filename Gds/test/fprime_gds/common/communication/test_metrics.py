@@ -0,0 +1,108 @@
+"""
+Tests the link statistics registry and its log line, Prometheus and JSON exposition
+
+Created on Oct 16, 2026
+"""
+import json
+import logging
+import urllib.error
+import urllib.request
+
+import pytest
+
+from fprime_gds.common.communication.framing import FpFramerDeframer, StreamDeframer
+from fprime_gds.common.communication.metrics import (
+    MetricsRegistry,
+    MetricsReporter,
+    MetricsServer,
+)
+
+
+class Source:
+    """ Statistics source with one counter and one gauge """
+
+    def __init__(self):
+        self.frames = 0
+
+    def get_stats(self):
+        return {"frames": self.frames, "depth": 3}
+
+
+def test_registry_rates_and_exposition():
+    """ Tests counters are rated between samples and dumped as Prometheus text and JSON """
+    source = Source()
+    registry = MetricsRegistry()
+    registry.register("down link", source.get_stats, ["frames"])
+    registry.register("broken", lambda: 1 / 0)
+    registry.sample()
+    assert registry.get_rates() == {}
+    source.frames = 1000
+    registry.sample()
+    assert registry.get_rates()["down link"]["frames"] > 0
+    line = registry.format_line()
+    assert line.startswith("down link: frames ") and line.endswith("/s, depth 3")
+
+    prometheus = registry.to_prometheus()
+    assert (
+        "# TYPE fprime_comm_down_link_frames_total counter\nfprime_comm_down_link_frames_total 1000.0\n"
+        in prometheus
+    )
+    assert (
+        "# TYPE fprime_comm_down_link_depth gauge\nfprime_comm_down_link_depth 3.0\n"
+        in prometheus
+    )
+    dumped = json.loads(registry.to_json())
+    assert list(dumped) == ["down link"]
+    assert dumped["down link"]["counters"] == {"frames": 1000}
+    assert dumped["down link"]["gauges"] == {"depth": 3}
+    assert set(dumped["down link"]["rates"]) == {"frames"}
+
+
+def test_metrics_server():
+    """ Tests the server answers the Prometheus and JSON endpoints """
+    registry = MetricsRegistry()
+    registry.register("source", Source().get_stats, ["frames"])
+    server = MetricsServer(registry)
+    server.start()
+    try:
+        url = "http://127.0.0.1:{}".format(server.port)
+        with urllib.request.urlopen(url + "/metrics", timeout=5) as response:
+            assert response.read().decode() == registry.to_prometheus()
+        with urllib.request.urlopen(url + "/metrics.json", timeout=5) as response:
+            assert response.headers["Content-Type"] == "application/json"
+            assert json.loads(response.read().decode())["source"]["counters"] == {
+                "frames": 0
+            }
+        with pytest.raises(urllib.error.HTTPError):
+            urllib.request.urlopen(url + "/other", timeout=5)
+    finally:
+        server.stop()
+
+
+def test_metrics_reporter(caplog):
+    """ Tests the reporter logs the statistics periodically """
+    registry = MetricsRegistry()
+    registry.register("source", Source().get_stats, ["frames"])
+    reporter = MetricsReporter(registry, 0.01, logging.getLogger("test_metrics"))
+    with caplog.at_level(logging.INFO, logger="test_metrics"):
+        reporter.start()
+        try:
+            while not caplog.records:
+                pass
+        finally:
+            reporter.stop()
+    assert (
+        caplog.records[0].getMessage()
+        == "Link statistics: source: frames 0.0/s, depth 3"
+    )
+
+
+def test_deframer_counters():
+    """ Tests the deframer counts discarded bytes and checksum failures """
+    framer = FpFramerDeframer("crc32")
+    framed = framer.frame(b"payload")
+    corrupted = framed[:9] + b"P" + framed[10:]
+    frames = StreamDeframer(framer).deframe(b"junk" + corrupted + framed)
+    assert [bytes(frame) for frame in frames] == [b"payload"]
+    assert framer.checksum_failures == 1
+    assert framer.resync_bytes == 4 + len(corrupted)
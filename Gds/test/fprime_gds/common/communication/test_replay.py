@@ -0,0 +1,106 @@
+"""
+Tests recording a downlink and replaying it with the replay adapter
+
+Created on Oct 16, 2026
+"""
+import struct
+import time
+
+import pytest
+
+from fprime_gds.common.communication.adapters.replay import LinkRecorder, ReplayAdapter
+from fprime_gds.common.communication.framing import (
+    FpFramerDeframer,
+    StreamDeframer,
+    Timestamped,
+)
+
+
+def replay_all(adapter):
+    """ Reads chunks from an open replay adapter until the recording is complete """
+    chunks = []
+    while not adapter.complete:
+        chunks.extend(adapter.read_chunks(timeout=0.1))
+    return chunks
+
+
+@pytest.fixture
+def recording(tmp_path):
+    """ Timed recording of five chunks received 0.1 seconds apart """
+    path = str(tmp_path / "link.rec")
+    recorder = LinkRecorder(path)
+    chunks = [bytes([index]) * (index + 1) for index in range(5)]
+    recorder.record(
+        [Timestamped(chunk, 1000.0 + index * 0.1) for index, chunk in enumerate(chunks)]
+    )
+    recorder.close()
+    return path, chunks
+
+
+def test_replay_timed_as_fast_as_possible(recording):
+    """ Tests chunk boundaries of a timed recording are kept when replaying as fast as possible """
+    path, chunks = recording
+    adapter = ReplayAdapter(path, "timed", 0)
+    adapter.open()
+    start = time.monotonic()
+    assert adapter.read_chunks() == chunks
+    assert time.monotonic() - start < 0.1
+    assert replay_all(adapter) == []
+    assert adapter.get_stats()["chunks"] == 5
+    adapter.close()
+
+
+def test_replay_timed_speed(recording):
+    """ Tests inter-arrival times are replayed scaled by the speed factor """
+    path, chunks = recording
+    adapter = ReplayAdapter(path, "timed", 2.0)
+    adapter.open()
+    start = time.monotonic()
+    assert replay_all(adapter) == chunks
+    # 0.4 seconds of recording replayed at twice real time
+    assert 0.2 <= time.monotonic() - start < 1.0
+    adapter.close()
+
+
+def test_replay_recv(tmp_path):
+    """ Tests packets of a DataLogger recv.bin are framed one per chunk """
+    path = str(tmp_path / "recv.bin")
+    packets = [b"packet one", b"", b"\x00" * 300]
+    with open(path, "wb") as file_handle:
+        for packet in packets:
+            file_handle.write(struct.pack(">I", len(packet)) + packet)
+        # Truncated trailing packet header is ignored
+        file_handle.write(b"\x00\x00")
+    adapter = ReplayAdapter(path, "recv", checksum_type="crc32")
+    adapter.open()
+    chunks = replay_all(adapter)
+    assert len(chunks) == 3
+    frames = StreamDeframer(FpFramerDeframer("crc32")).deframe_chunks(chunks)
+    assert [bytes(frame) for frame in frames] == packets
+    assert adapter.write(b"uplink")
+    assert adapter.get_stats()["uplink_discarded"] == 1
+    adapter.close()
+
+
+def test_replay_raw(tmp_path):
+    """ Tests raw link bytes are replayed in fixed size chunks """
+    path = str(tmp_path / "raw.bin")
+    data = bytes(range(256)) * 40
+    with open(path, "wb") as file_handle:
+        file_handle.write(data)
+    adapter = ReplayAdapter(path, "raw")
+    adapter.open()
+    chunks = replay_all(adapter)
+    assert b"".join(chunks) == data
+    assert max(len(chunk) for chunk in chunks) == ReplayAdapter.RAW_CHUNK_SIZE
+    adapter.close()
+
+
+def test_replay_arguments(tmp_path):
+    """ Tests invalid formats and files are rejected """
+    with pytest.raises(ValueError):
+        ReplayAdapter("link.rec", "unknown")
+    with pytest.raises(ValueError):
+        ReplayAdapter.check_arguments(
+            {"replay_file": str(tmp_path / "missing"), "replay_speed": 1}
+        )
@@ -0,0 +1,152 @@
+"""
+Tests the single-threaded selector loop backend of the comm layer
+
+Created on Oct 16, 2026
+"""
+import socket
+import threading
+import time
+
+import pytest
+
+from fprime_gds.common.communication.framing import (
+    FpFramerDeframer,
+    StreamDeframer,
+    TcpServerFramerDeframer,
+)
+from fprime_gds.common.communication.selectorloop import SelectorLoop
+from fprime_gds.common.communication.updown import Uplinker
+
+
+def free_port():
+    """ Finds a port free for both TCP and UDP """
+    with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+class GroundDownlinkDeframer(TcpServerFramerDeframer):
+    """ Deframes the "A5A5 GUI " frames the comm layer sends to the ground """
+
+    def deframe_at(self, data, offset):
+        """ Deframes exactly one frame from data starting at offset """
+        if len(data) - offset < 13:
+            return None, offset
+        size = int.from_bytes(data[offset + 9 : offset + 13], "big")
+        if len(data) - offset < 13 + size:
+            return None, offset
+        return memoryview(data)[offset + 13 : offset + 13 + size], offset + 13 + size
+
+
+def receive_frames(sock, stream, count, timeout=5.0):
+    """ Receives from sock until count frames are deframed by the stream deframer """
+    frames = []
+    sock.settimeout(timeout)
+    while len(frames) < count:
+        data = sock.recv(65536)
+        assert data, "connection closed early"
+        frames.extend(bytes(frame) for frame in stream.deframe(data))
+    return frames
+
+
+def test_selector_loop():
+    """ Tests downlink over TCP and UDP, uplink with its handshake, and shutdown """
+    ground_server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    ground_server.bind(("127.0.0.1", 0))
+    ground_server.listen(1)
+    port = free_port()
+    framer = FpFramerDeframer()
+    loop = SelectorLoop(
+        "127.0.0.1", port, "127.0.0.1", ground_server.getsockname()[1], framer
+    )
+    thread = threading.Thread(target=loop.run)
+    thread.start()
+    ground = fsw = None
+    try:
+        ground, _ = ground_server.accept()
+        ground.settimeout(5.0)
+        assert ground.recv(13) == b"Register FSW\n"
+        fsw = socket.create_connection(("127.0.0.1", port), timeout=5.0)
+
+        packets = [bytes([index]) * index for index in range(1, 20)]
+        data = b"".join(framer.frame(packet) for packet in packets)
+        # Frames split across TCP sends and sent over UDP are downlinked to the ground
+        fsw.sendall(data[:7])
+        time.sleep(0.05)
+        fsw.sendall(data[7:])
+        udp = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        udp.sendto(framer.frame(b"udp"), ("127.0.0.1", port))
+        udp.close()
+        ground_stream = StreamDeframer(GroundDownlinkDeframer())
+        assert receive_frames(ground, ground_stream, len(packets) + 1) == packets + [
+            b"udp"
+        ]
+
+        # Uplinked packets are framed to FSW and their handshake is looped back to the ground
+        ground.sendall(b"ZZZZ\x00\x00\x00\x03cmd")
+        assert receive_frames(fsw, StreamDeframer(framer), 1) == [b"cmd"]
+        assert receive_frames(ground, ground_stream, 1) == [
+            Uplinker.get_handshake(b"cmd")
+        ]
+    finally:
+        loop.stop()
+        thread.join(5.0)
+        for sock in [ground, fsw, ground_server]:
+            if sock is not None:
+                sock.close()
+    assert not thread.is_alive()
+    stats = loop.get_stats()
+    assert stats["frames_up"] == 1
+    assert stats["dropped"] == 0
+
+
+def test_selector_loop_uplink_backlog(monkeypatch):
+    """ Tests uplinks to a FSW not reading fail once its backlog is full, without looping back their handshakes """
+    monkeypatch.setattr(SelectorLoop, "MAXIMUM_UPLINK_BACKLOG", 65536)
+    ground_server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    ground_server.bind(("127.0.0.1", 0))
+    ground_server.listen(1)
+    port = free_port()
+    loop = SelectorLoop(
+        "127.0.0.1",
+        port,
+        "127.0.0.1",
+        ground_server.getsockname()[1],
+        FpFramerDeframer(),
+    )
+    thread = threading.Thread(target=loop.run)
+    thread.start()
+    ground = fsw = None
+    try:
+        ground, _ = ground_server.accept()
+        ground.settimeout(5.0)
+        assert ground.recv(13) == b"Register FSW\n"
+        fsw = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        fsw.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 4096)
+        fsw.connect(("127.0.0.1", port))
+        while loop.fsw is None:
+            time.sleep(0.01)
+
+        count = 64
+        command = b"c" * 262144
+        ground.sendall((b"ZZZZ" + len(command).to_bytes(4, "big") + command) * count)
+        deadline = time.monotonic() + 5.0
+        while loop.frames_up + loop.uplink_failed < count:
+            assert time.monotonic() < deadline
+            time.sleep(0.01)
+        assert loop.uplink_failed > 0
+        # Only the handshakes of the written packets are looped back
+        ground_stream = StreamDeframer(GroundDownlinkDeframer())
+        handshakes = receive_frames(ground, ground_stream, loop.frames_up)
+        assert handshakes == [Uplinker.get_handshake(command)] * loop.frames_up
+        ground.settimeout(0.1)
+        with pytest.raises(socket.timeout):
+            ground.recv(1)
+    finally:
+        loop.stop()
+        thread.join(5.0)
+        for sock in [ground, fsw, ground_server]:
+            if sock is not None:
+                sock.close()
+    assert not thread.is_alive()
+    assert loop.get_stats()["dropped"] == 0
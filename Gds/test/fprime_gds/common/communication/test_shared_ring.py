@@ -0,0 +1,67 @@
+"""
+Tests the shared-memory ring used to fan out the downlink stream
+
+Created on Oct 16, 2026
+"""
+import os
+
+import pytest
+
+from fprime_gds.common.communication.shared_ring import (
+    HEADER_SIZE,
+    SharedRingReader,
+    SharedRingWriter,
+    shared_memory,
+)
+
+pytestmark = pytest.mark.skipif(
+    shared_memory is None, reason="shared memory requires python 3.8+"
+)
+
+
+@pytest.fixture
+def ring_name():
+    """ Unique name of a ring for a test """
+    return "fprime_test_ring_{}".format(os.getpid())
+
+
+def test_readers_follow_writer(ring_name):
+    """ Tests independent readers receive every message across many wraps of the ring """
+    writer = SharedRingWriter(ring_name, HEADER_SIZE + 203)
+    readers = [SharedRingReader(ring_name) for _ in range(3)]
+    try:
+        expected = [[] for _ in readers]
+        for index in range(500):
+            msg = bytes([index % 256]) * (index % 30)
+            writer.write(msg)
+            for reader_index, reader in enumerate(readers):
+                expected[reader_index].append(msg)
+                # Each reader reads at its own pace
+                if index % (reader_index + 1) == 0:
+                    assert reader.read() == expected[reader_index]
+                    expected[reader_index] = []
+        assert all(reader.overruns == 0 for reader in readers)
+        with pytest.raises(ValueError):
+            writer.write(b"x" * 200)
+    finally:
+        for reader in readers:
+            reader.close()
+        writer.close()
+
+
+def test_overrun(ring_name):
+    """ Tests a reader falling behind by more than the ring loses the overwritten data instead of reading it """
+    writer = SharedRingWriter(ring_name, HEADER_SIZE + 100)
+    reader = SharedRingReader(ring_name)
+    try:
+        for _ in range(20):
+            writer.write(b"x" * 10)
+        assert reader.read() == []
+        assert reader.overruns == 1
+        # Lost data includes the padding skipped at the end of the ring
+        assert reader.lost_bytes >= 20 * 14
+        writer.write(b"after")
+        assert reader.read() == [b"after"]
+    finally:
+        reader.close()
+        writer.close()
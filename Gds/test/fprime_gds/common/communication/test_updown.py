@@ -0,0 +1,187 @@
+"""
+Tests the bounded frame queue and downlink pipeline of the comm layer
+
+Created on Oct 16, 2026
+"""
+import threading
+import time
+
+import pytest
+
+from fprime_gds.common.communication.framing import FpFramerDeframer, Timestamped
+from fprime_gds.common.communication.updown import Downlinker, FrameQueue, Uplinker
+
+
+def test_frame_queue_drop_newest():
+    """ Tests the drop-newest policy keeps the queued frames """
+    queue = FrameQueue(4, "drop-newest")
+    assert queue.put_all([1, 2, 3]) == 0
+    assert queue.put_all([4, 5, 6]) == 2
+    assert queue.get_all(0) == [1, 2, 3, 4]
+    assert queue.get_all(0) == []
+    assert queue.get_stats() == {
+        "frames_in": 6,
+        "frames_out": 4,
+        "dropped": 2,
+        "depth": 0,
+        "high_water": 4,
+        "size": 4,
+    }
+
+
+def test_frame_queue_drop_oldest():
+    """ Tests the drop-oldest policy keeps the newest frames """
+    queue = FrameQueue(4, "drop-oldest")
+    queue.put_all([1, 2, 3])
+    assert queue.put_all([4, 5]) == 1
+    assert queue.get_all(0) == [2, 3, 4, 5]
+    assert queue.put_all(list(range(10))) == 6
+    assert queue.get_all(0) == [6, 7, 8, 9]
+    assert queue.dropped == 7
+
+
+def test_frame_queue_block():
+    """ Tests the block policy waits for the consumer, and drops only once the timeout expires """
+    queue = FrameQueue(2, "block")
+    received = []
+
+    def consume():
+        while len(received) < 6:
+            received.extend(queue.get_all(1))
+
+    consumer = threading.Thread(target=consume)
+    consumer.start()
+    assert queue.put_all(list(range(6)), 5) == 0
+    consumer.join()
+    assert received == list(range(6))
+
+    queue.put_all([1, 2])
+    start = time.time()
+    assert queue.put_all([3], 0.1) == 1
+    assert time.time() - start >= 0.1
+    assert queue.dropped == 1
+
+    # The timeout bounds the whole batch rather than each frame
+    start = time.time()
+    assert queue.put_all([4, 5, 6, 7], 0.1) == 4
+    assert time.time() - start < 0.3
+    assert queue.dropped == 5
+
+
+def test_frame_queue_policy():
+    """ Tests unknown policies are rejected """
+    with pytest.raises(ValueError):
+        FrameQueue(4, "drop-everything")
+
+
+class ListAdapter:
+    """ Adapter returning chunks of data from a list, two at a time """
+
+    def __init__(self, chunks):
+        self.chunks = list(chunks)
+
+    def read_chunks(self, timeout=0.500):
+        chunks, self.chunks = self.chunks[:2], self.chunks[2:]
+        if not chunks:
+            time.sleep(0.01)
+        return chunks
+
+
+class RecordingGround:
+    """ Ground handler recording the batches of frames sent """
+
+    def __init__(self):
+        self.batches = []
+
+    def send_all(self, frames):
+        self.batches.append([bytes(frame) for frame in frames])
+
+
+def test_downlinker_batches():
+    """ Tests frames read from the adapter reach the ground in batches and are counted """
+    framer = FpFramerDeframer()
+    packets = [bytes([index]) * (index + 1) for index in range(100)]
+    data = b"".join(framer.frame(packet) for packet in packets)
+    adapter = ListAdapter(
+        data[index : index + 1000] for index in range(0, len(data), 1000)
+    )
+    ground = RecordingGround()
+    downlinker = Downlinker(adapter, ground, FpFramerDeframer(), queue_size=1000)
+    downlinker.start()
+    deadline = time.time() + 5
+    while sum(len(batch) for batch in ground.batches) < 100 and time.time() < deadline:
+        time.sleep(0.01)
+    downlinker.stop()
+    downlinker.join()
+    assert [frame for batch in ground.batches for frame in batch] == packets
+    assert len(ground.batches) < 100
+    stats = downlinker.get_stats()
+    assert stats["frames_in"] == stats["frames_out"] == 100
+    assert stats["dropped"] == 0
+
+
+def test_downlinker_latency():
+    """ Tests frames deframed from timestamped chunks carry their receive time to the latency counters """
+    framer = FpFramerDeframer()
+    received = time.time() - 1.0
+    adapter = ListAdapter([Timestamped(framer.frame(b"timed"), received)])
+    ground = RecordingGround()
+    downlinker = Downlinker(adapter, ground, FpFramerDeframer())
+    downlinker.start()
+    deadline = time.time() + 5
+    while not ground.batches and time.time() < deadline:
+        time.sleep(0.01)
+    downlinker.stop()
+    downlinker.join()
+    assert ground.batches == [[b"timed"]]
+    stats = downlinker.get_stats()
+    assert stats["timed_frames"] == 1
+    assert 1.0 <= stats["latency_max"] == stats["latency_average"] < 5.0
+
+
+class RecordingAdapter:
+    """ Adapter recording each buffer written """
+
+    def __init__(self):
+        self.writes = []
+
+    def write(self, frame):
+        self.writes.append(frame)
+        return True
+
+
+class BurstGround:
+    """ Ground handler returning one burst of packets, then nothing """
+
+    def __init__(self, packets, uplinker=None):
+        self.packets = packets
+        self.uplinker = uplinker
+
+    def receive_all(self):
+        packets, self.packets = self.packets, []
+        if not packets:
+            self.uplinker.stop()
+        return packets
+
+
+@pytest.mark.parametrize("batch_size", [0, 100])
+def test_uplinker_batches(batch_size):
+    """ Tests packets are framed into buffers of at most batch_size bytes and all handshakes are looped back """
+    framer = FpFramerDeframer()
+    packets = [bytes([index]) * 30 for index in range(10)] + [b"x" * 200, b""]
+    adapter = RecordingAdapter()
+    ground = BurstGround(packets)
+    downlinker = Downlinker(None, None, framer)
+    uplinker = Uplinker(adapter, ground, framer, downlinker, batch_size)
+    ground.uplinker = uplinker
+    uplinker.uplink()
+    assert b"".join(adapter.writes) == b"".join(
+        framer.frame(packet) for packet in packets[:-1]
+    )
+    if batch_size:
+        assert [len(write) for write in adapter.writes] == [84] * 5 + [212]
+    else:
+        assert len(adapter.writes) == 11
+    assert downlinker.outgoing.get_all(0) == [
+        Uplinker.get_handshake(packet) for packet in packets[:-1]
+    ]
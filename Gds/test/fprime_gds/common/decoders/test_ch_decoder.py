@@ -0,0 +1,159 @@
+"""
+Tests the channel and packet decoders
+
+Created on Oct 16, 2026
+"""
+
+import pytest
+
+from fprime_gds.common.decoders.ch_decoder import ChDecoder
+from fprime_gds.common.decoders.pkt_decoder import PktDecoder
+from fprime_gds.common.templates.ch_template import ChTemplate
+from fprime_gds.common.templates.pkt_template import PktTemplate
+from fprime.common.models.serialize.time_type import TimeType
+from fprime.common.models.serialize.enum_type import EnumType
+from fprime.common.models.serialize.numerical_types import U8Type, U16Type, U32Type
+from fprime.common.models.serialize.string_type import StringType
+
+
+def test_ch_decoder():
+    """
+    Tests the decoding of the channel decoder, including that templates are never modified by decoding
+    """
+    temp_1 = ChTemplate(101, "test_ch", "test_comp", U32Type())
+    temp_2 = ChTemplate(102, "test_ch2", "test_comp2", StringType())
+    temp_3 = ChTemplate(
+        103, "test_ch3", "test_comp3", EnumType("SomeEnum", {"A": 0, "B": 3})
+    )
+    dec = ChDecoder({101: temp_1, 102: temp_2, 103: temp_3})
+
+    id_bin = b"\x00\x00\x00\x65"
+    time_bin = b"\x00\x02\x00\x5b\x6b\x4c\xa5\x00\x01\xe2\x40"
+    val_bin = b"\x00\x00\x00\x2a"
+
+    ch_obj = dec.decode_api(id_bin + time_bin + val_bin)
+    assert ch_obj.get_val() == 42
+    assert ch_obj.template is temp_1
+    assert ch_obj.time == TimeType(2, 0, 1533758629, 123456)
+    assert temp_1.get_type_obj().val is None
+
+    second = dec.decode_api(id_bin + time_bin + b"\x00\x00\x00\x2b")
+    assert second.get_val() == 43
+    assert ch_obj.get_val() == 42, "Decoding changed a previously decoded value"
+
+    ch_obj = dec.decode_api(b"\x00\x00\x00\x66" + time_bin + b"\x00\x03abc")
+    assert ch_obj.get_val() == "abc"
+    assert temp_2.get_type_obj().val is None
+
+    ch_obj = dec.decode_api(b"\x00\x00\x00\x67" + time_bin + b"\x00\x00\x00\x03")
+    assert ch_obj.get_val() == "B"
+    assert temp_3.get_type_obj().val == "UNDEFINED"
+
+    assert dec.decode_api(b"\x00\x00\x00\x68" + time_bin + val_bin) is None
+
+
+def test_pkt_decoder():
+    """
+    Tests the decoding of the packet decoder
+    """
+    ch_temp_1 = ChTemplate(101, "test_ch", "test_comp", U32Type())
+    ch_temp_2 = ChTemplate(102, "test_ch2", "test_comp2", U8Type())
+    ch_temp_3 = ChTemplate(103, "test_ch3", "test_comp3", U16Type())
+    ch_dict = {101: ch_temp_1, 102: ch_temp_2, 103: ch_temp_3}
+
+    pkt_temp = PktTemplate(64, "test_pkt", [ch_temp_1, ch_temp_2, ch_temp_3])
+    dec = PktDecoder({64: pkt_temp}, ch_dict)
+
+    id_bin = b"\x00\x40"
+    time_bin = b"\x00\x02\x00\x5b\x6b\x4c\xa5\x00\x01\xe2\x40"
+    ch_bin = b"\x00\x00\x05\x4c\x8F\x05\xe5"
+
+    pkt_obj = dec.decode_api(id_bin + time_bin + ch_bin)
+    assert pkt_obj.get_time() == TimeType(2, 0, 1533758629, 123456)
+    assert [ch.get_val() for ch in pkt_obj.get_chs()] == [1356, 143, 1509]
+    assert [ch.template for ch in pkt_obj.get_chs()] == [
+        ch_temp_1,
+        ch_temp_2,
+        ch_temp_3,
+    ]
+
+
+def test_ch_decoder_batch():
+    """
+    Tests the batch decoding of channels into columns, with and without NumPy
+    """
+    temp_1 = ChTemplate(101, "test_ch", "test_comp", U32Type())
+    temp_2 = ChTemplate(102, "test_ch2", "test_comp2", StringType())
+    dec = ChDecoder({101: temp_1, 102: temp_2})
+
+    time_bin = b"\x00\x02\x00\x5b\x6b\x4c\xa5\x00\x01\xe2\x40"
+    msgs = [
+        b"\x00\x00\x00\x65" + time_bin + b"\x00\x00\x00\x2a",
+        b"\x00\x00\x00\x66" + time_bin + b"\x00\x03abc",
+        b"\x00\x00\x00\x65" + time_bin + b"\x00\x00\x00\x2b",
+        b"\x00\x00\x00\x99" + time_bin + b"\x00\x00\x00\x2b",
+    ]
+    batch = dec.decode_columns(msgs, use_numpy=False)
+    assert sorted(batch.keys()) == [101, 102]
+    assert batch[101] == {
+        "id": [101, 101],
+        "time": [1533758629.123456, 1533758629.123456],
+        "value": [42, 43],
+    }
+    assert batch[102]["value"] == ["abc"]
+
+    # Messages of unexpected size are decoded one by one, truncated ones are skipped
+    batch = dec.decode_columns(
+        msgs[:1] + [msgs[2] + b"\x00", msgs[2][:-1]], use_numpy=False
+    )
+    assert batch[101]["value"] == [42, 43]
+
+    numpy = pytest.importorskip("numpy")
+    batch = dec.decode_columns(msgs)
+    assert list(batch[101]["value"]) == [42, 43]
+    assert list(batch[101]["id"]) == [101, 101]
+    assert numpy.allclose(batch[101]["time"], 1533758629.123456)
+    assert list(batch[102]["value"]) == ["abc"]
+
+
+def test_pkt_decoder_batch():
+    """
+    Tests the batch decoding of packets into channel columns
+    """
+    ch_temp_1 = ChTemplate(101, "test_ch", "test_comp", U32Type())
+    ch_temp_2 = ChTemplate(102, "test_ch2", "test_comp2", U8Type())
+    ch_dict = {101: ch_temp_1, 102: ch_temp_2}
+    pkt_temp_1 = PktTemplate(64, "test_pkt", [ch_temp_1, ch_temp_2])
+    pkt_temp_2 = PktTemplate(65, "test_pkt2", [ch_temp_2])
+    dec = PktDecoder({64: pkt_temp_1, 65: pkt_temp_2}, ch_dict)
+
+    msgs = [
+        b"\x00\x40" + TimeType(2, 0, 10, 0).serialize() + b"\x00\x00\x05\x4c\x8F",
+        b"\x00\x41" + TimeType(2, 0, 11, 0).serialize() + b"\x01",
+        b"\x00\x40" + TimeType(2, 0, 12, 0).serialize() + b"\x00\x00\x05\x4d\x90",
+    ]
+    for use_numpy in [False, True]:
+        batch = dec.decode_columns(msgs, use_numpy=use_numpy)
+        assert list(batch[101]["value"]) == [1356, 1357]
+        assert list(batch[102]["value"]) == [143, 1, 144]
+        assert list(batch[102]["time"]) == [10, 11, 12]
+
+    # Batches of data objects keep the contract of the base decoder
+    assert [len(pkt.get_chs()) for pkt in dec.decode_batch(msgs)] == [2, 1, 2]
+
+
+def test_pkt_decoder_merge_mixed_columns():
+    """
+    Tests NumPy columns of a channel decoded from fixed and variable packet layouts merge into object values
+    """
+    numpy = pytest.importorskip("numpy")
+    fixed = numpy.array(
+        [(102, 12.0, 144), (102, 10.0, 143)],
+        dtype=[("id", "u4"), ("time", "f8"), ("value", "u1")],
+    )
+    variable = numpy.empty(1, dtype=[("id", "u4"), ("time", "f8"), ("value", "O")])
+    variable[0] = (102, 11.0, 1)
+    merged = PktDecoder.merge_columns([fixed, variable])
+    assert merged.dtype["value"] == numpy.dtype("O")
+    assert list(merged["time"]) == [10, 11, 12]
+    assert list(merged["value"]) == [143, 1, 144]
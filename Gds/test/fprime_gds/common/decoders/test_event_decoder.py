@@ -0,0 +1,80 @@
+"""
+Tests the event decoder
+
+Created on Oct 16, 2026
+"""
+
+from fprime_gds.common.decoders.event_decoder import EventDecoder
+from fprime_gds.common.templates.event_template import EventTemplate
+from fprime.common.models.serialize.time_type import TimeType
+from fprime.common.models.serialize.numerical_types import U8Type, U32Type
+from fprime.common.models.serialize.string_type import StringType
+from fprime_gds.common.utils.event_severity import EventSeverity
+
+
+def test_event_decoder():
+    """
+    Tests the decoding of the event decoder with fixed and variable sized arguments
+    """
+    temp = EventTemplate(
+        101,
+        "test_ch",
+        "test_comp",
+        [
+            ("a1", "a1", U32Type()),
+            ("a2", "a2", U8Type()),
+            ("a3", "a3", StringType()),
+            ("a4", "a4", U32Type()),
+        ],
+        EventSeverity["DIAGNOSTIC"],
+        "%d %d %s %d",
+    )
+    dec = EventDecoder({101: temp})
+
+    id_bin = b"\x00\x00\x00\x65"
+    time_bin = b"\x00\x02\x00\x5b\x6b\x4c\xa5\x00\x01\xe2\x40"
+    arg_bin = b"\x00\x00\x00\x2a\x0a\x00\x02hi\x00\x00\x00\x07"
+
+    event_obj = dec.decode_api(id_bin + time_bin + arg_bin)
+    assert [arg.val for arg in event_obj.get_args()] == [42, 10, "hi", 7]
+    assert event_obj.time == TimeType(2, 0, 1533758629, 123456)
+    assert [arg_obj.val for _, _, arg_obj in temp.get_args()] == [None] * 4
+
+    # Truncated arguments are not decodable
+    assert dec.decode_args(arg_bin[:-1], 0, temp) is None
+
+
+def test_event_decoder_batch():
+    """
+    Tests the batch decoding of events into columns
+    """
+    temp_1 = EventTemplate(
+        101,
+        "test_ch",
+        "test_comp",
+        [("a1", "a1", U32Type()), ("a2", "a2", U8Type())],
+        EventSeverity["DIAGNOSTIC"],
+        "%d %d",
+    )
+    temp_2 = EventTemplate(
+        102,
+        "test_ch2",
+        "test_comp",
+        [("a1", "a1", StringType())],
+        EventSeverity["DIAGNOSTIC"],
+        "%s",
+    )
+    dec = EventDecoder({101: temp_1, 102: temp_2})
+    time_bin = TimeType(2, 0, 5, 500000).serialize()
+    msgs = [
+        b"\x00\x00\x00\x65" + time_bin + b"\x00\x00\x00\x2a\x0a",
+        b"\x00\x00\x00\x66" + time_bin + b"\x00\x02hi",
+        b"\x00\x00\x00\x65" + time_bin + b"\x00\x00\x00\x2b\x0b",
+    ]
+    batch = dec.decode_columns(msgs)
+    assert batch[101] == {
+        "id": [101, 101],
+        "time": [5.5, 5.5],
+        "args": [(42, 10), (43, 11)],
+    }
+    assert batch[102]["args"] == [("hi",)]
@@ -35,23 +35,17 @@ def test_distributor():
 
     (test_leftover, raw_msgs) = dist.parse_into_raw_msgs_api(data)
 
-    assert (
-        test_leftover == leftover_data
-    ), "expected leftover data to be %s, but found %s" % (
-        list(leftover_data),
-        list(test_leftover),
+    assert test_leftover == leftover_data, (
+        "expected leftover data to be %s, but found %s"
+        % (list(leftover_data), list(test_leftover))
     )
-    assert raw_msgs[0] == (
-        header_1 + data_1
-    ), "expected first raw_msg to be %s, but found %s" % (
-        list(header_1 + data_1),
-        list(raw_msgs[0]),
+    assert raw_msgs[0] == (header_1 + data_1), (
+        "expected first raw_msg to be %s, but found %s"
+        % (list(header_1 + data_1), list(raw_msgs[0]))
     )
-    assert raw_msgs[1] == (
-        header_2 + data_2
-    ), "expected second raw_msg to be %s, but found %s" % (
-        list(header_2 + data_2),
-        list(raw_msgs[1]),
+    assert raw_msgs[1] == (header_2 + data_2), (
+        "expected second raw_msg to be %s, but found %s"
+        % (list(header_2 + data_2), list(raw_msgs[1]))
     )
 
     (test_len_1, test_desc_1, test_msg_1) = dist.parse_raw_msg_api(raw_msgs[0])
@@ -74,10 +68,78 @@ def test_distributor():
         test_desc_2,
     )
     assert test_msg_1 == data_1, "expected 1st msg to be {} but found {}".format(
-        list(data_1),
-        list(test_msg_1),
+        list(data_1), list(test_msg_1)
     )
     assert test_msg_2 == data_2, "expected 2nd msg to be {} but found {}".format(
-        list(data_2),
-        list(test_msg_2),
+        list(data_2), list(test_msg_2)
     )
+
+
+class RecordingDecoder:
+    """ Decoder recording the messages it receives """
+
+    def __init__(self):
+        self.msgs = []
+
+    def data_callback(self, data):
+        self.msgs.append(data)
+
+
+def test_distributor_on_recv():
+    """
+    Tests messages are distributed by descriptor however the data is split across on_recv calls
+    """
+    config = config_manager.ConfigManager()
+    config.set("types", "msg_len", "U16")
+
+    telem = b"\x00\x08\x00\x00\x00\x01\xAA\xBB\xCC\xDD"
+    event = b"\x00\x06\x00\x00\x00\x02\xEE\xFF"
+    data = (telem + event) * 50
+
+    for chunk_size in [1, 3, 7, len(data)]:
+        dist = Distributor(config)
+        telem_decoder = RecordingDecoder()
+        event_decoder = RecordingDecoder()
+        dist.register("FW_PACKET_TELEM", telem_decoder)
+        dist.register("FW_PACKET_LOG", event_decoder)
+        for index in range(0, len(data), chunk_size):
+            dist.on_recv(data[index : index + chunk_size])
+        assert telem_decoder.msgs == [b"\xAA\xBB\xCC\xDD"] * 50
+        assert event_decoder.msgs == [b"\xEE\xFF"] * 50
+
+
+def test_distributor_unknown_descriptor():
+    """
+    Tests a message of an unknown descriptor ending the received data is dropped, and later messages
+    are still distributed
+    """
+    config = config_manager.ConfigManager()
+    config.set("types", "msg_len", "U16")
+
+    unknown = b"\x00\x06\x00\x00\x7F\xFF\x01\x02"
+    telem = b"\x00\x08\x00\x00\x00\x01\xAA\xBB\xCC\xDD"
+    dist = Distributor(config)
+    telem_decoder = RecordingDecoder()
+    dist.register("FW_PACKET_TELEM", telem_decoder)
+    dist.on_recv(telem + unknown)
+    dist.on_recv(telem)
+    assert telem_decoder.msgs == [b"\xAA\xBB\xCC\xDD"] * 2
+
+
+def test_distributor_key_frame():
+    """
+    Tests data preceding the key frame is discarded
+    """
+    config = config_manager.ConfigManager()
+    config.set("framing", "use_key", "true")
+    config.set("framing", "key_val", "0xA5A5")
+
+    dist = Distributor(config)
+    message = b"\x00\x00\x00\x06\x00\x00\x00\x01\x12\x34"
+    (leftover, raw_msgs) = dist.parse_into_raw_msgs_api(b"\x01\x02\xA5\xA5" + message)
+    assert leftover == b""
+    assert raw_msgs == [message]
+
+    (leftover, raw_msgs) = dist.parse_into_raw_msgs_api(b"\x01\x02\x03\xA5")
+    assert leftover == b"\xA5"
+    assert raw_msgs == []
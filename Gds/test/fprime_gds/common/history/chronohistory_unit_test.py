@@ -227,6 +227,27 @@ class HistoryTestCases(unittest.TestCase):
             correct_error = True
         assert correct_error, "The History should have raised a TypeError"
 
+    def test_out_of_order_and_time_lookup(self):
+        temp1 = ChTemplate(1, "Test Channel 1", "Chrono_Hist_Tester", I32Type())
+        seconds = [5, 1, 3, 3, 9, 0, 3, 7]
+        chList = [
+            ChData(I32Type(item), TimeType(seconds=second), temp1)
+            for item, second in enumerate(seconds)
+        ]
+        for item in chList:
+            self.cHistory.data_callback(item)
+        # Sorted by time, later arrivals of equal times before earlier ones
+        expected = [chList[i] for i in [5, 1, 6, 3, 2, 0, 7, 4]]
+        self.assert_lists_equal(expected, self.cHistory.retrieve())
+        self.assert_lists_equal(
+            expected[2:], self.cHistory.retrieve(TimeType(seconds=3))
+        )
+        self.assert_lists_equal(
+            expected[5:], self.cHistory.retrieve(TimeType(seconds=4))
+        )
+        self.cHistory.clear(TimeType(seconds=3))
+        self.assert_lists_equal(expected[2:], self.cHistory.retrieve())
+
 
 if __name__ == "__main__":
     unittest.main()
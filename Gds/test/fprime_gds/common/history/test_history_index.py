@@ -0,0 +1,92 @@
+"""
+Tests the history index and the indexed searches of the test API histories
+
+Created on Oct 16, 2026
+"""
+from fprime.common.models.serialize.numerical_types import I32Type
+from fprime.common.models.serialize.time_type import TimeType
+from fprime_gds.common.data_types.ch_data import ChData
+from fprime_gds.common.gds_cli import filtering_utils
+from fprime_gds.common.history.chrono import ChronologicalHistory
+from fprime_gds.common.history.index import HistoryIndex, plan, time_key
+from fprime_gds.common.history.test import TestHistory
+from fprime_gds.common.templates.ch_template import ChTemplate
+from fprime_gds.common.testing_fw import predicates
+
+CHANNELS = {
+    1: ChTemplate(1, "Voltage", "Power", I32Type()),
+    2: ChTemplate(2, "Current", "Power", I32Type()),
+    3: ChTemplate(3, "Rate", "Gyro", I32Type()),
+}
+
+
+def channels():
+    """ Channel readings of ids 1 to 3 received out of time order """
+    return [
+        ChData(I32Type(index), TimeType(2, 0, 100 + index, 0), CHANNELS[1 + index % 3])
+        for index in [5, 3, 9, 0, 7, 1, 8, 2, 6, 4]
+    ]
+
+
+def test_plan():
+    """ Tests the predicates the CLI and test API build are planned into lookups """
+    lookup = plan(filtering_utils.get_full_filter_predicate([1, 2], ["Gyro"], "Rate"))
+    assert lookup.ids == {1, 2}
+    assert lookup.components == {"Gyro"}
+    assert lookup.lower is None and lookup.upper is None
+
+    start = TimeType(2, 0, 103, 0)
+    lookup = plan(
+        predicates.satisfies_any(
+            [
+                predicates.telemetry_predicate(
+                    predicates.equal_to(1), time_pred=predicates.greater_than(start)
+                ),
+                predicates.event_predicate(
+                    predicates.is_a_member_of([2, 3]),
+                    time_pred=predicates.greater_than_or_equal_to(start),
+                ),
+            ]
+        )
+    )
+    assert lookup.ids == {1, 2, 3}
+    assert lookup.lower == time_key(start)
+    assert plan(predicates.satisfies_any([predicates.always_true()])).ids is None
+
+
+def test_candidates():
+    """ Tests candidates are the objects that may satisfy a predicate, in order """
+    index = HistoryIndex()
+    for order, obj in enumerate(channels()):
+        index.add(obj, order)
+    pred = filtering_utils.get_id_predicate([1])
+    assert [obj.get_val() for _, obj in index.candidates(pred)] == [3, 9, 0, 6]
+    pred = filtering_utils.time_to_data_predicate(
+        predicates.within_range(TimeType(2, 0, 102, 0), TimeType(2, 0, 104, 0))
+    )
+    assert [obj.get_val() for _, obj in index.candidates(pred)] == [3, 2, 4]
+    assert index.candidates(predicates.always_true()) is None
+    index.trim(5)
+    assert [obj.get_val() for _, obj in index.candidates(pred)] == [2, 4]
+    # Objects that cannot be indexed are candidates of every lookup
+    index.add("hello", 10)
+    assert [obj for _, obj in index.candidates(pred)][-1] == "hello"
+
+
+def test_retrieve_matching():
+    """ Tests indexed retrievals match predicate scans in both histories """
+    pred = filtering_utils.get_full_filter_predicate([], ["Power"], "")
+    start = filtering_utils.time_to_data_predicate(
+        predicates.greater_than(TimeType(2, 0, 103, 0))
+    )
+    # The first reading after the start is the first received, or the first in time order
+    for history, count in [(TestHistory(), 7), (ChronologicalHistory(), 4)]:
+        for obj in channels():
+            history.data_callback(obj)
+        expected = [obj for obj in history.retrieve(start) if pred(obj)]
+        assert history.retrieve_matching(pred, start) == expected
+        assert len(expected) == count
+        history.clear(start)
+        assert history.retrieve_matching(pred) == [
+            obj for obj in history.retrieve() if pred(obj)
+        ]
@@ -0,0 +1,68 @@
+"""
+Tests the latest channel value history
+
+Created on Oct 16, 2026
+"""
+import collections
+
+from fprime_gds.common.history.latest import LatestHistory
+
+Channel = collections.namedtuple("Channel", ["id", "val"])
+
+
+class Packet:
+    """ Packet of channels """
+
+    def __init__(self, chs):
+        self.chs = chs
+
+    def get_chs(self):
+        return self.chs
+
+
+def test_latest_values():
+    """ Tests channels and packets update the latest value of each channel """
+    history = LatestHistory()
+    history.data_callback(Channel(1, "a"))
+    history.data_callback(Channel(2, "b"))
+    history.data_callback(Packet([Channel(1, "c"), Channel(3, "d")]))
+    assert history.size() == 3
+    assert history.snapshot() == {
+        1: Channel(1, "c"),
+        2: Channel(2, "b"),
+        3: Channel(3, "d"),
+    }
+    assert history.snapshot([3, 4]) == {3: Channel(3, "d")}
+    assert history.get_latest(1) == Channel(1, "c")
+    assert history.get_latest(4) is None
+    assert history.get_recent(1) == [Channel(1, "c")]
+    # Values are retrieved in update order
+    assert history.retrieve() == [Channel(2, "b"), Channel(1, "c"), Channel(3, "d")]
+    history.clear()
+    assert history.size() == 0
+
+
+def test_sessions():
+    """ Tests sessions receive the whole state first, then only updated channels """
+    history = LatestHistory()
+    history.data_callback(Channel(1, "a"))
+    history.data_callback(Channel(2, "b"))
+    assert history.retrieve("a") == [Channel(1, "a"), Channel(2, "b")]
+    history.data_callback(Channel(2, "c"))
+    history.data_callback(Channel(2, "d"))
+    assert history.retrieve("a") == [Channel(2, "d")]
+    assert history.retrieve("a") == []
+    assert history.retrieve_new() == []
+    history.data_callback(Channel(1, "e"))
+    assert history.retrieve_new() == [Channel(1, "e")]
+    history.clear("a")
+    assert history.retrieve("a") == [Channel(2, "d"), Channel(1, "e")]
+
+
+def test_recent_values():
+    """ Tests the last values of each channel are kept up to the depth """
+    history = LatestHistory(depth=3)
+    for index in range(5):
+        history.data_callback(Channel(1, index))
+    assert history.get_recent(1) == [Channel(1, 2), Channel(1, 3), Channel(1, 4)]
+    assert history.get_recent(2) == []
@@ -0,0 +1,82 @@
+"""
+Tests the ring-buffer RAM history
+
+Created on Oct 16, 2026
+"""
+from fprime_gds.common.history.ram import RamHistory
+
+
+def fill(history, values):
+    """ Stores each value in the history """
+    for value in values:
+        history.data_callback(value)
+
+
+def test_sessions():
+    """ Tests session cursors, retrieve_new and clearing up to the earliest session """
+    history = RamHistory()
+    fill(history, range(5))
+    assert history.retrieve() == [0, 1, 2, 3, 4]
+    # New sessions start at the newest data
+    assert history.retrieve("a") == []
+    fill(history, range(5, 8))
+    assert history.retrieve("a") == [5, 6, 7]
+    assert history.retrieve("b") == []
+    fill(history, range(8, 10))
+    assert history.retrieve_new() == [8, 9]
+    assert history.retrieve("a") == [8, 9]
+    # Clearing drops what every session has seen
+    history.clear()
+    assert history.size() == 5
+    history.clear("a")
+    assert history.size() == 5
+    # Retrieving everything moves the cursor of the None session too
+    assert history.retrieve() == [5, 6, 7, 8, 9]
+    history.clear()
+    assert history.size() == 2
+    assert history.retrieve("b") == [8, 9]
+    assert history.get_stats()["cleared"] == 8
+
+
+def test_count_capacity():
+    """ Tests the oldest objects are evicted past the capacity and lagging sessions receive what remains """
+    history = RamHistory(max_count=4)
+    history.retrieve("slow")
+    history.retrieve("fast")
+    fill(history, range(3))
+    assert history.retrieve("fast") == [0, 1, 2]
+    fill(history, range(3, 10))
+    assert history.size() == 4
+    assert history.retrieve("slow") == [6, 7, 8, 9]
+    assert history.retrieve("fast") == [6, 7, 8, 9]
+    stats = history.get_stats()
+    assert stats["stored"] == 10
+    assert stats["evicted"] == 6
+    # The slow session had seen none of the evicted objects
+    assert stats["evicted_unread"] == 6
+    fill(history, range(10, 12))
+    assert history.get_stats()["evicted_unread"] == 6
+
+
+def test_byte_capacity():
+    """ Tests eviction by estimated size always keeps the newest object """
+    history = RamHistory(max_bytes=10, sizer=len)
+    fill(history, [b"aaaa", b"bbbb", b"cccc"])
+    assert history.retrieve() == [b"bbbb", b"cccc"]
+    assert history.get_stats()["bytes"] == 8
+    fill(history, [b"x" * 20])
+    assert history.retrieve() == [b"x" * 20]
+    assert history.get_stats()["evicted"] == 3
+
+
+def test_stale_session_cursors():
+    """ Tests cursors of polling sessions stay bounded while a stale session pins the earliest cursor """
+    history = RamHistory(max_count=100)
+    history.retrieve("stale")
+    history.retrieve("poller")
+    for index in range(1000):
+        history.data_callback(index)
+        assert history.retrieve("poller") == [index]
+        history.clear()
+    assert history.size() == 100
+    assert len(history._RamHistory__cursor_heap) < 100
@@ -0,0 +1,153 @@
+"""
+Tests the persistent SQLite history
+
+Created on Oct 16, 2026
+"""
+from fprime.common.models.serialize.numerical_types import I32Type, U32Type
+from fprime.common.models.serialize.serializable_type import SerializableType
+from fprime.common.models.serialize.string_type import StringType
+from fprime.common.models.serialize.time_type import TimeType
+from fprime_gds.common.data_types.ch_data import ChData
+from fprime_gds.common.data_types.cmd_data import CmdData
+from fprime_gds.common.data_types.event_data import EventData
+from fprime_gds.common.history.sqlite import SqliteHistory
+from fprime_gds.common.templates.ch_template import ChTemplate
+from fprime_gds.common.templates.cmd_template import CmdTemplate
+from fprime_gds.common.templates.event_template import EventTemplate
+from fprime_gds.common.utils.event_severity import EventSeverity
+
+CHANNELS = {
+    1: ChTemplate(1, "Voltage", "Power", I32Type()),
+    2: ChTemplate(2, "Current", "Power", I32Type()),
+    3: ChTemplate(3, "Rate", "Gyro", I32Type()),
+}
+
+
+def channel(ch_id, value, seconds):
+    """ Makes a channel reading """
+    return ChData(I32Type(value), TimeType(2, 0, seconds, 0), CHANNELS[ch_id])
+
+
+def values(objs):
+    """ Channel ids, values and seconds of channel readings """
+    return [(obj.id, obj.get_val(), obj.get_time().seconds) for obj in objs]
+
+
+def test_persistence_and_sessions(tmp_path):
+    """ Tests objects survive reopening the store and sessions see new objects """
+    path = str(tmp_path / "channels.sqlite3")
+    history = SqliteHistory(path, "channels", CHANNELS)
+    for index in range(10):
+        history.data_callback(channel(1 + index % 3, index, 100 + index))
+    assert history.size() == 10
+    assert history.retrieve("gui") == []
+    history.data_callback(channel(1, -5, 200))
+    assert values(history.retrieve("gui")) == [(1, -5, 200)]
+    history.clear()
+    assert history.size() == 11
+    history.close()
+
+    history = SqliteHistory(path, "channels", CHANNELS)
+    assert history.size() == 11
+    assert values(history.retrieve())[:2] == [(1, 0, 100), (2, 1, 101)]
+    history.data_callback(channel(2, 7, 300))
+    assert values(history.retrieve_new()) == [(2, 7, 300)]
+    history.close()
+
+
+def test_range_queries(tmp_path):
+    """ Tests queries by time, id and component """
+    history = SqliteHistory(str(tmp_path / "channels.sqlite3"), "channels", CHANNELS)
+    # Received out of time order
+    for index in [5, 3, 9, 0, 7, 1, 8, 2, 6, 4]:
+        history.data_callback(channel(1 + index % 3, index, 100 + index))
+    start, end = TimeType(2, 0, 102, 0), TimeType(2, 0, 106, 0)
+    assert [obj.get_val() for obj in history.query(start, end)] == [2, 3, 4, 5, 6]
+    assert [obj.get_val() for obj in history.query(ids=[1])] == [0, 3, 6, 9]
+    assert [obj.get_val() for obj in history.query(start, components=["Gyro"])] == [
+        2,
+        5,
+        8,
+    ]
+    assert [obj.get_val() for obj in history.query(end=end, limit=3)] == [0, 1, 2]
+    history.close()
+
+
+def test_events_and_commands(tmp_path):
+    """ Tests events and commands are rebuilt with their arguments """
+    event_temp = EventTemplate(
+        7,
+        "Booted",
+        "Health",
+        [("count", "count", U32Type()), ("name", "name", StringType())],
+        EventSeverity["ACTIVITY_HI"],
+        "%d %s",
+    )
+    events = SqliteHistory(str(tmp_path / "events.sqlite3"), "events", {7: event_temp})
+    events.data_callback(
+        EventData((U32Type(3), StringType("fsw")), TimeType(2, 0, 10, 500), event_temp)
+    )
+    (event,) = events.retrieve()
+    assert [arg.val for arg in event.get_args()] == [3, "fsw"]
+    assert event.get_time() == TimeType(2, 0, 10, 500)
+    events.close()
+
+    cmd_temp = CmdTemplate(0x10, "NO_OP", "Health", [("arg", "arg", U32Type())])
+    commands = SqliteHistory(
+        str(tmp_path / "commands.sqlite3"), "commands", {0x10: cmd_temp}
+    )
+    commands.data_callback(CmdData(("42",), cmd_temp))
+    # Objects of another kind are not stored
+    commands.data_callback(channel(1, 0, 0))
+    (command,) = commands.retrieve()
+    assert command.get_arg_vals() == ("42",)
+    assert commands.get_stats()["dropped"] == 1
+    commands.close()
+
+
+def test_serializable_command(tmp_path):
+    """ Tests commands of serializable arguments, which are never set from their text, are stored """
+    arg = SerializableType(
+        "Point", [("x", U32Type(), "%d", ""), ("y", U32Type(), "%d", "")]
+    )
+    cmd_temp = CmdTemplate(0x20, "MOVE", "Motion", [("point", "point", arg)])
+    commands = SqliteHistory(
+        str(tmp_path / "commands.sqlite3"), "commands", {0x20: cmd_temp}
+    )
+    commands.data_callback(CmdData(("1 2",), cmd_temp))
+    (command,) = commands.retrieve()
+    assert command.get_arg_vals() == ("1 2",)
+    assert commands.get_stats()["dropped"] == 0
+    commands.close()
+
+
+def test_retention(tmp_path):
+    """ Tests only the most recent records are kept once over the retention """
+    history = SqliteHistory(
+        str(tmp_path / "channels.sqlite3"), "channels", CHANNELS, max_records=100
+    )
+    SqliteHistory.BATCH_SIZE, original = 10, SqliteHistory.BATCH_SIZE
+    try:
+        for index in range(1000):
+            history.data_callback(channel(1, index, index))
+        history.flush()
+        assert history.size() <= 110
+        assert values(history.retrieve())[-1] == (1, 999, 999)
+    finally:
+        SqliteHistory.BATCH_SIZE = original
+        history.close()
+
+
+def test_paging(tmp_path):
+    """ Tests retrievals are bounded to a page, and sessions catch up over several retrievals """
+    history = SqliteHistory(str(tmp_path / "channels.sqlite3"), "channels", CHANNELS)
+    history.PAGE_SIZE = 4
+    history.retrieve("gui")
+    for index in range(10):
+        history.data_callback(channel(1, index, index))
+    assert [obj.get_val() for obj in history.retrieve()] == [6, 7, 8, 9]
+    assert [obj.get_val() for obj in history.retrieve("gui")] == [0, 1, 2, 3]
+    assert [obj.get_val() for obj in history.retrieve("gui")] == [4, 5, 6, 7]
+    assert [obj.get_val() for obj in history.retrieve("gui")] == [8, 9]
+    assert history.retrieve("gui") == []
+    history.close()
@@ -0,0 +1,222 @@
+"""
+Tests the routing and overflow policies of the asyncio tcp server
+
+Created on Oct 16, 2026
+"""
+import asyncio
+import os
+import socket
+import struct
+
+import pytest
+
+from fprime_gds.common.communication.shared_ring import (
+    SharedRingReader,
+    SharedRingWriter,
+    shared_memory,
+)
+from fprime_gds.executables.tcpserver import QUIT_MARKER, TcpServer
+
+
+def run(coroutine):
+    """ Runs a coroutine on a fresh event loop """
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(asyncio.wait_for(coroutine, 10))
+    finally:
+        loop.close()
+
+
+async def connect(port, name, receive_buffer=None):
+    """ Connects and registers a client """
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    if receive_buffer is not None:
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, receive_buffer)
+    sock.connect(("127.0.0.1", port))
+    reader, writer = await asyncio.open_connection(sock=sock)
+    writer.write(b"Register " + name + b"\n")
+    await writer.drain()
+    return reader, writer
+
+
+async def wait_for_clients(server, count):
+    """ Waits until count clients are registered """
+    while len(server.clients) < count:
+        await asyncio.sleep(0.01)
+
+
+def gui_message(payload):
+    """ Message sent by the comm layer to the GUI clients """
+    return b"A5A5 GUI " + struct.pack(">I", len(payload)) + payload
+
+
+def test_routing():
+    """ Tests packets are routed to every client of the destination and List/Quit are answered """
+
+    async def scenario():
+        server = TcpServer()
+        port = await server.start("127.0.0.1", 0)
+        fsw_reader, fsw_writer = await connect(port, b"FSW")
+        guis = [await connect(port, b"GUI") for _ in range(20)]
+        await wait_for_clients(server, 21)
+        assert sorted(server.clients) == sorted(
+            [b"FSW_0"] + [b"GUI_%d" % index for index in range(20)]
+        )
+
+        fsw_writer.write(gui_message(b"telemetry") * 3)
+        command = b"\x00\x00\x00\x00" + struct.pack(">I", 3) + b"cmd"
+        guis[0][1].write(b"A5A5 FSW " + command)
+        for reader, _ in guis:
+            expected = (struct.pack(">I", 9) + b"telemetry") * 3
+            assert await reader.readexactly(len(expected)) == expected
+        assert await fsw_reader.readexactly(len(command)) == command
+
+        fsw_writer.write(b"List\n")
+        listed = []
+        for _ in range(21):
+            size = struct.unpack("i", await fsw_reader.readexactly(4))[0]
+            listed.append(await fsw_reader.readexactly(size))
+        assert listed == [b"List " + name for name in server.clients]
+
+        fsw_writer.write(b"Quit\n")
+        assert await fsw_reader.readexactly(4) == QUIT_MARKER
+        for _, writer in guis + [(fsw_reader, fsw_writer)]:
+            writer.close()
+        await server.wait_closed()
+
+    run(scenario())
+
+
+def test_same_name_clients():
+    """ Tests clients of no destination registering under the same name are kept apart """
+
+    async def scenario():
+        server = TcpServer()
+        port = await server.start("127.0.0.1", 0)
+        _, first = await connect(port, b"SHM")
+        _, second = await connect(port, b"SHM")
+        await wait_for_clients(server, 2)
+        assert sorted(server.clients) == [b"SHM_0", b"SHM_1"]
+        kept = server.clients[b"SHM_1"]
+        first.close()
+        while len(server.clients) > 1:
+            await asyncio.sleep(0.01)
+        assert list(server.clients.values()) == [kept]
+        server.shutdown()
+        second.close()
+        await server.wait_closed()
+
+    run(scenario())
+
+
+def test_fsw_lossless():
+    """ Tests a stalled FSW client loses no uplinked data, even when registered with a lossy policy """
+
+    async def scenario():
+        server = TcpServer(queue_size=4, policy="drop-oldest")
+        port = await server.start("127.0.0.1", 0)
+        fsw_reader, fsw_writer = await connect(
+            port, b"FSW drop-oldest", receive_buffer=4096
+        )
+        await wait_for_clients(server, 1)
+        _, gui_writer = await connect(port, b"GUI")
+        await wait_for_clients(server, 2)
+        fsw = server.clients[b"FSW_0"]
+        assert fsw.policy == "block"
+
+        payload = b"x" * 65536
+        command = b"\x00\x00\x00\x00" + struct.pack(">I", len(payload)) + payload
+        for _ in range(64):
+            gui_writer.write(b"A5A5 FSW " + command)
+        # Let the queue fill while FSW does not read
+        while len(fsw.queue) < 4:
+            await asyncio.sleep(0.01)
+        for _ in range(64):
+            assert await fsw_reader.readexactly(len(command)) == command
+        assert fsw.dropped == 0
+        server.shutdown()
+        for writer in [fsw_writer, gui_writer]:
+            writer.close()
+        await server.wait_closed()
+
+    run(scenario())
+
+
+@pytest.mark.parametrize("policy", ["drop-oldest", "drop-newest", "disconnect"])
+def test_stalled_client(policy):
+    """ Tests a stalled client registered with its own policy does not delay delivery to other clients """
+
+    async def scenario():
+        server = TcpServer(queue_size=4, policy="block")
+        port = await server.start("127.0.0.1", 0)
+        fsw_reader, fsw_writer = await connect(port, b"FSW")
+        await wait_for_clients(server, 1)
+        _, stalled_writer = await connect(
+            port, b"GUI " + policy.encode(), receive_buffer=4096
+        )
+        await wait_for_clients(server, 2)
+        reader, writer = await connect(port, b"GUI")
+        await wait_for_clients(server, 3)
+        stalled = server.clients[b"GUI_0"]
+
+        payload = b"x" * 65536
+        expected = struct.pack(">I", len(payload)) + payload
+        for _ in range(256):
+            fsw_writer.write(gui_message(payload))
+            assert await reader.readexactly(len(expected)) == expected
+        if policy == "disconnect":
+            assert stalled.closed
+            assert b"GUI_0" not in server.clients
+        else:
+            assert stalled.dropped > 0
+            assert len(stalled.queue) <= 4
+        assert server.clients[b"GUI_1"].policy == "block"
+        assert server.clients[b"GUI_1"].bytes_sent >= 256 * len(expected)
+
+        fsw_writer.write(b"Stats\n")
+        stats = []
+        for _ in range(len(server.clients)):
+            size = struct.unpack("i", await fsw_reader.readexactly(4))[0]
+            stats.append(await fsw_reader.readexactly(size))
+        assert stats[0].startswith(b"Stats FSW_0 policy=block depth=0/4 drops=0")
+        if policy != "disconnect":
+            assert stats[1].startswith(b"Stats GUI_0 policy=" + policy.encode())
+            assert b"drops=%d " % stalled.dropped in stats[1]
+        assert b"latency_ms=(last=" in stats[-1]
+        server.shutdown()
+        for client_writer in [fsw_writer, stalled_writer, writer]:
+            client_writer.close()
+        await server.wait_closed()
+
+    run(scenario())
+
+
+@pytest.mark.skipif(shared_memory is None, reason="shared memory requires python 3.8+")
+def test_shared_memory():
+    """ Tests data routed to GUI clients is written once into the shared-memory ring """
+    ring_name = "fprime_test_server_ring_{}".format(os.getpid())
+    writer = SharedRingWriter(ring_name, 4096)
+    reader = SharedRingReader(ring_name)
+
+    async def scenario():
+        server = TcpServer(shared_ring=writer)
+        port = await server.start("127.0.0.1", 0)
+        _, fsw_writer = await connect(port, b"FSW")
+        await wait_for_clients(server, 1)
+        fsw_writer.write(gui_message(b"telemetry") * 2)
+        msgs = []
+        while len(msgs) < 2:
+            msgs.extend(reader.read())
+            await asyncio.sleep(0.01)
+        assert msgs == [struct.pack(">I", 9) + b"telemetry"] * 2
+        server.shutdown()
+        fsw_writer.close()
+        await server.wait_closed()
+
+    try:
+        run(scenario())
+        assert reader.read() == []
+        assert writer.committed == 2 * (4 + 4 + 9)
+    finally:
+        reader.close()
+        writer.close()